@@ -7,17 +7,28 @@ Deploy with:
   agentcore configure -e handler.py
   agentcore deploy
   agentcore invoke '{"prompt": "Should I deploy to us-east-1?"}'
+  agentcore invoke '{"regions": ["us-east-1", "eu-west-1"]}'   # precomputed readiness only
 
 Cleanup with:
   agentcore destroy
 """
 
+import threading
+
 from bedrock_agentcore import BedrockAgentCoreApp
 from strands import Agent
 from strands.models import BedrockModel
 
-from src.tools.weather_tool import get_weather_forecast
+from src.ipam import UtilizationRecorder, make_exhaustion_tool
+from src.readiness import ReadinessScheduler, load_regions, make_readiness_tool
+from src.tools.weather_tool import forecast_window_risk, get_weather_forecast, get_weather_risk
 from src.tools.aws_status_tool import check_aws_status
+from src.tools.incident_store import get_incident_history
+from src.tools.regions import get_region
+from src.tools.deployment_window_tool import plan_deployment_window, register_capacity_source
+from src.tools.ipam_tool import (
+    check_subnet_capacity, find_free_block, find_subnets, plan_subnet_capacity, sample_capacity
+)
 
 # Initialize AgentCore app
 app = BedrockAgentCoreApp()
@@ -28,6 +39,16 @@ make informed deployment decisions by analyzing multiple factors:
 
 1. AWS Service Health - Check for any ongoing incidents
 2. Weather Conditions - Severe weather can affect datacenters
+3. IP Capacity - Enough free addresses in the region's subnets
+
+Start with check_region_readiness, which returns all three from a snapshot
+refreshed in the background; call the individual tools only for regions or
+cities it does not cover. For "when should I deploy" questions, call
+plan_deployment_window once with every region involved. When a deployment
+needs a CIDR range (e.g. a /26) rather than individual IPs, confirm it with
+find_free_block. For rollouts across several regions, check IP capacity for
+all of them with one plan_subnet_capacity call. If a region's ip_forecast
+warns that IPs run out soon, mention it even when capacity is GO today.
 
 When asked about deployments:
 - Always check relevant AWS regions for health status
@@ -38,6 +59,38 @@ When asked about deployments:
 Be concise but thorough. Engineers need quick, actionable information.
 """
 
+# IP utilization history per region, with exhaustion forecasts refit after
+# every sample (readings from IPAM only, not mock or stale data)
+ipam_history = UtilizationRecorder.from_env(
+    load_regions(), lambda regions: sample_capacity(regions, with_source=True)
+)
+
+# Background precomputation of AWS status, weather risk and IP headroom per
+# region, so requests read a snapshot instead of calling every upstream
+readiness = ReadinessScheduler.from_env({
+    "aws_status": lambda region: check_aws_status(region),
+    "weather": lambda region: forecast_window_risk(region, window_hours=6),
+    "ip_capacity": lambda region: check_subnet_capacity(region),
+    "ip_forecast": lambda region: ipam_history.forecast(region),
+})
+
+_background_started = False
+_background_lock = threading.Lock()
+
+
+def start_background():
+    """Start the history recorder and readiness scheduler threads (once)."""
+    global _background_started
+    with _background_lock:
+        if not _background_started:
+            ipam_history.start()
+            readiness.start()
+            _background_started = True
+
+
+# The window planner weighs IP headroom from the IPAM tool
+register_capacity_source(check_subnet_capacity)
+
 # Create model with explicit config
 model = BedrockModel(
     model_id="us.anthropic.claude-3-5-sonnet-20241022-v2:0",
@@ -48,17 +101,50 @@ model = BedrockModel(
 agent = Agent(
     model=model,
     system_prompt=SYSTEM_PROMPT,
-    tools=[get_weather_forecast, check_aws_status]
+    tools=[make_readiness_tool(readiness), get_weather_forecast, get_weather_risk, check_aws_status,
+           get_incident_history, plan_deployment_window, plan_subnet_capacity, find_subnets,
+           find_free_block, make_exhaustion_tool(ipam_history)]
 )
 
 
+def read_readiness(regions) -> dict:
+    """
+    Snapshot entries for a list of region codes, without probing anything:
+    regions outside READINESS_REGIONS are reported as not monitored and
+    expired entries as unavailable until the next background refresh.
+    """
+    if not isinstance(regions, list) or not all(isinstance(code, str) for code in regions):
+        return {"error": '"regions" must be a list of region codes, e.g. ["us-east-1", "eu-west-1"]'}
+    result = {}
+    for code in regions:
+        region = get_region(code)
+        if region is None:
+            result[code] = {"region": code, "status": "unknown_region",
+                            "message": f"{code!r} is not an AWS region code"}
+            continue
+        entry = readiness.get(region.code, refresh=False)
+        if entry is None:
+            entry = {"region": region.code, "status": "unavailable",
+                     "message": "No readiness data newer than READINESS_MAX_AGE; "
+                                "the next background refresh will provide it"}
+        result[code] = entry
+    return {"readiness": result}
+
+
 @app.entrypoint
 def invoke(payload):
     """AgentCore invocation entry point."""
+    # Normally started at boot (__main__); covers runtimes that only import this module
+    start_background()
+    # Fast path: {"regions": [...]} without a prompt returns the snapshot, no model call
+    if "regions" in payload and "prompt" not in payload:
+        return read_readiness(payload["regions"])
+
     user_message = payload.get("prompt", "Hello, what can you help me with?")
     result = agent(user_message)
     return {"result": result.message}
 
 
 if __name__ == "__main__":
+    start_background()
     app.run()
@@ -14,86 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 # PART 1: Import boto3
 import boto3
 
-
-def create_cognito_user_pool(pool_name, region="us-west-2"):
-    """Create Cognito User Pool for OAuth authentication."""
-    cognito = boto3.client('cognito-idp', region_name=region)
-
-    # Step 1: Create User Pool
-    print(f"Creating User Pool: {pool_name}...")
-    pool_response = cognito.create_user_pool(
-        PoolName=pool_name,
-        AutoVerifiedAttributes=['email'],
-        MfaConfiguration='OFF',
-        AdminCreateUserConfig={
-            'AllowAdminCreateUserOnly': True  # No self-signup
-        }
-    )
-    pool_id = pool_response['UserPool']['Id']
-    print(f"  ✓ User Pool created: {pool_id}")
-
-    return cognito, pool_id
-
-
-def create_cognito_domain(cognito, pool_id, domain_prefix):
-    """Create domain for OAuth endpoints."""
-    print(f"Creating domain: {domain_prefix}...")
-
-    cognito.create_user_pool_domain(
-        Domain=domain_prefix,
-        UserPoolId=pool_id
-    )
-
-    print(f"  ✓ Domain created: {domain_prefix}")
-    return domain_prefix
-
-
-def create_resource_server(cognito, pool_id, identifier="agentcore-gateway"):
-    """Create Resource Server with scopes."""
-    print(f"Creating Resource Server: {identifier}...")
-
-    cognito.create_resource_server(
-        UserPoolId=pool_id,
-        Identifier=identifier,
-        Name="AgentCore Gateway API",
-        Scopes=[
-            {
-                'ScopeName': 'invoke',
-                'ScopeDescription': 'Invoke tools via Gateway'
-            },
-            {
-                'ScopeName': 'read',
-                'ScopeDescription': 'Read tool information'
-            }
-        ]
-    )
-
-    print(f"  ✓ Resource Server created with scopes: invoke, read")
-    return identifier
-
-
-def create_app_client(cognito, pool_id, client_name, resource_server_id):
-    """Create App Client for machine-to-machine auth."""
-    print(f"Creating App Client: {client_name}...")
-
-    response = cognito.create_user_pool_client(
-        UserPoolId=pool_id,
-        ClientName=client_name,
-        GenerateSecret=True,  # Required for client_credentials flow
-        AllowedOAuthFlows=['client_credentials'],  # M2M flow
-        AllowedOAuthScopes=[
-            f'{resource_server_id}/invoke',
-            f'{resource_server_id}/read'
-        ],
-        AllowedOAuthFlowsUserPoolClient=True
-    )
-
-    client_id = response['UserPoolClient']['ClientId']
-    client_secret = response['UserPoolClient']['ClientSecret']
-
-    print(f"  ✓ App Client created: {client_id[:20]}...")
-
-    return client_id, client_secret
+from src.provisioning import provision_cognito
 
 
 def get_access_token(domain, region, client_id, client_secret):
@@ -188,66 +109,31 @@ def main():
     region = "us-west-2"
     pool_name = "DevOpsAgentPool"
 
-    # Generate unique domain prefix
+    # Generate unique domain prefix (only used if the pool has no domain yet)
     domain_prefix = f"devops-agent-{int(time.time()) % 100000}"
 
-    # Check if already configured
+    # Reuse ids from a previous run, if any
     try:
-        config = load_cognito_config()
-        print(f"\nFound existing configuration!")
-        print(f"Pool ID: {config['pool_id']}")
-        print(f"Domain: {config['domain']}")
-        use_existing = input("\nUse existing config? (y/n): ").strip().lower()
-        if use_existing == 'y':
-            print("\n[Part 6] Testing token generation...")
-            access_token = get_access_token(
-                config['domain'],
-                config['region'],
-                config['client_id'],
-                config['client_secret']
-            )
-            if access_token:
-                print(f"\n✓ Token obtained successfully!")
-                print(f"  Token preview: {access_token[:50]}...")
-                return True
-            return False
-        else:
-            print("\nCleaning up old configuration...")
-            cleanup_cognito()
+        existing = load_cognito_config()
+        print(f"\nFound existing configuration for pool {existing['pool_id']}")
     except (FileNotFoundError, json.JSONDecodeError):
-        pass
+        existing = None
 
-    # Part 1: Create User Pool
-    print("\n[Part 1] Creating Cognito User Pool...")
-    cognito, pool_id = create_cognito_user_pool(pool_name, region)
-
-    # Part 2: Create Domain
-    print("\n[Part 2] Creating OAuth Domain...")
-    domain = create_cognito_domain(cognito, pool_id, domain_prefix)
-
-    # Part 3: Create Resource Server
-    print("\n[Part 3] Creating Resource Server...")
-    resource_server_id = create_resource_server(cognito, pool_id)
-
-    # Part 4: Create App Client
-    print("\n[Part 4] Creating App Client...")
-    client_id, client_secret = create_app_client(
-        cognito, pool_id, "DevOpsAgentClient", resource_server_id
+    # Parts 1-4: Reconcile User Pool -> (Domain, Resource Server -> App Client).
+    # Existing resources are reused, so a rerun is a no-op.
+    print("\n[Parts 1-4] Provisioning Cognito resources...")
+    config = provision_cognito(
+        region, pool_name, "DevOpsAgentClient", domain_prefix, existing=existing
     )
-
-    # Save configuration
-    config = {
-        'region': region,
-        'pool_id': pool_id,
-        'pool_name': pool_name,
-        'domain': domain_prefix,
-        'resource_server_id': resource_server_id,
-        'client_id': client_id,
-        'client_secret': client_secret,
-        'token_url': f"https://{domain_prefix}.auth.{region}.amazoncognito.com/oauth2/token"
-    }
+    created = config.pop("created")
+    print(f"  Created: {', '.join(created) if created else 'nothing (already up to date)'}")
     save_cognito_config(config)
 
+    pool_id = config['pool_id']
+    domain_prefix = config['domain']
+    client_id = config['client_id']
+    client_secret = config['client_secret']
+
     # Part 5: Test token generation
     print("\n[Part 5] Testing OAuth Token Generation...")
     access_token = get_access_token(domain_prefix, region, client_id, client_secret)
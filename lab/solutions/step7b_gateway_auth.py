@@ -14,6 +14,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 # PART 1: Import boto3
 import boto3
 
+from src.provisioning.tags import LAB_TAGS
+
 
 def load_cognito_config(filename="cognito_config.json"):
     """Load Cognito configuration from Step 7a."""
@@ -52,7 +54,9 @@ def create_gateway_with_cognito(cognito_config, gateway_name="DevOpsGateway"):
                 'allowedAudiences': [cognito_config['client_id']],
                 'allowedClients': [cognito_config['client_id']]
             }
-        }
+        },
+        # Lets `python -m src.provisioning.teardown` find and delete it
+        tags=LAB_TAGS
     )
 
     gateway_id = response['gatewayId']
@@ -158,6 +162,21 @@ def create_authenticated_agent(gateway_url, access_token, region="us-west-2"):
     return mcp_client, model
 
 
+def create_gateway_session_pool(gateway_url, cognito_config, size=2):
+    """Create a pooled, long-lived Gateway connection for serving.
+
+    Unlike create_authenticated_agent, the pool keeps its MCP sessions open,
+    refreshes the Bearer token before it expires and reconnects on failure.
+    Build one pool at startup and create agents per request with:
+
+        Agent(model=model, tools=pool.list_tools())
+    """
+    from src.mcp_clients import CognitoTokenProvider, GatewaySessionPool
+
+    token_provider = CognitoTokenProvider.from_config(cognito_config)
+    return GatewaySessionPool(gateway_url, token_provider, size=size).start()
+
+
 def save_gateway_config(gateway_info, filename="gateway_config.json"):
     """Save Gateway configuration."""
     with open(filename, "w") as f:
@@ -247,8 +266,11 @@ def main():
     # Part 5: Test the connection
     print("\n[Part 5] Testing authenticated Gateway access...")
     try:
+        from src.mcp_clients import http_server_key, tool_catalog
+        # Subscribe to tool list changes before the session starts
+        tool_catalog.watch(mcp_client, http_server_key(gateway_url))
         with mcp_client:
-            tools = mcp_client.list_tools_sync()
+            tools = tool_catalog.get_tools(mcp_client, http_server_key(gateway_url))
             print(f"  ✓ Connected to Gateway!")
             print(f"  ✓ Available tools: {[t.tool_name for t in tools]}")
 
@@ -273,6 +295,14 @@ def main():
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "--cleanup":
         cleanup_gateway()
+    elif len(sys.argv) > 2 and sys.argv[1] == "--bulk":
+        # Non-interactive: one App Client + Gateway per tenant in the manifest
+        from src.provisioning.bulk import main as bulk_main
+        sys.exit(0 if bulk_main(sys.argv[2:]) else 1)
+    elif len(sys.argv) > 1 and sys.argv[1] == "--teardown":
+        # Delete every tagged lab (or --tenant) Gateway, target and Cognito resource
+        from src.provisioning.teardown import main as teardown_main
+        sys.exit(0 if teardown_main(sys.argv[2:]) else 1)
     else:
         success = main()
         sys.exit(0 if success else 1)
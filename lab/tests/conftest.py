@@ -0,0 +1,25 @@
+"""
+Shared pytest setup for lab/tests: puts the repository root on sys.path so
+tests import `src.` and `lab.` modules, and provides common fixtures.
+"""
+
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture
+def mock_ipam(monkeypatch):
+    """No IPAM_API_KEY: IPAM tools answer from their built-in mock data."""
+    monkeypatch.delenv("IPAM_API_KEY", raising=False)
+
+
+@pytest.fixture
+def state_dir(tmp_path) -> str:
+    """A fresh directory (as a str path) for stores that persist to disk."""
+    return str(tmp_path)
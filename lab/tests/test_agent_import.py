@@ -0,0 +1,34 @@
+"""
+Test: Agent Entry Point Imports
+===============================
+src/agent.py runs with src/ on sys.path and imports `tools`, `mcp_clients`
+and `config` as top-level packages; everything it pulls in must import
+that way as well as under `src.`.
+"""
+
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "src")
+
+
+def _import_from_src(code: str, **env):
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC, env=dict(os.environ, PYTHONPATH=SRC, **env),
+        capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_agent_imports_as_script():
+    _import_from_src("import agent")
+
+
+def test_agent_imports_with_native_fetch():
+    _import_from_src("import agent; assert agent.fetch_url", FETCH_TOOL="native")
+
+
+def test_ipam_tool_imports_as_top_level_tools():
+    _import_from_src("import tools.ipam_tool")
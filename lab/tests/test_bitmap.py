@@ -0,0 +1,128 @@
+"""
+Test: Subnet Free-Space Bitmap
+==============================
+Run: python -m pytest lab/tests/test_bitmap.py
+"""
+
+import ipaddress
+import random
+from unittest.mock import patch
+
+from src.ipam import FreeSpaceMap
+
+
+def _random_map(seed: int, network: str = "10.0.0.0/24", share: float = 0.4):
+    rng = random.Random(seed)
+    net = ipaddress.ip_network(network)
+    allocated = [str(address) for address in net if rng.random() < share]
+    return FreeSpaceMap(net, allocated, reserve_edges=False), set(allocated)
+
+
+def _free_aligned(net, allocated: set, prefixlen: int) -> list:
+    """Brute force: every aligned block of the prefix length with no allocated address."""
+    return [
+        block for block in net.subnets(new_prefix=prefixlen)
+        if not any(str(address) in allocated for address in block)
+    ]
+
+
+def test_aligned_blocks_match_brute_force():
+    for seed in range(5):
+        free_map, allocated = _random_map(seed, share=0.1)
+        for prefixlen in (32, 30, 29, 28):
+            expected = _free_aligned(free_map.network, allocated, prefixlen)
+            assert free_map.count_blocks(prefixlen) == len(expected)
+            block = free_map.best_fit(prefixlen)
+            assert (block is None) == (not expected)
+            if block is not None:
+                assert block in expected
+
+
+def test_best_fit_keeps_larger_blocks_intact():
+    # Free: one lone /30 at .4 and the whole upper half (a /25)
+    allocated = [f"10.0.0.{i}" for i in range(128) if not 4 <= i < 8]
+    free_map = FreeSpaceMap("10.0.0.0/24", allocated)
+    assert free_map.best_fit(30) == ipaddress.ip_network("10.0.0.4/30")
+    assert free_map.best_fit(26) == ipaddress.ip_network("10.0.0.128/26")
+    assert free_map.best_fit(24) is None
+
+
+def test_free_blocks_are_maximal_and_largest_first():
+    allocated = [f"10.0.0.{i}" for i in range(128) if not 4 <= i < 8]
+    free_map = FreeSpaceMap("10.0.0.0/24", allocated)
+    blocks = free_map.free_blocks(limit=5)
+    assert blocks[0] == ipaddress.ip_network("10.0.0.128/26")   # .255 is reserved
+    assert ipaddress.ip_network("10.0.0.4/30") in blocks
+    assert all(not a.overlaps(b) for i, a in enumerate(blocks) for b in blocks[i + 1:])
+
+
+def test_edges_are_reserved():
+    free_map = FreeSpaceMap("10.0.0.0/30")
+    assert free_map.free_count() == 2
+    assert free_map.count_blocks(31) == 0
+
+
+def test_out_of_range_prefixes():
+    free_map = FreeSpaceMap("10.0.0.0/24")
+    assert free_map.count_blocks(20) == 0
+    assert free_map.best_fit(20) is None
+    assert free_map.best_fit(33) is None
+
+
+def test_too_large_subnet_is_rejected():
+    try:
+        FreeSpaceMap("10.0.0.0/8")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("built a bitmap for a /8")
+
+
+def test_find_free_block_rejects_impossible_prefixes(mock_ipam):
+    from src.tools.ipam_tool import find_free_block
+
+    for prefix_length in (0, 33):
+        assert "between 1 and 32" in find_free_block("us-east-1", prefix_length)["message"]
+    # The mock us-east-1 subnet is a /23
+    result = find_free_block("us-east-1", 20)
+    assert result["status"] == "error" and "/23" in result["message"]
+    assert find_free_block("us-east-1", 30)["prefix_length"] == 30
+
+
+
+class _FakeIPAM:
+    """Subnets (network -> allocated addresses) served like InfobloxClient."""
+
+    max_workers = 2
+
+    def __init__(self, subnets: dict):
+        self.subnets = subnets
+
+    def iter_subnets(self, filter=None, fields=None):
+        for network, allocated in self.subnets.items():
+            net = ipaddress.ip_network(network)
+            yield {"id": network, "address": str(net.network_address), "cidr": net.prefixlen,
+                   "utilization": {"total": net.num_addresses, "used": len(allocated),
+                                   "free": net.num_addresses - len(allocated)}}
+
+    def iter_addresses(self, subnet_id):
+        yield from self.subnets[subnet_id]
+
+
+def test_find_free_block_prefers_the_tightest_fit_across_subnets():
+    from src.tools import ipam_tool
+
+    def allocated_except(network, free):
+        return [str(a) for a in ipaddress.ip_network(network) if a not in ipaddress.ip_network(free)]
+
+    fake = _FakeIPAM({
+        # Emptiest subnet, but its only free run is a /26
+        "10.0.0.0/24": allocated_except("10.0.0.0/24", "10.0.0.64/26"),
+        # Fuller subnet with a free /28 hole: the exact fit
+        "10.1.0.0/24": allocated_except("10.1.0.0/24", "10.1.0.16/28"),
+    })
+    with patch.object(ipam_tool, "get_client", return_value=fake), \
+            patch.object(ipam_tool, "get_subnet_index", return_value=None):
+        result = ipam_tool.find_free_block("us-east-1", 28)
+    assert result["block"] == "10.1.0.16/28"
+    assert [c["fit_region"] for c in result["candidates"]] == ["10.1.0.16/28", "10.0.0.64/26"]
@@ -0,0 +1,112 @@
+"""
+Test: Circuit Breakers
+======================
+Run: python -m pytest lab/tests/test_breaker.py
+"""
+
+import time
+
+import httpx
+import requests
+
+from src.ipam import IPAMError
+from src.tools.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+def _fail():
+    raise requests.ConnectionError("connection refused")
+
+
+def _breaker(**kwargs):
+    settings = {"window": 4, "min_calls": 4, "failure_rate": 0.5, "open_seconds": 0.05}
+    settings.update(kwargs)
+    return CircuitBreaker("upstream", **settings)
+
+
+def _trip(breaker):
+    for _ in range(breaker.min_calls):
+        try:
+            breaker.call("key", _fail)
+        except requests.RequestException:
+            pass
+
+
+def test_failures_trip_the_breaker():
+    breaker = _breaker()
+    breaker.call("key", lambda: "ok")
+    breaker.call("key", lambda: "ok")
+    assert breaker.state == CLOSED
+    _trip(breaker)
+    assert breaker.state == OPEN
+
+
+def test_slow_calls_trip_the_breaker():
+    breaker = _breaker(slow_call_seconds=0.01)
+    for _ in range(4):
+        breaker.call("key", time.sleep, 0.02)
+    assert breaker.state == OPEN
+
+
+def test_open_breaker_fails_fast():
+    breaker = _breaker(open_seconds=60)
+    _trip(breaker)
+    called = []
+    try:
+        breaker.call("other", called.append, 1)
+    except CircuitOpenError:
+        pass
+    else:
+        raise AssertionError("open breaker let a call through")
+    assert called == []
+
+
+def test_half_open_probe_closes_or_reopens():
+    breaker = _breaker()
+    _trip(breaker)
+    time.sleep(0.06)
+    try:
+        breaker.call("key", _fail)
+    except requests.RequestException:
+        pass
+    assert breaker.state == OPEN
+
+    time.sleep(0.06)
+    assert breaker.call("key", lambda: "ok") == ("ok", None)
+    assert breaker.state == CLOSED
+
+
+def test_only_one_probe_while_half_open():
+    breaker = _breaker()
+    _trip(breaker)
+    time.sleep(0.06)
+    assert breaker._admit()
+    assert breaker.state == HALF_OPEN
+    assert not breaker._admit()
+
+
+def test_last_good_result_served_when_open():
+    breaker = _breaker(open_seconds=60)
+    breaker.call("key", lambda: {"temp": 20})
+    _trip(breaker)
+    value, stale = breaker.call("key", _fail)
+    assert value == {"temp": 20}
+    assert stale["stale"] is True and "upstream" in stale["stale_reason"]
+
+
+def test_client_errors_do_not_open_the_breaker():
+    request = httpx.Request("GET", "https://ipam.example/api/ddi/v1/ipam/subnet")
+    response = httpx.Response(403, request=request, text="forbidden")
+
+    def forbidden():
+        raise IPAMError("403 error from IPAM for /ipam/subnet: forbidden", response=response)
+
+    breaker = _breaker()
+    for _ in range(8):
+        try:
+            breaker.call("key", forbidden)
+        except IPAMError:
+            pass
+        else:
+            raise AssertionError("a 403 was not raised to the caller")
+    assert breaker.state == CLOSED
+    assert breaker.status()["failure_share"] == 0.0
@@ -0,0 +1,125 @@
+"""
+Test: AWS Status Feed Processor
+===============================
+Run: python -m pytest lab/tests/test_feed_processor.py
+"""
+
+from unittest.mock import patch
+
+import requests
+
+from src.tools import aws_status_tool
+from src.tools.aws_status_tool import FeedProcessor
+from src.tools.breaker import CircuitBreaker
+
+
+def _feed(*items):
+    body = "".join(
+        f"<item><guid>https://status.aws.amazon.com/#{guid}</guid><title>{title}</title>"
+        f"<description>{title}</description><pubDate>{date}</pubDate></item>"
+        for guid, title, date in items
+    )
+    return f"<rss><channel><title>AWS</title>{body}</channel></rss>".encode()
+
+
+class _Response:
+    def __init__(self, body: bytes = b"", status_code: int = 200, etag: str = None):
+        self.body = body
+        self.status_code = status_code
+        self.headers = {"ETag": etag} if etag else {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+def _serve(*responses):
+    """Answer the feed requests with `responses`, in order."""
+    return patch.object(aws_status_tool.requests, "get", side_effect=list(responses))
+
+
+OLD = ("ec2-us-east-1_1", "Performance issues", "Mon, 06 Oct 2026 10:00:00 GMT")
+OLDER = ("s3-eu-west-1_1", "Service disruption", "Sun, 05 Oct 2026 10:00:00 GMT")
+NEW = ("lambda-us-west-2_1", "Informational message", "Tue, 07 Oct 2026 10:00:00 GMT")
+
+
+def test_first_poll_returns_every_item_newest_first():
+    processor = FeedProcessor("https://feed.example/rss")
+    with _serve(_Response(_feed(OLD, OLDER), etag='"v1"')):
+        new = processor.poll()
+    assert [item["title"] for item in new] == ["Performance issues", "Service disruption"]
+    assert processor.newest_guid.endswith("ec2-us-east-1_1")
+
+
+def test_later_polls_return_only_new_items():
+    processor = FeedProcessor("https://feed.example/rss")
+    with _serve(_Response(_feed(OLD, OLDER), etag='"v1"'), _Response(_feed(NEW, OLD, OLDER), etag='"v2"')) as get:
+        processor.poll()
+        new = processor.poll()
+    assert [item["title"] for item in new] == ["Informational message"]
+    assert get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert len(processor.items) == 3
+
+
+def test_unchanged_feed_is_not_read():
+    processor = FeedProcessor("https://feed.example/rss")
+    with _serve(_Response(_feed(OLD), etag='"v1"'), _Response(status_code=304)):
+        processor.poll()
+        assert processor.poll() == []
+    assert len(processor.current_items()) == 1
+
+
+def test_items_dropped_from_the_feed_are_not_current():
+    processor = FeedProcessor("https://feed.example/rss")
+    with _serve(_Response(_feed(OLD, OLDER), etag='"v1"'), _Response(_feed(NEW, OLD), etag='"v2"')):
+        processor.poll()
+        processor.poll()
+    assert len(processor.items) == 3
+    assert [item["title"] for item in processor.current_items()] == ["Informational message", "Performance issues"]
+
+
+def test_subscribers_get_new_items_once():
+    processor = FeedProcessor("https://feed.example/rss")
+    batches = []
+    processor.subscribe(batches.append)
+    with _serve(_Response(_feed(OLD)), _Response(_feed(NEW, OLD))):
+        processor.poll()
+        processor.poll()
+    assert [[item["title"] for item in batch] for batch in batches] == [
+        ["Performance issues"], ["Informational message"]
+    ]
+
+
+def test_malformed_feed_is_a_request_failure():
+    processor = FeedProcessor("https://feed.example/rss")
+    html = b"<html><body><h1>502 Bad Gateway</h1><hr></body>"
+    for body in (html, _feed(NEW, OLD)[:-20]):
+        with _serve(_Response(_feed(OLD), etag='"v1"'), _Response(body, etag='"v2"')):
+            processor.poll()
+            try:
+                processor.poll()
+            except requests.RequestException as e:
+                assert "Malformed" in str(e)
+            else:
+                raise AssertionError("a malformed feed was accepted")
+        # Nothing from the bad body was kept
+        assert [item["title"] for item in processor.current_items()] == ["Performance issues"]
+
+
+def test_breaker_serves_last_good_poll_for_a_malformed_feed():
+    processor = FeedProcessor("https://feed.example/rss")
+    breaker = CircuitBreaker("feed")
+    with _serve(_Response(_feed(OLD)), _Response(b"<html>Service Unavailable")):
+        breaker.call(processor.url, processor.poll)
+        new, stale = breaker.call(processor.url, processor.poll)
+    assert stale["stale"] and "Malformed" in stale["stale_reason"]
+    assert [item["title"] for item in new] == ["Performance issues"]
@@ -0,0 +1,76 @@
+"""
+Test: Hedged Requests
+=====================
+Run: python -m pytest lab/tests/test_hedge.py
+"""
+
+import threading
+import time
+
+from src.tools import hedge
+from src.tools.hedge import Hedger
+
+
+def _warm(hedger, samples=20, latency=0.001):
+    for _ in range(samples):
+        hedger.call(time.sleep, latency)
+
+
+def test_disabled_hedger_calls_through():
+    hedger = Hedger("upstream", enabled=False)
+    assert hedger.call(threading.get_ident) == threading.get_ident()
+    assert hedger.status()["calls"] == 0
+
+
+def test_no_hedging_before_min_samples():
+    hedger = Hedger("upstream", enabled=True, min_samples=5, budget=1)
+    for _ in range(4):
+        hedger.call(time.sleep, 0.02)
+    assert hedger.hedge_after() is None
+    assert hedger.hedged == 0
+
+
+def test_hedges_stay_within_budget():
+    hedger = Hedger("upstream", enabled=True, budget=0.1, max_tokens=5)
+    _warm(hedger)
+    for _ in range(30):
+        hedger.call(time.sleep, 0.02)   # every call is slower than the learned p95
+    assert hedger.hedged >= 1
+    assert hedger.hedged <= hedger.budget * hedger.calls
+
+
+def test_fast_hedge_wins_over_slow_primary():
+    hedger = Hedger("upstream", enabled=True, budget=1, max_tokens=1)
+    _warm(hedger)
+    delays = iter([0.5, 0.0])
+
+    def request():
+        time.sleep(next(delays))
+        return "ok"
+
+    started = time.monotonic()
+    assert hedger.call(request) == "ok"
+    assert time.monotonic() - started < 0.4
+    assert hedger.hedge_wins == 1
+
+
+def test_error_raised_when_every_request_fails():
+    hedger = Hedger("upstream", enabled=True)
+
+    def fail():
+        raise ValueError("upstream down")
+
+    try:
+        hedger.call(fail)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("error was swallowed")
+
+
+def test_registry_keeps_only_enabled_hedgers(monkeypatch):
+    monkeypatch.setenv("HEDGE_UPSTREAMS", "wttr.in")
+    before = len(hedge._hedgers)
+    assert not hedge.get_hedger("unconfigured.example").enabled
+    assert len(hedge._hedgers) == before
+    assert hedge.get_hedger("wttr.in") is hedge.get_hedger("wttr.in")
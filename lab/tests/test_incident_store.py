@@ -0,0 +1,64 @@
+"""
+Test: Incident Store
+====================
+Run: python -m pytest lab/tests/test_incident_store.py
+"""
+
+import os
+
+from src.tools.incident_store import IncidentStore
+
+HOUR = 3600
+
+
+def _row(guid, hours, severity, service="ec2", region="us-east-1"):
+    return {"guid": guid, "published": hours * HOUR, "region": region, "service": service,
+            "severity": severity, "title": severity}
+
+
+def _incident():
+    # One incident: opened, updated, escalated and resolved
+    return [
+        _row("a1", 0, "degraded"),
+        _row("a2", 1, "informational"),
+        _row("a3", 2, "disruption"),
+        _row("a4", 3, "resolved"),
+    ]
+
+
+def test_updates_of_one_incident_count_once():
+    store = IncidentStore()
+    store.append(list(reversed(_incident())))   # newest first, as in the feed
+    assert store.count() == 4
+    assert store.count(openings=True) == 1
+    assert store.breakdown("severity", openings=True) == {"degraded": 1}
+
+
+def test_new_incident_after_resolution_or_silence():
+    store = IncidentStore()
+    store.append(_incident())
+    store.append([_row("b1", 10, "degraded"), _row("c1", 40, "degraded"), _row("d1", 40, "degraded", "s3")])
+    assert store.count("us-east-1", "ec2", openings=True) == 3
+    assert store.count(service="s3", openings=True) == 1
+    assert [item["guid"] for item in store.query(openings=True, limit=2)] == ["d1", "c1"]
+
+
+def test_late_item_updates_openings():
+    store = IncidentStore()
+    store.append([_row("a1", 0, "degraded"), _row("a3", 2, "degraded")])
+    assert store.count(openings=True) == 1
+    store.append([_row("a2", 1, "resolved")])   # arrives after the later update
+    assert store.count(openings=True) == 2
+    store.append([_row("a0", -1, "degraded")])  # an earlier update of the first incident
+    assert [item["guid"] for item in store.query(openings=True)] == ["a3", "a0"]
+
+
+def test_missing_column_file_is_tolerated(state_dir):
+    path = state_dir
+    IncidentStore(path).append(_incident())
+    assert len(IncidentStore(path)) == 4
+    os.remove(os.path.join(path, "title.col"))
+    store = IncidentStore(path)
+    assert len(store) == 0
+    store.append([_row("b1", 10, "degraded")])
+    assert len(IncidentStore(path)) == 1
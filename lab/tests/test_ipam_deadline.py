@@ -0,0 +1,44 @@
+"""
+Test: IPAM Query Deadline
+=========================
+Run: python -m pytest lab/tests/test_ipam_deadline.py
+"""
+
+
+from src.ipam import DeadlineExceeded, InfobloxClient, SubnetIndex
+from src.ipam.standin import serve
+from src.ipam.synthetic import SyntheticIPAM
+
+
+def _slow_ipam(count: int = 400, latency: float = 0.05):
+    """A stand-in answering each page after `latency`, and a client reading one 40-subnet page at a time."""
+    server, _ = serve(SyntheticIPAM(count=count, seed=3), port=0, latency=latency)
+    client = InfobloxClient("synthetic", base_url=f"http://127.0.0.1:{server.server_port}",
+                            page_size=40, max_workers=1, deadline=5)
+    return server, client
+
+
+def test_deadline_bounds_the_whole_scan():
+    server, client = _slow_ipam()
+    try:
+        # Every page fits easily in 0.25s; ten of them in a row do not
+        try:
+            list(client.iter_subnets(fields=["id"], deadline=0.25))
+        except DeadlineExceeded:
+            pass
+        else:
+            raise AssertionError("a 10-page scan outlived its deadline")
+        assert len(list(client.iter_subnets(fields=["id"]))) == 400
+    finally:
+        client.close()
+        server.shutdown()
+
+
+def test_index_loads_with_its_own_budget():
+    server, client = _slow_ipam()
+    client.deadline = 0.25
+    try:
+        assert SubnetIndex(client, deadline=30).load() == 400
+    finally:
+        client.close()
+        server.shutdown()
@@ -0,0 +1,74 @@
+"""
+Test: IP Utilization History
+============================
+Run: python -m pytest lab/tests/test_ipam_history.py
+"""
+
+import time
+from array import array
+
+from src.ipam import UtilizationRecorder, forecast_exhaustion
+
+DAY = 86400
+NOW = 100 * DAY
+
+
+def _series(days: int, used_at, per_day: int = 24, total: float = 1000.0) -> tuple:
+    times, used, totals = array("d"), array("d"), array("d")
+    for i in range(days * per_day):
+        t = NOW - days * DAY + i * DAY / per_day
+        times.append(t)
+        used.append(used_at(t))
+        totals.append(total)
+    return times, used, totals
+
+
+def test_steady_growth_is_forecast():
+    # 10 addresses a day from 500 used
+    times, used, total = _series(14, lambda t: 500 + 10 * (t - (NOW - 14 * DAY)) / DAY)
+    forecast = forecast_exhaustion(times, used, total, now=NOW)
+    assert forecast["status"] == "ok"
+    assert forecast["fit"] == "daily_peak"
+    assert abs(forecast["growth_ips_per_day"] - 10) < 1
+    assert abs(forecast["days_to_exhaustion"] - (1000 - used[-1]) / 10) < 3
+    assert forecast["days_to_80_percent"] < forecast["days_to_exhaustion"]
+
+
+def test_daily_cycle_does_not_hide_the_trend():
+    # Deploys add 200 addresses during the day and release them at night;
+    # the baseline grows 5 a day
+    def used_at(t):
+        daytime = (t % DAY) < DAY / 2
+        return 300 + 5 * (t - (NOW - 14 * DAY)) / DAY + (200 if daytime else 0)
+
+    times, used, total = _series(14, used_at)
+    forecast = forecast_exhaustion(times, used, total, now=NOW)
+    assert abs(forecast["growth_ips_per_day"] - 5) < 1
+
+
+def test_flat_or_short_series():
+    times, used, total = _series(10, lambda t: 400)
+    assert forecast_exhaustion(times, used, total, now=NOW)["days_to_exhaustion"] is None
+    times, used, total = _series(1, lambda t: 400, per_day=2)
+    assert forecast_exhaustion(times, used, total, now=NOW)["status"] == "insufficient_data"
+
+
+def test_imminent_exhaustion_warns():
+    times, used, total = _series(7, lambda t: 800 + 20 * (t - (NOW - 7 * DAY)) / DAY)
+    forecast = forecast_exhaustion(times, used, total, now=NOW)
+    assert forecast["days_to_exhaustion"] < 30
+    assert "warning" in forecast
+
+
+def test_recorder_keeps_only_ipam_readings(state_dir):
+    readings = {"source": "mock_data"}
+
+    def sampler(regions):
+        return {region: {"total": 256, "used": 100} for region in regions}, readings["source"]
+
+    recorder = UtilizationRecorder(["us-east-1"], sampler, path=state_dir)
+    for source in ("mock_data", "ipam_api_stale", "ipam_api", "ipam_index"):
+        readings["source"] = source
+        recorder.sample(now=time.time())
+    assert len(recorder.series["us-east-1"][0]) == 2
+    assert len(UtilizationRecorder(["us-east-1"], sampler, path=state_dir).series["us-east-1"][0]) == 2
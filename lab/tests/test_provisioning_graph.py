@@ -0,0 +1,68 @@
+"""
+Test: Provisioning Graph
+========================
+Run: python -m pytest lab/tests/test_provisioning_graph.py
+"""
+
+import threading
+import time
+
+from src.provisioning.graph import ProvisioningError, Step, run_graph
+
+
+def test_results_flow_to_dependents():
+    results = run_graph([
+        Step("pool", lambda deps: "pool-1"),
+        Step("client", lambda deps: deps["pool"] + "/client", depends_on=("pool",)),
+        Step("domain", lambda deps: deps["pool"] + "/domain", depends_on=("pool",)),
+    ])
+    assert results == {"pool": "pool-1", "client": "pool-1/client", "domain": "pool-1/domain"}
+
+
+def test_failure_propagates_and_stops_dependents():
+    ran = []
+
+    def fail(deps):
+        raise RuntimeError("quota exceeded")
+
+    try:
+        run_graph([
+            Step("pool", fail),
+            Step("client", lambda deps: ran.append("client"), depends_on=("pool",)),
+        ])
+    except ProvisioningError as e:
+        assert "pool" in str(e)
+        assert isinstance(e.__cause__, RuntimeError)
+    else:
+        raise AssertionError("run_graph did not raise")
+    assert ran == []
+
+
+def test_failure_waits_for_steps_in_flight():
+    finished = threading.Event()
+
+    def slow(deps):
+        time.sleep(0.1)
+        finished.set()
+
+    def fail(deps):
+        raise RuntimeError("boom")
+
+    try:
+        run_graph([Step("slow", slow), Step("fail", fail)], max_workers=2)
+    except ProvisioningError:
+        pass
+    assert finished.is_set()
+
+
+def test_cycles_and_unknown_dependencies_are_rejected():
+    for steps in (
+        [Step("a", lambda d: 1, depends_on=("b",)), Step("b", lambda d: 1, depends_on=("a",))],
+        [Step("a", lambda d: 1, depends_on=("missing",))],
+        [Step("a", lambda d: 1), Step("a", lambda d: 2)],
+    ):
+        try:
+            run_graph(steps)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted invalid graph: {[s.name for s in steps]}")
@@ -0,0 +1,67 @@
+"""
+Test: CIDR Radix Tree
+=====================
+Run: python -m pytest lab/tests/test_radix.py
+"""
+
+import ipaddress
+import random
+
+from src.ipam import RadixTree
+
+
+def _random_networks(seed: int, count: int = 300) -> list:
+    rng = random.Random(seed)
+    networks = []
+    for _ in range(count):
+        length = rng.choice((8, 12, 16, 20, 22, 24, 26, 28, 32))
+        address = ipaddress.ip_address(rng.choice((0x0A000000, 0x0A140000, 0xC0A80000)) | rng.getrandbits(16))
+        networks.append(ipaddress.ip_network(f"{address}/{length}", strict=False))
+    return networks
+
+
+def test_lookups_match_brute_force():
+    networks = _random_networks(1)
+    tree = RadixTree()
+    for i, network in enumerate(networks):
+        tree.add(network, i)
+
+    rng = random.Random(2)
+    for _ in range(200):
+        address = ipaddress.ip_address(networks[rng.randrange(len(networks))].network_address + rng.getrandbits(4))
+        expected = {i for i, network in enumerate(networks) if address in network}
+        assert set(tree.containing(address)) == expected
+
+    for probe in networks[:50]:
+        expected = {i for i, network in enumerate(networks) if network.subnet_of(probe)}
+        assert set(tree.within(probe)) == expected
+
+
+def test_containing_is_least_specific_first():
+    tree = RadixTree()
+    tree.add("10.0.0.0/24", "c")
+    tree.add("10.0.0.0/8", "a")
+    tree.add("10.0.0.0/16", "b")
+    assert tree.containing("10.0.0.7") == ["a", "b", "c"]
+    assert tree.containing("10.1.0.1") == ["a"]
+    assert tree.containing("11.0.0.1") == []
+
+
+def test_discard_and_duplicates():
+    tree = RadixTree()
+    tree.add("10.0.0.0/24", "x")
+    tree.add("10.0.0.0/24", "y")
+    tree.add("10.0.0.0/24", "x")
+    assert sorted(tree.within("10.0.0.0/16")) == ["x", "y"]
+    tree.discard("10.0.0.0/24", "x")
+    tree.discard("10.9.0.0/24", "x")   # not stored: ignored
+    assert tree.containing("10.0.0.1") == ["y"]
+
+
+def test_ipv4_and_ipv6_are_separate():
+    tree = RadixTree()
+    tree.add("10.0.0.0/8", "v4")
+    tree.add("2001:db8::/32", "v6")
+    assert tree.containing("2001:db8::1") == ["v6"]
+    assert tree.within("::/0") == ["v6"]
+    assert tree.within("0.0.0.0/0") == ["v4"]
@@ -0,0 +1,80 @@
+"""
+Test: Readiness Scheduler
+=========================
+Run: python -m pytest lab/tests/test_readiness.py
+"""
+
+import threading
+
+from src.readiness import ReadinessScheduler
+
+
+def _scheduler(calls: list) -> ReadinessScheduler:
+    def probe(region):
+        calls.append(region)
+        return {"status": "ok"}
+
+    return ReadinessScheduler(["us-east-1", "eu-west-1"], {"aws_status": probe})
+
+
+def test_unmonitored_regions_are_never_probed():
+    calls = []
+    scheduler = _scheduler(calls)
+    entry = scheduler.get("ap-east-2")
+    assert entry["status"] == "not_monitored"
+    assert calls == [] and scheduler.snapshot == {}
+
+
+def test_get_without_refresh_only_reads():
+    calls = []
+    scheduler = _scheduler(calls)
+    assert scheduler.get("us-east-1", refresh=False) is None
+    assert calls == []
+    assert scheduler.get("us-east-1")["aws_status"] == {"status": "ok"}
+    assert calls == ["us-east-1"]
+    assert scheduler.get("us-east-1", refresh=False)["age_seconds"] == 0
+
+
+def test_readers_wait_for_the_first_refresh():
+    calls = []
+    scheduler = _scheduler(calls)
+    scheduler.start()
+    try:
+        # No "not monitored" or empty answer while the first pass runs
+        assert scheduler.get("us-east-1", refresh=False)["aws_status"] == {"status": "ok"}
+        assert set(scheduler.all()) == {"us-east-1", "eu-west-1"}
+    finally:
+        scheduler.stop()
+    assert sorted(calls) == ["eu-west-1", "us-east-1"]
+
+
+def test_slow_first_refresh_reports_warming_up():
+    release = threading.Event()
+    calls = []
+
+    def probe(region):
+        calls.append(region)
+        release.wait(5)
+        return {"status": "ok"}
+
+    scheduler = ReadinessScheduler(["us-east-1"], {"aws_status": probe}, warmup_timeout=0.05)
+    scheduler.start()
+    try:
+        assert scheduler.get("us-east-1")["status"] == "warming_up"
+        assert calls == ["us-east-1"]   # the reader did not probe as well
+    finally:
+        release.set()
+        scheduler.stop()
+    assert scheduler.get("us-east-1")["aws_status"] == {"status": "ok"}
+
+
+def test_fast_path_validates_regions():
+    import handler
+
+    assert "error" in handler.read_readiness("us-east-1")
+    assert "error" in handler.read_readiness([1, 2])
+    result = handler.read_readiness(["US-EAST-1", "eu-north-1", "nowhere"])["readiness"]
+    assert result["US-EAST-1"]["region"] == "us-east-1"
+    assert result["eu-north-1"]["status"] == "not_monitored"
+    assert result["nowhere"]["status"] == "unknown_region"
+    assert "eu-north-1" not in handler.readiness.snapshot
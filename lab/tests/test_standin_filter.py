@@ -0,0 +1,54 @@
+"""
+Test: IPAM Stand-in Filters
+===========================
+Run: python -m pytest lab/tests/test_standin_filter.py
+"""
+
+
+from src.ipam import region_filter
+from src.ipam.standin import FilterError, parse_filter
+
+SUBNETS = [
+    {"address": "10.0.0.0", "cidr": "24", "comment": "us-east-1 web", "tags": {"env": "prod"}},
+    {"address": "10.1.0.0", "cidr": "22", "comment": "batch", "tags": {"region": "eu-west-1"}},
+    {"address": "10.2.0.0", "cidr": "26", "comment": "", "tags": {"region": "us-east-1", "env": "dev"}},
+    {"address": "10.3.0.0", "cidr": "24", "comment": "O'Brien's lab", "tags": None},
+]
+
+
+def _match(text: str) -> list:
+    predicate = parse_filter(text)
+    return [subnet["address"] for subnet in SUBNETS if predicate(subnet)]
+
+
+def test_region_filter_matches_tags_and_comments():
+    assert _match(region_filter("us-east-1")) == ["10.0.0.0", "10.2.0.0"]
+    assert _match(region_filter("ap-south-1")) == []
+
+
+def test_comparisons():
+    assert _match("cidr=='24'") == ["10.0.0.0", "10.3.0.0"]
+    assert _match("cidr!='24'") == ["10.1.0.0", "10.2.0.0"]
+    assert _match("address>='10.2.0.0'") == ["10.2.0.0", "10.3.0.0"]
+    assert _match("comment~'^BATCH$'") == ["10.1.0.0"]    # case-insensitive
+    assert _match("tags~'dev'") == ["10.2.0.0"]
+
+
+def test_and_binds_tighter_than_or():
+    assert _match("cidr=='22' or cidr=='24' and comment~'web'") == ["10.0.0.0", "10.1.0.0"]
+    assert _match("(cidr=='22' or cidr=='24') and comment~'web'") == ["10.0.0.0"]
+    assert _match("tags~'us-east-1' AND (tags~'dev' OR tags~'prod')") == ["10.2.0.0"]
+
+
+def test_escaped_quotes():
+    assert _match(r"comment~'O\'Brien'") == ["10.3.0.0"]
+
+
+def test_malformed_filters_are_rejected():
+    for text in ("cidr=='24' and", "(cidr=='24'", "cidr=='24')", "cidr=24", "cidr=='24' cidr=='22'",
+                 "comment~'['"):
+        try:
+            parse_filter(text)
+        except FilterError:
+            continue
+        raise AssertionError(f"accepted {text!r}")
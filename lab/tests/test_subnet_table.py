@@ -0,0 +1,54 @@
+"""
+Test: Subnet Table
+==================
+Run: python -m pytest lab/tests/test_subnet_table.py
+"""
+
+
+from src.ipam import SubnetTable
+
+
+def _table():
+    table = SubnetTable()
+    # utilization: 10%, 50%, 85%, 97%
+    table.append("a", 100, 10, 90, region="us-east-1", space="prod")
+    table.append("b", 200, 100, 100, region="us-east-1", space="dev")
+    table.append("c", 100, 85, 15, region="eu-west-1", space="prod")
+    table.append("d", 100, 97, 3, region="eu-west-1", space="prod")
+    return table
+
+
+def test_aggregate_over_rows():
+    table = _table()
+    assert table.aggregate() == {"subnets": 4, "total": 500, "used": 292, "available": 208}
+    assert table.aggregate({0, 2}) == {"subnets": 2, "total": 200, "used": 95, "available": 105}
+
+
+def test_percentiles_and_classification():
+    table = _table()
+    assert table.percentiles(points=(50, 90)) == {"p50": 50.0, "p90": 97.0, "max": 97.0}
+    assert table.classify() == {"healthy": 2, "warning": 1, "critical": 1}
+    assert table.percentiles(rows=set()) == {}
+
+
+def test_group_by_region_and_space():
+    table = _table()
+    by_region = table.group_by("region")
+    assert by_region["us-east-1"]["total"] == 300
+    assert by_region["eu-west-1"]["available"] == 18
+    assert set(table.group_by("space", rows={0, 1})) == {"prod", "dev"}
+
+
+def test_update_moves_groups():
+    table = _table()
+    table.update(1, 200, 180, 20, region="eu-west-1", space="prod")
+    assert table.group_by("region")["eu-west-1"]["subnets"] == 3
+    assert table.classify()["warning"] == 2   # 85% and 90%
+
+
+def test_delete_drops_the_row():
+    table = _table()
+    table.delete(3)
+    assert table.aggregate()["subnets"] == 3
+    assert table.group_by("region")["eu-west-1"]["subnets"] == 1
+    assert table.subnet_ids(range(4)) == ["a", "b", "c"]
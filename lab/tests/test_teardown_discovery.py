@@ -0,0 +1,131 @@
+"""
+Test: Teardown Discovery
+========================
+Run: python -m pytest lab/tests/test_teardown_discovery.py
+"""
+
+from unittest.mock import patch
+
+from src.provisioning.cognito import ensure_user_pool
+from src.provisioning.gateway import ensure_gateway
+from src.provisioning.teardown import discover
+
+
+class _NotFound(Exception):
+    pass
+
+
+class _Exceptions:
+    ResourceNotFoundException = _NotFound
+
+
+class _Paginator:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def paginate(self, **kwargs):
+        return self.pages(**kwargs)
+
+
+class FakeCognito:
+    """The cognito-idp calls used by provisioning and teardown, in memory."""
+
+    exceptions = _Exceptions
+
+    def __init__(self):
+        self.pools = {}
+
+    def add_pool(self, name: str, tags: dict = None) -> str:
+        pool_id = f"us-west-2_{len(self.pools)}"
+        self.pools[pool_id] = {"Id": pool_id, "Name": name, "Arn": f"arn:pool/{pool_id}",
+                               "UserPoolTags": dict(tags or {})}
+        return pool_id
+
+    def get_paginator(self, operation):
+        if operation == "list_user_pools":
+            return _Paginator(lambda **kwargs: [{"UserPools": [
+                {"Id": pool["Id"], "Name": pool["Name"]} for pool in self.pools.values()
+            ]}])
+        return _Paginator(lambda **kwargs: [{"UserPoolClients": []}])
+
+    def describe_user_pool(self, UserPoolId):
+        if UserPoolId not in self.pools:
+            raise _NotFound(UserPoolId)
+        return {"UserPool": dict(self.pools[UserPoolId])}
+
+    def create_user_pool(self, PoolName, UserPoolTags, **kwargs):
+        return {"UserPool": {"Id": self.add_pool(PoolName, UserPoolTags)}}
+
+    def tag_resource(self, ResourceArn, Tags):
+        pool = next(pool for pool in self.pools.values() if pool["Arn"] == ResourceArn)
+        pool["UserPoolTags"].update(Tags)
+
+
+class FakeControl:
+    """The bedrock-agentcore-control gateway calls, in memory."""
+
+    exceptions = _Exceptions
+
+    def __init__(self):
+        self.gateways = {}
+        self.tags = {}
+
+    def get_paginator(self, operation):
+        if operation == "list_gateways":
+            return _Paginator(lambda **kwargs: [{"items": [
+                {"gatewayId": gateway["gatewayId"], "name": gateway["name"], "status": "READY"}
+                for gateway in self.gateways.values()
+            ]}])
+        return _Paginator(lambda **kwargs: [{"items": []}])
+
+    def create_gateway(self, name, tags=None, **kwargs):
+        gateway_id = f"gw-{len(self.gateways)}"
+        arn = f"arn:gateway/{gateway_id}"
+        self.gateways[gateway_id] = {"gatewayId": gateway_id, "gatewayArn": arn, "name": name,
+                                     "status": "READY"}
+        self.tags[arn] = dict(tags or {})
+        return dict(self.gateways[gateway_id])
+
+    def get_gateway(self, gatewayIdentifier=None, gatewayId=None):
+        gateway_id = gatewayIdentifier or gatewayId
+        if gateway_id not in self.gateways:
+            raise _NotFound(gateway_id)
+        return dict(self.gateways[gateway_id])
+
+    def list_tags_for_resource(self, resourceArn):
+        return {"tags": dict(self.tags[resourceArn])}
+
+    def tag_resource(self, resourceArn, tags):
+        self.tags[resourceArn].update(tags)
+
+
+def test_created_pool_and_gateway_are_discovered():
+    cognito, control = FakeCognito(), FakeControl()
+    pool = ensure_user_pool(cognito, "DevOpsAgentPool")
+    gateway = ensure_gateway(control, "DevOpsGateway", "us-west-2", pool["pool_id"], "client", "role")
+    found = discover(cognito, control)
+    assert found["pools"] == [{"pool_id": pool["pool_id"], "domain": None}]
+    assert found["gateways"] == {gateway["gateway_id"]: []}
+
+
+def test_reused_untagged_resources_are_tagged():
+    cognito, control = FakeCognito(), FakeControl()
+    pool_id = cognito.add_pool("DevOpsAgentPool")
+    gateway_id = control.create_gateway("DevOpsGateway")["gatewayId"]
+    assert discover(cognito, control) == {"gateways": {}, "pools": [], "clients": []}
+
+    assert ensure_user_pool(cognito, "DevOpsAgentPool")["pool_id"] == pool_id
+    ensure_gateway(control, "DevOpsGateway", "us-west-2", pool_id, "client", "role")
+    found = discover(cognito, control)
+    assert [pool["pool_id"] for pool in found["pools"]] == [pool_id]
+    assert list(found["gateways"]) == [gateway_id]
+
+
+def test_step7b_gateway_is_discovered():
+    from lab.solutions import step7b_gateway_auth
+
+    cognito, control = FakeCognito(), FakeControl()
+    config = {"region": "us-west-2", "pool_id": cognito.add_pool("DevOpsAgentPool"), "client_id": "client-123"}
+    with patch.object(step7b_gateway_auth.boto3, "client", return_value=control):
+        gateway = step7b_gateway_auth.create_gateway_with_cognito(config)
+    assert list(discover(cognito, control)["gateways"]) == [gateway["gateway_id"]]
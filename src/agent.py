@@ -9,13 +9,18 @@ A complete agent that helps with deployment decisions by checking:
 This is the main agent file used for local testing and AgentCore deployment.
 """
 
-from mcp import stdio_client, StdioServerParameters
+import os
+
 from strands import Agent
-from strands.tools.mcp import MCPClient
 
 from config import get_model
-from tools.weather_tool import get_weather_forecast
+from mcp_clients import FETCH_SERVER, LazyMCPClient
+from tools.weather_tool import get_weather_forecast, get_weather_risk
 from tools.aws_status_tool import check_aws_status
+from tools.fetch_tool import fetch_url
+from tools.deployment_window_tool import plan_deployment_window
+from tools.incident_store import get_incident_history
+from tools.external_status_tool import check_external_dependencies
 
 
 # System prompt that defines the agent's personality and behavior
@@ -25,6 +30,7 @@ make informed deployment decisions by analyzing multiple factors:
 1. AWS Service Health - Check for any ongoing incidents
 2. Weather Conditions - Severe weather can affect datacenters
 3. External Dependencies - Check status of GitHub, CI/CD pipelines, etc.
+   (use check_external_dependencies; fetch pages only for services it does not monitor)
 
 When asked about deployments:
 - Always check relevant AWS regions for health status
@@ -35,13 +41,23 @@ When asked about deployments:
 Be concise but thorough. Engineers need quick, actionable information.
 """
 
+# Tools implemented in this repo (no MCP server needed)
+CUSTOM_TOOLS = [
+    get_weather_forecast,
+    get_weather_risk,
+    check_aws_status,
+    get_incident_history,
+    plan_deployment_window,
+    check_external_dependencies,
+]
+
 
 def create_agent_simple() -> Agent:
     """Create agent without MCP (simpler, no context manager needed)."""
     return Agent(
         model=get_model(),
         system_prompt=SYSTEM_PROMPT,
-        tools=[get_weather_forecast, check_aws_status]
+        tools=CUSTOM_TOOLS
     )
 
 
@@ -53,27 +69,24 @@ def run_interactive():
     print("Ask me about deployments, AWS status, or weather conditions.")
     print("Type 'quit' to exit.\n")
 
+    # FETCH_TOOL=native swaps the Fetch MCP server for the in-process fetch tool
+    if os.getenv("FETCH_TOOL", "mcp").lower() == "native":
+        agent = Agent(
+            model=get_model(),
+            system_prompt=SYSTEM_PROMPT,
+            tools=CUSTOM_TOOLS + [fetch_url]
+        )
+
+        print("[Native fetch tool enabled]\n")
+        _interactive_loop(agent)
+        return
+
     # Try to use MCP, fall back to simple if not available
     try:
-        fetch_mcp = MCPClient(lambda: stdio_client(
-            StdioServerParameters(
-                command="uvx",
-                args=["mcp-server-fetch"]
-            )
-        ))
-
-        with fetch_mcp:
-            mcp_tools = fetch_mcp.list_tools_sync()
-            all_tools = [get_weather_forecast, check_aws_status] + mcp_tools
-
-            agent = Agent(
-                model=get_model(),
-                system_prompt=SYSTEM_PROMPT,
-                tools=all_tools
-            )
-
-            print("[MCP Fetch server connected]\n")
-            _interactive_loop(agent)
+        # Tools come from cached schemas; the Fetch server is only leased
+        # from the warm pool when the model first calls one of them
+        fetch_mcp = LazyMCPClient(FETCH_SERVER)
+        mcp_tools = fetch_mcp.list_tools()
 
     except Exception as e:
         print(f"[MCP not available: {e}]")
@@ -81,6 +94,17 @@ def run_interactive():
 
         agent = create_agent_simple()
         _interactive_loop(agent)
+        return
+
+    with fetch_mcp:
+        agent = Agent(
+            model=get_model(),
+            system_prompt=SYSTEM_PROMPT,
+            tools=CUSTOM_TOOLS + mcp_tools
+        )
+
+        print("[MCP Fetch tools available - server connects on first use]\n")
+        _interactive_loop(agent)
 
 
 def _interactive_loop(agent: Agent):
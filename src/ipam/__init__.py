@@ -0,0 +1,26 @@
+# Infoblox CSP IPAM access for the capacity tools
+from .async_client import AsyncInfobloxClient, DeadlineExceeded, IPAMError
+from .bitmap import FreeSpaceMap
+from .client import InfobloxClient, get_client, region_filter, aggregate_utilization
+from .history import UtilizationRecorder, forecast_exhaustion, make_exhaustion_tool
+from .index import SubnetIndex, get_subnet_index
+from .radix import RadixTree
+from .table import SubnetTable
+
+__all__ = [
+    "InfobloxClient",
+    "AsyncInfobloxClient",
+    "IPAMError",
+    "DeadlineExceeded",
+    "get_client",
+    "region_filter",
+    "aggregate_utilization",
+    "SubnetIndex",
+    "get_subnet_index",
+    "RadixTree",
+    "FreeSpaceMap",
+    "SubnetTable",
+    "UtilizationRecorder",
+    "forecast_exhaustion",
+    "make_exhaustion_tool",
+]
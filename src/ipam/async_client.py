@@ -0,0 +1,180 @@
+"""
+Async Infoblox CSP Client
+=========================
+asyncio client for the Infoblox CSP DDI API: one pooled httpx connection
+set shared by every request, retries with backoff, and a deadline per call.
+
+Transient failures - 429, 502, 503, 504 and connection errors - are retried
+up to `max_retries` times. The wait before a retry is the server's
+`Retry-After` (seconds or HTTP date) when it sends one, otherwise
+exponential backoff with full jitter. No attempt or wait runs past the
+call's deadline; DeadlineExceeded is raised instead.
+
+Errors are raised as IPAMError, a requests.RequestException, so callers
+that handle `requests` errors keep working. InfobloxClient (client.py)
+wraps this class for synchronous code.
+"""
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+import httpx
+import requests
+
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class IPAMError(requests.RequestException):
+    """An IPAM request failed (after retries)."""
+
+
+class DeadlineExceeded(IPAMError, requests.Timeout):
+    """The call's deadline passed before IPAM answered."""
+
+
+def retry_after(response: httpx.Response):
+    """Seconds the server asked us to wait, or None."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AsyncInfobloxClient:
+    """
+    Args:
+        api_key: CSP API key
+        base_url: DDI API base URL
+        page_size: Records requested per page (`_limit`)
+        max_concurrency: Maximum requests (and pooled connections) in flight
+        timeout: Seconds per HTTP attempt
+        max_retries: Retries of a transient failure
+        backoff: First backoff delay in seconds (doubles per retry, with jitter)
+        max_backoff: Longest backoff delay in seconds
+    """
+
+    def __init__(self, api_key: str, base_url: str, page_size: int = 1000, max_concurrency: int = 4,
+                 timeout: float = 10, max_retries: int = 4, backoff: float = 0.5, max_backoff: float = 30):
+        self.base_url = base_url.rstrip("/")
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._http = httpx.AsyncClient(
+            headers={"Authorization": f"Token {api_key}", "Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            timeout=timeout,
+        )
+
+    async def aclose(self):
+        await self._http.aclose()
+
+    def _delay(self, attempt: int, response: httpx.Response = None) -> float:
+        if response is not None:
+            requested = retry_after(response)
+            if requested is not None:
+                return requested
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    async def get(self, path: str, params: dict, deadline: float = None) -> dict:
+        """
+        GET a path with retries. `deadline` is a time.monotonic() value.
+
+        Returns:
+            The decoded JSON body
+        """
+        url = f"{self.base_url}{path}"
+        attempt = 0
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise DeadlineExceeded(f"IPAM deadline exceeded for {path}")
+            timeout = self.timeout if remaining is None else min(self.timeout, remaining)
+
+            response = None
+            try:
+                response = await self._http.get(url, params=params, timeout=timeout)
+            except httpx.TimeoutException as e:
+                error = DeadlineExceeded(f"IPAM request timed out: {e}") if (
+                    deadline is not None and time.monotonic() >= deadline
+                ) else IPAMError(f"IPAM request timed out: {e}")
+            except httpx.TransportError as e:
+                error = IPAMError(f"IPAM connection error: {e}")
+            else:
+                if response.status_code < 400:
+                    try:
+                        return response.json()
+                    except ValueError as e:
+                        raise IPAMError(f"IPAM returned invalid JSON: {e}")
+                error = IPAMError(
+                    f"{response.status_code} error from IPAM for {path}: {response.text[:200]}",
+                    response=response,
+                )
+                if response.status_code not in RETRY_STATUSES:
+                    raise error
+
+            if attempt >= self.max_retries or isinstance(error, DeadlineExceeded):
+                raise error
+            delay = self._delay(attempt, response)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise DeadlineExceeded(f"IPAM deadline would pass while waiting to retry: {error}")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get_page(self, path: str, offset: int = 0, limit: int = None, filter: str = None,
+                       fields: list = None, deadline: float = None) -> list:
+        """Fetch one page of a list endpoint and return its `results`."""
+        params = {"_offset": offset, "_limit": limit or self.page_size}
+        if filter:
+            params["_filter"] = filter
+        if fields:
+            params["_fields"] = ",".join(fields)
+        body = await self.get(path, params, deadline)
+        return body.get("results", [])
+
+    async def iter_pages(self, path: str, filter: str = None, fields: list = None, deadline: float = None):
+        """
+        Yield every page of a list endpoint, in completion order.
+
+        Up to max_concurrency pages are requested ahead; once a page comes
+        back short, no further offsets are requested. `deadline` (a
+        time.monotonic() value) bounds the whole scan: every page request
+        gets only the time left until it.
+        """
+        limit = self.page_size
+        next_offset = 0
+        end = None  # offset of the first short page
+        in_flight = {}
+        try:
+            while True:
+                while end is None and len(in_flight) < self.max_concurrency:
+                    task = asyncio.ensure_future(
+                        self.get_page(path, next_offset, limit, filter, fields, deadline)
+                    )
+                    in_flight[task] = next_offset
+                    next_offset += limit
+                if not in_flight:
+                    return
+
+                finished, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    offset = in_flight.pop(task)
+                    page = task.result()
+                    if len(page) < limit:
+                        end = offset if end is None else min(end, offset)
+                    if page and (end is None or offset <= end):
+                        yield page
+        finally:
+            for task in in_flight:
+                task.cancel()
@@ -0,0 +1,140 @@
+"""
+Subnet Free-Space Bitmap
+========================
+Where in a subnet the free addresses are, not just how many there are.
+
+FreeSpaceMap keeps one bit per address in a Python int (bit i = offset i is
+allocated). Contiguity questions are answered with whole-bitmap shifts and
+ANDs instead of walking addresses:
+
+    free & (free >> 1)          bit i set: offsets i and i+1 are both free
+    ... repeated with shifts 2, 4, ..., 2**(k-1)
+                                bit i set: offsets i .. i + 2**k - 1 are free
+    & alignment mask            keep offsets that start a CIDR block of size 2**k
+
+so finding every free /26 in a /16 is six shift-ANDs over a 65536-bit int.
+best_fit() picks the free block inside the smallest free aligned region,
+which leaves larger free blocks intact for later requests.
+"""
+
+import ipaddress
+
+# Largest subnet a bitmap is built for (a /12 in IPv4)
+MAX_ADDRESSES = 1 << 20
+
+
+class FreeSpaceMap:
+    """
+    Allocation bitmap of one subnet.
+
+    Args:
+        network: Subnet CIDR ("10.0.0.0/24") or ip_network
+        allocated: Addresses (strings or ip_address) in use
+        reserve_edges: Treat the IPv4 network and broadcast addresses as used
+    """
+
+    def __init__(self, network, allocated=(), reserve_edges: bool = True):
+        self.network = ipaddress.ip_network(network, strict=False)
+        self.size = self.network.num_addresses
+        if self.size > MAX_ADDRESSES:
+            raise ValueError(f"{self.network} is too large for a free-space bitmap")
+        self.bits = self.network.max_prefixlen - self.network.prefixlen  # log2(size)
+        self._full = (1 << self.size) - 1
+        # Set bits in a byte buffer, then convert once (OR-ing into an int per
+        # address would copy the whole bitmap every time)
+        buffer = bytearray((self.size + 7) // 8)
+        base = int(self.network.network_address)
+        for address in allocated:
+            offset = int(ipaddress.ip_address(address)) - base
+            if 0 <= offset < self.size:
+                buffer[offset >> 3] |= 1 << (offset & 7)
+        self.used = int.from_bytes(buffer, "little")
+        if reserve_edges and self.network.version == 4 and self.size > 2:
+            self.used |= 1 | (1 << (self.size - 1))
+
+    @property
+    def free(self) -> int:
+        return ~self.used & self._full
+
+    def free_count(self) -> int:
+        return self.free.bit_count()
+
+    def _alignment(self, level: int) -> int:
+        """Bits at every multiple of 2**level."""
+        # Double the pattern until it spans the subnet: log2(size / step) shifts
+        mask, width = 1, 1 << level
+        while width < self.size:
+            mask |= mask << width
+            width <<= 1
+        return mask
+
+    def aligned_free(self, level: int) -> int:
+        """Bitmap of offsets that start a fully free, aligned block of 2**level addresses."""
+        runs = self.free
+        for shift in range(level):
+            runs &= runs >> (1 << shift)
+        return runs & self._alignment(level)
+
+    def _block(self, offset: int, level: int):
+        address = self.network.network_address + offset
+        return ipaddress.ip_network((address, self.network.max_prefixlen - level))
+
+    def _maximal(self, level: int, blocks: int, parents: int) -> int:
+        """Free blocks at `level` whose enclosing block one level up is not free."""
+        covered = parents | (parents << (1 << level))
+        return blocks & ~covered
+
+    def free_blocks(self, limit: int = 5) -> list:
+        """The largest free CIDR blocks (each not part of a bigger free block), largest first."""
+        found = []
+        parents = 0
+        for level in range(self.bits, -1, -1):
+            blocks = self.aligned_free(level)
+            maximal = self._maximal(level, blocks, parents)
+            while maximal and len(found) < limit:
+                low = maximal & -maximal
+                found.append(self._block(low.bit_length() - 1, level))
+                maximal ^= low
+            if len(found) >= limit:
+                break
+            parents = blocks
+        return found
+
+    def count_blocks(self, prefixlen: int) -> int:
+        """How many free, aligned blocks of a prefix length fit."""
+        level = self.network.max_prefixlen - prefixlen
+        if not 0 <= level <= self.bits:
+            return 0
+        return self.aligned_free(level).bit_count()
+
+    def fit_region(self, prefixlen: int):
+        """
+        The smallest free aligned region (a maximal free block) that can hold
+        a block of the given prefix length, or None.
+        """
+        want = self.network.max_prefixlen - prefixlen
+        if not 0 <= want <= self.bits:
+            return None
+        blocks = self.aligned_free(want)
+        for level in range(want, self.bits + 1):
+            if not blocks:
+                return None
+            # Pairs of free buddies form the free blocks one level up
+            parents = blocks & (blocks >> (1 << level)) & self._alignment(level + 1) if level < self.bits else 0
+            maximal = self._maximal(level, blocks, parents)
+            if maximal:
+                offset = (maximal & -maximal).bit_length() - 1
+                return self._block(offset, level)
+            blocks = parents
+        return None
+
+    def best_fit(self, prefixlen: int):
+        """
+        A free block of the given prefix length, or None.
+
+        Chosen from the smallest free aligned region that can hold it.
+        """
+        region = self.fit_region(prefixlen)
+        if region is None:
+            return None
+        return ipaddress.ip_network((region.network_address, prefixlen))
@@ -0,0 +1,206 @@
+"""
+Infoblox CSP Client
+===================
+Paginated, concurrent reads from the Infoblox CSP DDI API.
+
+List endpoints such as /ipam/subnet return at most `_limit` records per
+call. InfobloxClient.iter_pages() keeps up to `max_workers` page requests in
+flight (offsets 0, limit, 2*limit, ...) and yields each page as soon as it
+arrives; the first short page marks the end of the collection. `_fields`
+projection keeps responses down to the attributes the caller needs, and
+aggregate_utilization() folds pages into totals as they stream in, so no
+full result list is ever held in memory.
+
+Requests go through AsyncInfobloxClient (async_client.py) on a shared
+background event loop: pooled keep-alive connections, retries of 429/5xx
+with backoff honoring Retry-After, and one deadline per call: every page of
+a scan shares it, so a query of N pages cannot take N times as long.
+
+Usage:
+    client = get_client()
+    pages = client.iter_pages("/ipam/subnet", filter=region_filter("us-east-1"),
+                              fields=["utilization"])
+    totals = aggregate_utilization(pages)
+
+Environment:
+    IPAM_API_KEY          Infoblox CSP API key
+    IPAM_BASE_URL         API base URL (default: https://csp.infoblox.com/api/ddi/v1)
+    IPAM_PAGE_SIZE        Records per page (default: 1000)
+    IPAM_MAX_CONCURRENCY  Page requests in flight at once (default: 4)
+    IPAM_MAX_RETRIES      Retries of a 429/5xx or connection error (default: 4)
+    IPAM_DEADLINE         Seconds one call may take, every page and retry included (default: 30)
+"""
+
+import asyncio
+import os
+import queue
+import threading
+import time
+
+from .async_client import AsyncInfobloxClient
+
+DEFAULT_BASE_URL = "https://csp.infoblox.com/api/ddi/v1"
+
+
+def region_filter(region: str) -> str:
+    """Server-side filter matching subnets tagged or commented with a region."""
+    return f"tags~'{region}' or comment~'{region}'"
+
+
+def _count(value) -> int:
+    # CSP encodes 64-bit counters as JSON strings
+    return int(value or 0)
+
+
+def aggregate_utilization(pages) -> dict:
+    """
+    Sum subnet utilization over an iterable of pages (lists of subnet records).
+
+    Returns:
+        Dict with "subnets", "total", "used" and "available" address counts
+    """
+    totals = {"subnets": 0, "total": 0, "used": 0, "available": 0}
+    for page in pages:
+        for subnet in page:
+            util = subnet.get("utilization", {})
+            totals["subnets"] += 1
+            totals["total"] += _count(util.get("total"))
+            totals["used"] += _count(util.get("used"))
+            # "free" in the CSP schema; "available" in older lab data
+            totals["available"] += _count(util.get("available", util.get("free")))
+    return totals
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Event loop shared by every InfobloxClient, running in a daemon thread."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="ipam-client", daemon=True).start()
+    return _loop
+
+
+_loop = None
+_loop_lock = threading.Lock()
+_DONE = object()
+
+
+class InfobloxClient:
+    """
+    Synchronous facade over AsyncInfobloxClient, safe to share between threads.
+
+    Requests run on one background event loop, so every caller shares a
+    single pool of keep-alive connections, and transient 429/5xx responses
+    are retried with backoff (see async_client.py).
+
+    Args:
+        api_key: CSP API key
+        base_url: DDI API base URL
+        page_size: Records requested per page (`_limit`)
+        max_workers: Maximum page requests in flight at once
+        timeout: Seconds per HTTP attempt
+        max_retries: Retries of a transient failure
+        deadline: Seconds one call (every page of a scan, retries included) may take
+    """
+
+    def __init__(self, api_key: str, base_url: str = DEFAULT_BASE_URL, page_size: int = 1000,
+                 max_workers: int = 4, timeout: int = 10, max_retries: int = 4, deadline: float = 30):
+        self.base_url = base_url.rstrip("/")
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.deadline = deadline
+        self._loop = _background_loop()
+        self._async = self._run(self._create(api_key, base_url, page_size, max_workers, timeout, max_retries))
+
+    @staticmethod
+    async def _create(*args) -> AsyncInfobloxClient:
+        # Build the httpx client on the loop that will use it
+        return AsyncInfobloxClient(*args)
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def _deadline(self, deadline: float = None) -> float:
+        return time.monotonic() + (self.deadline if deadline is None else deadline)
+
+    def close(self):
+        self._run(self._async.aclose())
+
+    def get_page(self, path: str, offset: int = 0, limit: int = None,
+                 filter: str = None, fields: list = None, deadline: float = None) -> list:
+        """Fetch one page of a list endpoint and return its `results`."""
+        return self._run(self._async.get_page(path, offset, limit, filter, fields, self._deadline(deadline)))
+
+    def iter_pages(self, path: str, filter: str = None, fields: list = None, deadline: float = None):
+        """
+        Yield every page of a list endpoint, in completion order.
+
+        Up to max_workers pages are requested ahead; once a page comes back
+        short, no further offsets are requested. `deadline` (seconds, default
+        self.deadline) bounds the whole scan; each page gets what is left.
+        """
+        deadline = self._deadline(deadline)
+        pages = queue.Queue()
+        backlog = 2 * self.max_workers
+
+        async def pump():
+            try:
+                async for page in self._async.iter_pages(path, filter, fields, deadline):
+                    # Hold off fetching while the consumer is behind
+                    while pages.qsize() >= backlog:
+                        await asyncio.sleep(0.005)
+                    pages.put(page)
+            except BaseException as e:
+                pages.put(e)
+                raise
+            finally:
+                pages.put(_DONE)
+
+        future = asyncio.run_coroutine_threadsafe(pump(), self._loop)
+        try:
+            while True:
+                item = pages.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    if isinstance(item, asyncio.CancelledError):
+                        return
+                    raise item
+                yield item
+        finally:
+            future.cancel()
+
+    def iter_subnets(self, filter: str = None, fields: list = None, deadline: float = None):
+        """Yield subnet records one by one (pages fetched concurrently)."""
+        for page in self.iter_pages("/ipam/subnet", filter=filter, fields=fields, deadline=deadline):
+            yield from page
+
+    def iter_addresses(self, subnet_id: str):
+        """Yield the allocated addresses (strings) inside a subnet."""
+        pages = self.iter_pages("/ipam/address", filter=f"parent=='{subnet_id}'", fields=["address"])
+        for page in pages:
+            for record in page:
+                yield record["address"]
+
+
+_client = None
+
+
+def get_client():
+    """Shared client configured from the environment, or None without IPAM_API_KEY."""
+    global _client
+    api_key = os.getenv("IPAM_API_KEY")
+    if not api_key:
+        return None
+    if _client is None:
+        _client = InfobloxClient(
+            api_key,
+            base_url=os.getenv("IPAM_BASE_URL", DEFAULT_BASE_URL),
+            page_size=int(os.getenv("IPAM_PAGE_SIZE", "1000")),
+            max_workers=int(os.getenv("IPAM_MAX_CONCURRENCY", "4")),
+            max_retries=int(os.getenv("IPAM_MAX_RETRIES", "4")),
+            deadline=float(os.getenv("IPAM_DEADLINE", "30")),
+        )
+    return _client
@@ -0,0 +1,291 @@
+"""
+IP Utilization History
+======================
+Samples IP utilization per region on a schedule and predicts when each
+region runs out of addresses.
+
+UtilizationRecorder calls a sampler (callable(regions) -> ({region:
+{"total", "used", ...}}, source)) every `interval` seconds and appends one
+fixed-size record per region to a compact binary series on disk. Only
+readings from IPAM itself are recorded (RECORDED_SOURCES); mock data and
+stale last-known-good readings would bend the trend:
+
+    <IPAM_HISTORY_DIR>/<region>.series   float64 triples: timestamp, used, total
+
+After every sample it refits each region's forecast and publishes all of
+them as one snapshot, so forecast lookups are a dictionary read. The fit is
+a least-squares line through the daily peak of used addresses over the last
+`window_days` (peaks, so the daily deploy/teardown cycle does not flatten
+the trend); with less than five days of history it fits the raw samples.
+
+Environment:
+    IPAM_HISTORY_DIR             Directory of the series (default: ~/.devops_agent/ipam_history)
+    IPAM_SAMPLE_INTERVAL         Seconds between samples (default: 3600)
+    IPAM_FORECAST_WINDOW_DAYS    Days of history the forecast fits (default: 14)
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from array import array
+
+from strands.tools import tool
+
+logger = logging.getLogger(__name__)
+
+DAY = 86400
+# Days to exhaustion below which a forecast is flagged
+WARNING_DAYS = 30
+# Utilization percent at which capacity checks stop saying GO
+CAUTION_PERCENT = 80
+# Sampler sources whose readings are recorded
+RECORDED_SOURCES = frozenset({"ipam_api", "ipam_index"})
+
+
+def _linear_fit(xs: list, ys: list) -> tuple:
+    """Least-squares (slope, intercept, r_squared) of ys over xs."""
+    n = len(xs)
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    syy = sum((y - mean_y) ** 2 for y in ys)
+    slope = sxy / sxx if sxx else 0.0
+    r_squared = (sxy * sxy) / (sxx * syy) if sxx and syy else 0.0
+    return slope, mean_y - slope * mean_x, r_squared
+
+
+def forecast_exhaustion(times: array, used: array, total: array, now: float = None,
+                        window_days: int = 14) -> dict:
+    """
+    Predict when used addresses reach the total, from a utilization series.
+
+    Returns:
+        Dict with the growth rate, days until 80% utilization and until
+        exhaustion (None when usage is flat or shrinking), and the fit quality
+    """
+    now = time.time() if now is None else now
+    since = now - window_days * DAY
+    points = [(t, u) for t, u in zip(times, used) if t >= since]
+    if len(points) < 3 or points[-1][0] - points[0][0] < DAY / 4:
+        return {"status": "insufficient_data", "samples": len(points)}
+
+    peaks = {}
+    for t, u in points:
+        day = int(t // DAY)
+        peaks[day] = max(peaks.get(day, 0.0), u)
+    if len(peaks) >= 5:
+        # The first and last day are only partly covered, so their peaks may be missing
+        days = sorted(peaks)[1:-1]
+        xs = [day + 0.5 for day in days]
+        ys = [peaks[day] for day in days]
+        basis = "daily_peak"
+    else:
+        xs = [t / DAY for t, _ in points]
+        ys = [u for _, u in points]
+        basis = "samples"
+    slope, _, r_squared = _linear_fit(xs, ys)
+
+    current_used = used[-1]
+    current_total = total[-1]
+    free = current_total - current_used
+    caution_at = current_total * CAUTION_PERCENT / 100
+
+    def days_until(level: float):
+        if current_used >= level:
+            return 0.0
+        if slope <= 0:
+            return None
+        return round((level - current_used) / slope, 1)
+
+    days_to_exhaustion = days_until(current_total)
+    result = {
+        "status": "ok",
+        "used_ips": int(current_used),
+        "total_ips": int(current_total),
+        "available_ips": max(0, int(free)),
+        "growth_ips_per_day": round(slope, 1),
+        "days_to_80_percent": days_until(caution_at),
+        "days_to_exhaustion": days_to_exhaustion,
+        "exhaustion_date": (
+            time.strftime("%Y-%m-%d", time.gmtime(now + days_to_exhaustion * DAY))
+            if days_to_exhaustion is not None else None
+        ),
+        "r_squared": round(r_squared, 2),
+        "fit": basis,
+        "samples": len(points),
+    }
+    if days_to_exhaustion is not None and days_to_exhaustion < WARNING_DAYS:
+        result["warning"] = f"IPs run out in about {days_to_exhaustion:.0f} days at the current growth rate"
+    return result
+
+
+class UtilizationRecorder:
+    """
+    Records per-region IP utilization and keeps exhaustion forecasts precomputed.
+
+    Args:
+        regions: Region codes to sample
+        sampler: callable(regions) -> ({region: {"total": int, "used": int, ...}}, source)
+        path: Directory of the series files; None keeps samples in memory only
+        interval: Seconds between samples
+        window_days: Days of history each forecast fits
+        retention_days: Samples older than this are dropped when the series is loaded
+    """
+
+    def __init__(self, regions: list, sampler, path: str = None, interval: int = 3600,
+                 window_days: int = 14, retention_days: int = 90):
+        self.regions = list(regions)
+        self.sampler = sampler
+        self.path = path
+        self.interval = interval
+        self.window_days = window_days
+        self.retention_days = retention_days
+        self.series = {}  # region -> (times, used, total) arrays
+        self.forecasts = {}
+        self.sampled_at = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        for region in self.regions:
+            self.series[region] = self._load(region)
+
+    @classmethod
+    def from_env(cls, regions: list, sampler, **kwargs) -> "UtilizationRecorder":
+        """Build with the storage directory, cadence and fit window from the environment."""
+        return cls(
+            regions,
+            sampler,
+            path=os.getenv("IPAM_HISTORY_DIR", os.path.expanduser("~/.devops_agent/ipam_history")),
+            interval=int(os.getenv("IPAM_SAMPLE_INTERVAL", "3600")),
+            window_days=int(os.getenv("IPAM_FORECAST_WINDOW_DAYS", "14")),
+            **kwargs,
+        )
+
+    # Lifecycle
+
+    def start(self) -> "UtilizationRecorder":
+        """Sample in the background (the first sample is taken immediately)."""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="ipam-history", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning("IPAM utilization sample failed: %s", e)
+            if self._stopped.wait(self.interval):
+                return
+
+    # Recording
+
+    def sample(self, now: float = None):
+        """Record one sample for every region and refresh the forecasts."""
+        now = time.time() if now is None else now
+        totals, source = self.sampler(self.regions)
+        if source not in RECORDED_SOURCES:
+            logger.info("IPAM utilization sample skipped (source: %s)", source)
+            totals = {}
+        with self._lock:
+            for region in self.regions:
+                entry = totals.get(region)
+                if not entry or not entry.get("total"):
+                    continue
+                self.record(region, now, entry["used"], entry["total"])
+        self.refresh_forecasts(now)
+        self.sampled_at = now
+
+    def record(self, region: str, timestamp: float, used: int, total: int):
+        times, used_column, total_column = self.series.setdefault(
+            region, (array("d"), array("d"), array("d"))
+        )
+        times.append(timestamp)
+        used_column.append(used)
+        total_column.append(total)
+        if self.path:
+            os.makedirs(self.path, exist_ok=True)
+            with open(self._file(region), "ab") as f:
+                array("d", (timestamp, used, total)).tofile(f)
+
+    def refresh_forecasts(self, now: float = None):
+        forecasts = {}
+        for region, (times, used, total) in self.series.items():
+            if times:
+                forecasts[region] = dict(
+                    forecast_exhaustion(times, used, total, now, self.window_days), region=region
+                )
+        # Swap the whole dict so readers never see a partial update
+        self.forecasts = forecasts
+
+    # Reading
+
+    def forecast(self, region: str) -> dict:
+        """The precomputed forecast for a region."""
+        entry = self.forecasts.get(region)
+        if entry is None:
+            return {"region": region, "status": "not_monitored" if region not in self.regions else "no_data"}
+        return entry
+
+    # Persistence
+
+    def _file(self, region: str) -> str:
+        return os.path.join(self.path, re.sub(r"[^A-Za-z0-9._-]", "_", region) + ".series")
+
+    def _load(self, region: str) -> tuple:
+        times, used, total = array("d"), array("d"), array("d")
+        if not self.path:
+            return times, used, total
+        try:
+            with open(self._file(region), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return times, used, total
+
+        values = array("d")
+        record = 3 * values.itemsize
+        values.frombytes(data[:len(data) - len(data) % record])
+        cutoff = time.time() - self.retention_days * DAY
+        kept = array("d")
+        for i in range(0, len(values), 3):
+            if values[i] >= cutoff:
+                kept.extend(values[i:i + 3])
+        if len(kept) != len(data) // values.itemsize:
+            # Drop expired samples (and any partial record) from the file
+            with open(self._file(region), "wb") as f:
+                kept.tofile(f)
+        return kept[0::3], kept[1::3], kept[2::3]
+
+
+def make_exhaustion_tool(recorder: UtilizationRecorder):
+    """Build a forecast_ip_exhaustion tool that answers from the recorder's forecasts."""
+
+    @tool
+    def forecast_ip_exhaustion(region: str = "all") -> dict:
+        """
+        Predict when a region's subnets run out of IP addresses, from recorded
+        utilization history. Answers instantly from precomputed forecasts; use
+        it to warn about an upcoming NO-GO before it happens.
+
+        Args:
+            region: Region code (e.g., "us-east-1") or "all" for every monitored region
+
+        Returns:
+            Growth in IPs per day, days until 80% utilization and until
+            exhaustion, and a warning when exhaustion is less than 30 days away
+        """
+        if region.lower() == "all":
+            return {"regions": recorder.forecasts, "monitored": recorder.regions}
+        return recorder.forecast(region.lower())
+
+    return forecast_ip_exhaustion
@@ -0,0 +1,337 @@
+"""
+Local Subnet Index
+==================
+In-memory copy of the IPAM subnet inventory, so capacity questions are
+answered locally instead of with a regex filter evaluated by Infoblox on
+every call.
+
+SubnetIndex bulk-loads every subnet once, then applies delta syncs
+(`updated_at>='<last seen>'`) on a fixed cadence and a full reload less often
+(deltas cannot see deletions). Lookups:
+
+    region("us-east-1")        subnets with a tag or comment term starting with it
+    tag("env", "prod")         subnets tagged env=prod (or with an "env" tag)
+    containing("10.1.2.3")     subnets containing an address (CIDR radix tree)
+    within("10.0.0.0/8")       subnets inside a network
+
+utilization(rows) sums their capacity from the column-oriented SubnetTable,
+summary(rows) adds utilization percentiles and per-status counts, and
+group_by("region") breaks the capacity down per region.
+
+Environment:
+    IPAM_INDEX               "off" disables the index (default: on when IPAM_API_KEY is set)
+    IPAM_SYNC_INTERVAL       Seconds between delta syncs (default: 300)
+    IPAM_FULL_SYNC_INTERVAL  Seconds between full reloads (default: 3600)
+    IPAM_INDEX_DEADLINE      Seconds a bulk load or delta sync may take (default: 600)
+"""
+
+import bisect
+import logging
+import os
+import re
+import threading
+import time
+
+from .client import get_client
+from .radix import RadixTree
+from .table import SubnetTable
+
+logger = logging.getLogger(__name__)
+
+SUBNET_FIELDS = ["id", "address", "cidr", "space", "tags", "comment", "utilization", "updated_at"]
+
+_TERM = re.compile(r"[a-z0-9][a-z0-9._:/-]*")
+_REGION_CODE = re.compile(r"^(?:us|eu|ap|sa|ca|me|af|il|mx|cn)(?:-gov)?-[a-z]+-\d+")
+
+
+def _count(value) -> int:
+    return int(value or 0)
+
+
+def _terms(subnet: dict) -> set:
+    """Lower-case words of a subnet's comment and its tag keys and values."""
+    text = [subnet.get("comment") or ""]
+    for key, value in (subnet.get("tags") or {}).items():
+        text.append(str(key))
+        text.append(str(value))
+    return set(_TERM.findall(" ".join(text).lower()))
+
+
+def _region(tags: dict, terms: set):
+    """AWS region of a subnet: its "region" tag, else a region code in its terms."""
+    for key, value in tags.items():
+        if str(key).lower() == "region":
+            return str(value).lower()
+    for term in sorted(terms):
+        match = _REGION_CODE.match(term)
+        if match:
+            return match.group(0)
+    return None
+
+
+class _State:
+    """One generation of the index; full reloads build a new one and swap it in."""
+
+    def __init__(self):
+        self.subnets = {}  # id -> slim record (with its table row)
+        self.table = SubnetTable()
+        self.tree = RadixTree()  # network -> rows
+        self.terms = {}  # term -> rows
+        self.tags = {}  # (key, value) and (key, None) -> rows
+        self._sorted_terms = None
+
+    def add(self, subnet: dict):
+        subnet_id = subnet["id"]
+        util = subnet.get("utilization") or {}
+        tags = dict(subnet.get("tags") or {})
+        terms = _terms(subnet)
+        capacity = (
+            _count(util.get("total")),
+            _count(util.get("used")),
+            _count(util.get("available", util.get("free"))),
+            _region(tags, terms),
+            subnet.get("space"),
+        )
+
+        previous = self.subnets.get(subnet_id)
+        if previous is not None:
+            self._unlink(previous)
+            row = previous["row"]
+            self.table.update(row, *capacity)
+        else:
+            row = self.table.append(subnet_id, *capacity)
+
+        record = {
+            "id": subnet_id,
+            "row": row,
+            "network": f"{subnet['address']}/{subnet['cidr']}",
+            "comment": subnet.get("comment") or "",
+            "tags": tags,
+            "updated_at": subnet.get("updated_at") or "",
+            "terms": terms,
+        }
+        self.subnets[subnet_id] = record
+        self.tree.add(record["network"], row)
+        for term in terms:
+            if term not in self.terms:
+                self._sorted_terms = None
+            self.terms.setdefault(term, set()).add(row)
+        for key, value in tags.items():
+            self.tags.setdefault((str(key).lower(), str(value).lower()), set()).add(row)
+            self.tags.setdefault((str(key).lower(), None), set()).add(row)
+
+    def remove(self, subnet_id: str):
+        record = self.subnets.pop(subnet_id, None)
+        if record is not None:
+            self._unlink(record)
+            self.table.delete(record["row"])
+
+    def _unlink(self, record: dict):
+        row = record["row"]
+        self.tree.discard(record["network"], row)
+        for term in record["terms"]:
+            self.terms[term].discard(row)
+        for key, value in record["tags"].items():
+            self.tags[(str(key).lower(), str(value).lower())].discard(row)
+            self.tags[(str(key).lower(), None)].discard(row)
+
+    def terms_starting_with(self, prefix: str) -> list:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self.terms)
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        end = bisect.bisect_left(self._sorted_terms, prefix + "\uffff")
+        return self._sorted_terms[start:end]
+
+
+class SubnetIndex:
+    """
+    Local, periodically synced index of IPAM subnets.
+
+    Args:
+        client: InfobloxClient to load subnets from
+        sync_interval: Seconds between delta syncs
+        full_sync_interval: Seconds between full reloads
+        deadline: Seconds a bulk load or delta sync may take (longer than
+            the client's per-query deadline, which is sized for tool calls)
+    """
+
+    def __init__(self, client, sync_interval: int = 300, full_sync_interval: int = 3600,
+                 deadline: float = 600):
+        self.client = client
+        self.sync_interval = sync_interval
+        self.full_sync_interval = full_sync_interval
+        self.deadline = deadline
+        self.loaded_at = None  # time of the last full load
+        self.synced_at = None  # time of the last successful sync of any kind
+        self._state = _State()
+        self._cursor = ""  # highest updated_at seen
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def ready(self) -> bool:
+        return self.loaded_at is not None
+
+    def __len__(self) -> int:
+        return len(self._state.subnets)
+
+    # Lifecycle
+
+    def start(self) -> "SubnetIndex":
+        """Sync in the background (the bulk load runs immediately)."""
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="subnet-index", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    # Syncing
+
+    def load(self, filter: str = None) -> int:
+        """Bulk-load every subnet (or those matching `filter`) into a fresh index and swap it in."""
+        state = _State()
+        cursor = ""
+        for subnet in self.client.iter_subnets(filter=filter, fields=SUBNET_FIELDS, deadline=self.deadline):
+            state.add(subnet)
+            cursor = max(cursor, subnet.get("updated_at") or "")
+        now = time.time()
+        with self._lock:
+            self._state = state
+            self._cursor = cursor
+            self.loaded_at = self.synced_at = now
+        return len(state.subnets)
+
+    def sync(self) -> int:
+        """Apply subnets changed since the last sync (full reload when due). Returns the count."""
+        if not self.ready or time.time() - self.loaded_at >= self.full_sync_interval:
+            return self.load()
+        changed = list(self.client.iter_subnets(
+            filter=f"updated_at>='{self._cursor}'" if self._cursor else None,
+            fields=SUBNET_FIELDS,
+            deadline=self.deadline,
+        ))
+        with self._lock:
+            for subnet in changed:
+                self._state.add(subnet)
+                self._cursor = max(self._cursor, subnet.get("updated_at") or "")
+            self.synced_at = time.time()
+        return len(changed)
+
+    def _run(self):
+        while True:
+            try:
+                self.sync()
+            except Exception as e:
+                logger.warning("subnet index sync failed: %s", e)
+            if self._stopped.wait(self.sync_interval):
+                return
+
+    # Lookups (all return sets of table rows)
+
+    def region(self, region: str) -> set:
+        """Subnets whose comment or tags contain a term starting with `region`."""
+        with self._lock:
+            return self._region_rows(region)
+
+    def _region_rows(self, region: str) -> set:
+        state = self._state
+        rows = set()
+        for term in state.terms_starting_with(region.strip().lower()):
+            rows |= state.terms[term]
+        return rows
+
+    def tag(self, key: str, value: str = None) -> set:
+        with self._lock:
+            return set(self._state.tags.get((key.lower(), value.lower() if value else None), ()))
+
+    def containing(self, address: str) -> set:
+        with self._lock:
+            return set(self._state.tree.containing(address))
+
+    def within(self, network: str) -> set:
+        with self._lock:
+            return set(self._state.tree.within(network))
+
+    # Results
+
+    def subnets(self, rows) -> list:
+        """Subnet records for the given rows, with their capacity."""
+        with self._lock:
+            state = self._state
+            table = state.table
+            return [
+                {
+                    "id": record["id"],
+                    "network": record["network"],
+                    "comment": record["comment"],
+                    "tags": record["tags"],
+                    "region": table.values["region"][table.codes["region"][record["row"]]],
+                    "total": table.total[record["row"]],
+                    "used": table.used[record["row"]],
+                    "available": table.available[record["row"]],
+                    "utilization_percent": round(table.utilization[record["row"]], 1),
+                    "updated_at": record["updated_at"],
+                }
+                for record in map(state.subnets.get, table.subnet_ids(rows))
+            ]
+
+    def utilization(self, rows) -> dict:
+        """Summed capacity, shaped like aggregate_utilization()."""
+        with self._lock:
+            return self._state.table.aggregate(rows)
+
+    def summary(self, rows) -> dict:
+        """Summed capacity plus the spread of per-subnet utilization."""
+        with self._lock:
+            return self._summary(rows)
+
+    def _summary(self, rows) -> dict:
+        table = self._state.table
+        ordered = table.sorted_utilization(rows)
+        return dict(
+            table.aggregate(rows),
+            utilization_percentiles=table.percentiles(ordered=ordered),
+            subnets_by_status=table.classify(ordered=ordered),
+        )
+
+    def region_summaries(self, regions: list) -> dict:
+        """summary() of each region's subnets, all from the same index generation."""
+        with self._lock:
+            return {region: self._summary(self._region_rows(region)) for region in regions}
+
+    def group_by(self, column: str, rows=None) -> dict:
+        """utilization() per region or IP space."""
+        with self._lock:
+            return self._state.table.group_by(column, rows)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_subnet_index():
+    """
+    Shared index for the environment's IPAM client, syncing in the background.
+
+    Returns None without IPAM_API_KEY or with IPAM_INDEX=off. The index is
+    not `ready` until its first bulk load finishes.
+    """
+    global _index
+    client = get_client()
+    if client is None or os.getenv("IPAM_INDEX", "on").lower() in ("off", "0", "false"):
+        return None
+    with _index_lock:
+        if _index is None:
+            _index = SubnetIndex(
+                client,
+                sync_interval=int(os.getenv("IPAM_SYNC_INTERVAL", "300")),
+                full_sync_interval=int(os.getenv("IPAM_FULL_SYNC_INTERVAL", "3600")),
+                deadline=float(os.getenv("IPAM_INDEX_DEADLINE", "600")),
+            ).start()
+    return _index
@@ -0,0 +1,139 @@
+"""
+CIDR Radix Tree
+===============
+Path-compressed binary trie (Patricia tree) of IP prefixes.
+
+Each node covers one prefix; nodes with a single child are skipped, so the
+depth is bounded by the number of distinct prefix lengths on a path, not by
+32 or 128 bits. Lookups:
+
+    containing(address)  prefixes containing an address, least specific first
+    within(network)      prefixes inside a network (including itself)
+
+IPv4 and IPv6 live in separate trees.
+"""
+
+import ipaddress
+
+
+class _Node:
+    __slots__ = ("prefix", "length", "children", "values")
+
+    def __init__(self, prefix: int, length: int):
+        self.prefix = prefix
+        self.length = length
+        self.children = [None, None]
+        self.values = None  # set of values stored at exactly this prefix
+
+
+class RadixTree:
+    """Maps IP networks to sets of values (e.g. subnet ids)."""
+
+    def __init__(self):
+        self._roots = {4: _Node(0, 0), 6: _Node(0, 0)}
+        self._bits = {4: 32, 6: 128}
+
+    def _key(self, network) -> tuple:
+        if not isinstance(network, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+            network = ipaddress.ip_network(network, strict=False)
+        return network.version, int(network.network_address), network.prefixlen
+
+    def _bit(self, value: int, position: int, bits: int) -> int:
+        return (value >> (bits - 1 - position)) & 1
+
+    @staticmethod
+    def _common(a: int, b: int, bits: int) -> int:
+        """Number of leading bits a and b share."""
+        return bits - (a ^ b).bit_length()
+
+    def _matches(self, node: _Node, value: int, bits: int) -> bool:
+        shift = bits - node.length
+        return node.length == 0 or (value >> shift) == (node.prefix >> shift)
+
+    # Writing
+
+    def add(self, network, value):
+        """Store `value` under a network ("10.0.0.0/24" or an ip_network)."""
+        version, prefix, length = self._key(network)
+        bits = self._bits[version]
+        node = self._roots[version]
+        while True:
+            if node.length == length:
+                if node.values is None:
+                    node.values = set()
+                node.values.add(value)
+                return
+            side = self._bit(prefix, node.length, bits)
+            child = node.children[side]
+            if child is None:
+                leaf = node.children[side] = _Node(prefix, length)
+                leaf.values = {value}
+                return
+
+            common = min(child.length, length, self._common(child.prefix, prefix, bits))
+            if common == child.length:
+                node = child
+                continue
+
+            # Split the edge: a node for the shared prefix takes both branches
+            mask = ((1 << common) - 1) << (bits - common) if common else 0
+            branch = node.children[side] = _Node(prefix & mask, common)
+            branch.children[self._bit(child.prefix, common, bits)] = child
+            if common == length:
+                branch.values = {value}
+            else:
+                leaf = branch.children[self._bit(prefix, common, bits)] = _Node(prefix, length)
+                leaf.values = {value}
+            return
+
+    def discard(self, network, value):
+        """Remove `value` from a network if present (empty nodes are left in place)."""
+        node = self._find(network)
+        if node is not None and node.values:
+            node.values.discard(value)
+
+    # Reading
+
+    def _find(self, network):
+        version, prefix, length = self._key(network)
+        bits = self._bits[version]
+        node = self._roots[version]
+        while node is not None and node.length < length:
+            node = node.children[self._bit(prefix, node.length, bits)]
+        if node is not None and node.length == length and node.prefix == prefix:
+            return node
+        return None
+
+    def containing(self, address) -> list:
+        """Values of every prefix containing an address or network, least specific first."""
+        version, value, length = self._key(address)
+        bits = self._bits[version]
+        node = self._roots[version]
+        found = []
+        while node is not None and node.length <= length and self._matches(node, value, bits):
+            if node.values:
+                found.extend(node.values)
+            if node.length == bits:
+                break
+            node = node.children[self._bit(value, node.length, bits)]
+        return found
+
+    def within(self, network) -> list:
+        """Values of every prefix inside a network (the network itself included)."""
+        version, prefix, length = self._key(network)
+        bits = self._bits[version]
+        node = self._roots[version]
+        # Walk down to the first node at or below the network's prefix length
+        while node is not None and node.length < length:
+            node = node.children[self._bit(prefix, node.length, bits)]
+        if node is None or not self._matches(_Node(prefix, length), node.prefix, bits):
+            return []
+
+        found = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.values:
+                found.extend(node.values)
+            stack.extend(child for child in node.children if child is not None)
+        return found
@@ -0,0 +1,300 @@
+"""
+Infoblox CSP Stand-in
+=====================
+Local HTTP server that answers the Infoblox CSP DDI endpoints the IPAM tools
+use, from a SyntheticIPAM dataset, so pagination, the subnet index and
+capacity aggregation can be exercised and benchmarked without an account.
+
+    GET <base>/ipam/subnet    _offset, _limit, _filter, _fields
+    GET <base>/ipam/address   _filter=parent=='<subnet id>'
+
+Filters support the CSP forms used here: `field~'regex'`, `field=='value'`,
+`field>='value'` (and >, <, <=), combined with `and` / `or` and
+parentheses; `tags~` matches tag keys and values. Matches for a filter are
+computed once and cached, so paging through a result set is cheap.
+Requests need an `Authorization: Token ...` header, like the real API.
+
+Run:
+    python -m src.ipam.standin --subnets 100000 --seed 7 --port 8765
+    export IPAM_BASE_URL=http://127.0.0.1:8765/api/ddi/v1 IPAM_API_KEY=synthetic
+
+    # Or time the IPAM code paths against it and exit:
+    python -m src.ipam.standin --subnets 100000 --bench us-east-1
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from .synthetic import SyntheticIPAM
+
+DEFAULT_PORT = 8765
+MAX_PAGE_SIZE = 10000
+
+_TOKEN = re.compile(r"\s*(?:(\()|(\))|(and|or)\b|([a-z_.]+)\s*(~|==|!=|>=|<=|>|<)\s*'((?:[^'\\]|\\.)*)')", re.I)
+
+
+class FilterError(ValueError):
+    pass
+
+
+def parse_filter(text: str):
+    """Compile a CSP `_filter` expression into a predicate on a record dict."""
+    tokens = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if not match:
+            raise FilterError(f"Cannot parse filter at: {text[position:]!r}")
+        tokens.append(match.groups())
+        position = match.end()
+        while position < len(text) and text[position].isspace():
+            position += 1
+
+    def expression(i):
+        left, i = term(i)
+        while i < len(tokens) and (tokens[i][2] or "").lower() == "or":
+            right, i = term(i + 1)
+            left = (lambda a, b: lambda record: a(record) or b(record))(left, right)
+        return left, i
+
+    def term(i):
+        left, i = factor(i)
+        while i < len(tokens) and (tokens[i][2] or "").lower() == "and":
+            right, i = factor(i + 1)
+            left = (lambda a, b: lambda record: a(record) and b(record))(left, right)
+        return left, i
+
+    def factor(i):
+        if i >= len(tokens):
+            raise FilterError("Filter ends early")
+        opening, _, _, field, operator, value = tokens[i]
+        if opening:
+            inner, i = expression(i + 1)
+            if i >= len(tokens) or not tokens[i][1]:
+                raise FilterError("Missing closing parenthesis")
+            return inner, i + 1
+        if not field:
+            raise FilterError(f"Expected a comparison, got {tokens[i]}")
+        return _comparison(field, operator, value.replace("\\'", "'")), i + 1
+
+    predicate, end = expression(0)
+    if end != len(tokens):
+        raise FilterError("Unexpected tokens at the end of the filter")
+    return predicate
+
+
+def _comparison(field: str, operator: str, value: str):
+    if operator == "~":
+        try:
+            pattern = re.compile(value, re.I)
+        except re.error as e:
+            raise FilterError(f"Bad pattern for {field}: {e}")
+        if field == "tags":
+            return lambda record: any(
+                pattern.search(str(k)) or pattern.search(str(v))
+                for k, v in (record.get("tags") or {}).items()
+            )
+        return lambda record: bool(pattern.search(str(record.get(field) or "")))
+
+    compare = {
+        "==": lambda a, b: a == b,
+        "!=": lambda a, b: a != b,
+        ">=": lambda a, b: a >= b,
+        "<=": lambda a, b: a <= b,
+        ">": lambda a, b: a > b,
+        "<": lambda a, b: a < b,
+    }[operator]
+    return lambda record: compare(str(record.get(field, "")), value)
+
+
+class StandInIPAM:
+    """
+    Query engine over a SyntheticIPAM (used by the HTTP handler).
+
+    Args:
+        dataset: The SyntheticIPAM to serve
+        cache_size: Filters whose matches are kept
+    """
+
+    def __init__(self, dataset: SyntheticIPAM, cache_size: int = 32):
+        self.dataset = dataset
+        self.cache_size = cache_size
+        self._matches = OrderedDict()  # filter -> (dataset version, matching rows)
+        self._lock = threading.Lock()
+        self.version = 0  # bumped by churn()
+
+    def _rows(self, filter: str) -> list:
+        if not filter:
+            return range(len(self.dataset))
+        with self._lock:
+            cached = self._matches.get(filter)
+            if cached is not None and cached[0] == self.version:
+                self._matches.move_to_end(filter)
+                return cached[1]
+        predicate = parse_filter(filter)
+        version = self.version
+        rows = [i for i in range(len(self.dataset)) if predicate(self.dataset.record(i))]
+        with self._lock:
+            self._matches[filter] = (version, rows)
+            while len(self._matches) > self.cache_size:
+                self._matches.popitem(last=False)
+        return rows
+
+    def subnets(self, offset: int = 0, limit: int = 1000, filter: str = None, fields: list = None) -> list:
+        rows = self._rows(filter)[offset:offset + min(limit, MAX_PAGE_SIZE)]
+        records = [self.dataset.record(i) for i in rows]
+        if fields:
+            records = [{k: record[k] for k in fields if k in record} for record in records]
+        return records
+
+    def addresses(self, offset: int = 0, limit: int = 1000, filter: str = None, fields: list = None) -> list:
+        match = re.fullmatch(r"\s*parent\s*==\s*'([^']*)'\s*", filter or "")
+        if not match:
+            raise FilterError("Address queries need a parent=='<subnet id>' filter")
+        i = self.dataset.index_of(match.group(1))
+        addresses = self.dataset.addresses(i) if i >= 0 else []
+        return [{"address": address, "parent": match.group(1)}
+                for address in addresses[offset:offset + min(limit, MAX_PAGE_SIZE)]]
+
+    def churn(self, count: int, rng: random.Random = None):
+        """Update `count` random subnets (see SyntheticIPAM.churn) and invalidate cached filters."""
+        self.dataset.churn(count, rng)
+        self.version += 1
+
+
+def make_handler(engine: StandInIPAM, latency: float = 0.0):
+    """Build a request handler class serving `engine`."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status: int, body: dict):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            if not self.headers.get("Authorization", "").startswith("Token "):
+                return self._send(401, {"error": [{"message": "missing API token"}]})
+
+            url = urlsplit(self.path)
+            query = dict(parse_qsl(url.query))
+            endpoints = {"/ipam/subnet": engine.subnets, "/ipam/address": engine.addresses}
+            endpoint = next((fn for path, fn in endpoints.items() if url.path.endswith(path)), None)
+            if endpoint is None:
+                return self._send(404, {"error": [{"message": f"unknown path {url.path}"}]})
+            try:
+                results = endpoint(
+                    offset=int(query.get("_offset", 0)),
+                    limit=int(query.get("_limit", 1000)),
+                    filter=query.get("_filter"),
+                    fields=query["_fields"].split(",") if query.get("_fields") else None,
+                )
+            except ValueError as e:
+                return self._send(400, {"error": [{"message": str(e)}]})
+            self._send(200, {"results": results})
+
+    return Handler
+
+
+def serve(dataset: SyntheticIPAM, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+          latency: float = 0.0) -> tuple:
+    """Start the stand-in in a background thread. Returns (server, engine)."""
+    engine = StandInIPAM(dataset)
+    server = ThreadingHTTPServer((host, port), make_handler(engine, latency))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="ipam-standin", daemon=True).start()
+    return server, engine
+
+
+def benchmark(base_url: str, region: str, engine: StandInIPAM, page_size: int = 1000,
+              max_workers: int = 4) -> dict:
+    """Time the paged API query, the index bulk load and index lookups for a region."""
+    from .client import InfobloxClient, aggregate_utilization, region_filter
+    from .index import SubnetIndex
+
+    client = InfobloxClient("synthetic", base_url=base_url, page_size=page_size,
+                            max_workers=max_workers, timeout=60)
+    timings = {}
+
+    def timed(name, fn):
+        start = time.perf_counter()
+        result = fn()
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+        return result
+
+    # The first query of a filter pays for evaluating it on the server
+    timed("api_first_query_ms", lambda: aggregate_utilization(
+        client.iter_pages("/ipam/subnet", filter=region_filter(region), fields=["utilization"])))
+    api = timed("api_query_ms", lambda: aggregate_utilization(
+        client.iter_pages("/ipam/subnet", filter=region_filter(region), fields=["utilization"])))
+    index = SubnetIndex(client)
+    timed("index_load_ms", index.load)
+    rows = timed("index_lookup_ms", lambda: index.region(region))
+    summary = timed("index_summary_ms", lambda: index.summary(rows))
+    timed("index_group_by_region_ms", lambda: index.group_by("region"))
+    engine.churn(max(1, len(engine.dataset) // 1000))
+    changed = timed("index_delta_sync_ms", index.sync)
+
+    return {
+        "subnets": len(engine.dataset),
+        "region": region,
+        "region_subnets": api["subnets"],
+        "totals_match": all(api[k] == summary[k] for k in ("subnets", "total", "used", "available")),
+        "delta_synced": changed,
+        **timings,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a synthetic Infoblox CSP IPAM dataset")
+    parser.add_argument("--subnets", type=int, default=100_000, help="Subnets to generate (default: 100000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Delay added to every request, to mimic a remote API (default: 0)")
+    parser.add_argument("--churn", type=int, default=0,
+                        help="Subnets changed per minute, to exercise delta syncs (default: 0)")
+    parser.add_argument("--bench", metavar="REGION",
+                        help="Benchmark the IPAM code paths for a region, print the timings and exit")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    dataset = SyntheticIPAM(args.subnets, seed=args.seed)
+    print(f"✓ Generated {len(dataset)} subnets in {time.perf_counter() - started:.1f}s (seed {args.seed})")
+    server, engine = serve(dataset, args.host, args.port, args.latency_ms / 1000)
+    base_url = f"http://{args.host}:{server.server_address[1]}/api/ddi/v1"
+
+    if args.bench:
+        print(json.dumps(benchmark(base_url, args.bench, engine), indent=2))
+        server.shutdown()
+        return
+
+    print(f"✓ Serving on {base_url}")
+    print(f"  export IPAM_BASE_URL={base_url} IPAM_API_KEY=synthetic")
+    try:
+        while True:
+            time.sleep(60)
+            if args.churn:
+                engine.churn(args.churn)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Synthetic IPAM Dataset
+======================
+Seeded, production-sized subnet inventories for benchmarking the IPAM code
+paths offline (see standin.py for serving one over HTTP).
+
+SyntheticIPAM(count, seed) generates `count` subnets (10k - 1M) with skewed
+distributions similar to a real enterprise estate:
+
+    region      a few large regions (us-east-1 ~30%) and a long tail
+    size        mostly /24 and /26, some /22-/23 and small /27-/28
+    utilization most subnets 10-50% used, a busy group, and ~8% nearly full
+    tags        region, env (prod/staging/dev), team (Zipf-distributed), tier
+    comment     "<region> <env> <tier> subnet for <team>"
+
+Subnets are carved sequentially out of 10.0.0.0/8, opening a new IP space
+when one fills up. Everything is stored in `array` columns (about 30 bytes
+per subnet); CSP-shaped records are built on demand by record(i), and
+allocated addresses by addresses(i).
+
+The same seed always gives the same dataset.
+"""
+
+import ipaddress
+import random
+import time
+from array import array
+
+REGION_WEIGHTS = (
+    ("us-east-1", 30), ("us-west-2", 18), ("eu-west-1", 14), ("eu-central-1", 9),
+    ("ap-southeast-1", 8), ("ap-northeast-1", 7), ("us-east-2", 6), ("ap-south-1", 4),
+    ("sa-east-1", 2), ("ca-central-1", 2),
+)
+ENV_WEIGHTS = (("prod", 45), ("staging", 20), ("dev", 35))
+PREFIX_WEIGHTS = ((22, 5), (23, 8), (24, 50), (25, 10), (26, 20), (27, 4), (28, 3))
+TIERS = ("web", "app", "db", "cache", "batch")
+TEAMS = tuple(f"team-{i:02d}" for i in range(40))
+# Zipf-like: a few teams own most subnets
+TEAM_WEIGHTS = tuple(1 / (rank + 1) for rank in range(len(TEAMS)))
+
+BASE_NETWORK = int(ipaddress.IPv4Address("10.0.0.0"))
+SPACE_SIZE = 1 << 24  # a /8 per IP space
+
+# Updates are spread over the last 180 days before this moment
+EPOCH = 1_760_000_000
+
+
+def _utilization(rng: random.Random) -> float:
+    draw = rng.random()
+    if draw < 0.70:
+        return rng.betavariate(2, 5)  # mostly 10-50% used
+    if draw < 0.92:
+        return rng.betavariate(5, 2)  # busy
+    return rng.betavariate(20, 1)  # nearly full
+
+
+def _timestamp(epoch: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch))
+
+
+class SyntheticIPAM:
+    """
+    A generated subnet inventory.
+
+    Args:
+        count: Number of subnets
+        seed: Random seed
+    """
+
+    def __init__(self, count: int = 10_000, seed: int = 0):
+        self.count = count
+        self.seed = seed
+        rng = random.Random(seed)
+
+        self.network = array("L")
+        self.cidr = array("B")
+        self.space = array("H")
+        self.region = array("B")
+        self.env = array("B")
+        self.team = array("B")
+        self.tier = array("B")
+        self.total = array("L")
+        self.used = array("L")
+        self.updated = array("L")
+
+        regions = [code for code, _ in REGION_WEIGHTS]
+        prefixes = [prefix for prefix, _ in PREFIX_WEIGHTS]
+        draws = {
+            "region": rng.choices(range(len(regions)), [w for _, w in REGION_WEIGHTS], k=count),
+            "env": rng.choices(range(len(ENV_WEIGHTS)), [w for _, w in ENV_WEIGHTS], k=count),
+            "team": rng.choices(range(len(TEAMS)), TEAM_WEIGHTS, k=count),
+            "prefix": rng.choices(prefixes, [w for _, w in PREFIX_WEIGHTS], k=count),
+        }
+        self.regions = regions
+
+        space, cursor = 0, 0
+        for i in range(count):
+            prefix = draws["prefix"][i]
+            size = 1 << (32 - prefix)
+            cursor = (cursor + size - 1) & ~(size - 1)  # align to the block size
+            if cursor + size > SPACE_SIZE:
+                space, cursor = space + 1, 0
+            self.network.append(BASE_NETWORK + cursor)
+            self.cidr.append(prefix)
+            self.space.append(space)
+            cursor += size
+
+            self.region.append(draws["region"][i])
+            self.env.append(draws["env"][i])
+            self.team.append(draws["team"][i])
+            self.tier.append(rng.randrange(len(TIERS)))
+            total = size - 2  # network and broadcast addresses are not usable
+            self.total.append(total)
+            self.used.append(min(total, round(_utilization(rng) * total)))
+            self.updated.append(EPOCH - rng.randrange(180 * 86400))
+
+    def __len__(self) -> int:
+        return self.count
+
+    # Records
+
+    def subnet_id(self, i: int) -> str:
+        return f"ipam/subnet/syn-{self.seed}-{i:07d}"
+
+    def index_of(self, subnet_id: str) -> int:
+        """Row of a subnet id produced by subnet_id(), or -1."""
+        prefix = f"ipam/subnet/syn-{self.seed}-"
+        if not subnet_id.startswith(prefix):
+            return -1
+        try:
+            i = int(subnet_id[len(prefix):])
+        except ValueError:
+            return -1
+        return i if 0 <= i < self.count else -1
+
+    def record(self, i: int) -> dict:
+        """Subnet i in the shape of an Infoblox CSP /ipam/subnet result."""
+        region = self.regions[self.region[i]]
+        env = ENV_WEIGHTS[self.env[i]][0]
+        team = TEAMS[self.team[i]]
+        tier = TIERS[self.tier[i]]
+        total, used = self.total[i], self.used[i]
+        return {
+            "id": self.subnet_id(i),
+            "address": str(ipaddress.IPv4Address(self.network[i])),
+            "cidr": self.cidr[i],
+            "space": f"ipam/ip_space/syn-{self.space[i]}",
+            "comment": f"{region} {env} {tier} subnet for {team}",
+            "tags": {"region": region, "env": env, "team": team, "tier": tier},
+            # CSP encodes the counters as strings
+            "utilization": {"total": str(total), "used": str(used), "free": str(total - used)},
+            "updated_at": _timestamp(self.updated[i]),
+        }
+
+    def addresses(self, i: int) -> list:
+        """
+        Allocated addresses of subnet i: handed out from the bottom of the
+        subnet with about one in ten released again, so free space is fragmented.
+        """
+        used = self.used[i]
+        holes = min(used // 10, self.total[i] - used)
+        handed_out = list(range(1, used + holes + 1))
+        rng = random.Random(f"{self.seed}-{i}")
+        for offset in rng.sample(handed_out, holes):
+            handed_out.remove(offset)
+        base = self.network[i]
+        return [str(ipaddress.IPv4Address(base + offset)) for offset in handed_out]
+
+    # Changes
+
+    def churn(self, count: int, rng: random.Random = None, now: float = None):
+        """Change the utilization of `count` random subnets and bump their updated_at."""
+        rng = rng or random.Random()
+        now = int(time.time() if now is None else now)
+        for i in rng.sample(range(self.count), min(count, self.count)):
+            total = self.total[i]
+            self.used[i] = max(0, min(total, self.used[i] + rng.randint(-total // 10, total // 5)))
+            self.updated[i] = now
@@ -0,0 +1,142 @@
+"""
+Subnet Table
+============
+Column-oriented capacity data for the subnet index.
+
+Every subnet is a row; total / used / available / utilization live in
+typed `array` columns and region / IP space are dictionary-encoded integer
+columns. Aggregates over a set of rows run as C-level passes over the
+columns (sum(map(column.__getitem__, rows))), percentiles and threshold
+classification come from one sorted utilization column, and group-bys
+intersect row sets kept per group value - no per-subnet dicts are touched.
+
+    table.aggregate(rows)                  {"subnets", "total", "used", "available"}
+    table.percentiles(rows, (50, 90, 99))  utilization percent at each point
+    table.classify(rows)                   {"healthy": n, "warning": n, "critical": n}
+    table.group_by("region", rows)         aggregate() per region
+"""
+
+import bisect
+from array import array
+
+# Per-subnet utilization percent: below 80 healthy, below 95 warning, else critical
+STATUS_THRESHOLDS = (80.0, 95.0)
+STATUS_NAMES = ("healthy", "warning", "critical")
+
+GROUP_COLUMNS = ("region", "space")
+
+
+class SubnetTable:
+    """Append-only rows of subnet capacity; deleted rows are zeroed and dropped from groups."""
+
+    def __init__(self):
+        self.ids = []  # row -> subnet id (None once deleted)
+        self.total = array("q")
+        self.used = array("q")
+        self.available = array("q")
+        self.utilization = array("d")
+        self.codes = {name: array("i") for name in GROUP_COLUMNS}
+        self.values = {name: [] for name in GROUP_COLUMNS}  # code -> value
+        self._encode = {name: {} for name in GROUP_COLUMNS}  # value -> code
+        self.groups = {name: {} for name in GROUP_COLUMNS}  # code -> rows
+        self.live = set()
+
+    def __len__(self) -> int:
+        return len(self.live)
+
+    # Writing
+
+    def _code(self, name: str, value) -> int:
+        codes = self._encode[name]
+        if value not in codes:
+            codes[value] = len(self.values[name])
+            self.values[name].append(value)
+        return codes[value]
+
+    def append(self, subnet_id: str, total: int, used: int, available: int,
+               region: str = None, space: str = None) -> int:
+        """Add a subnet and return its row."""
+        row = len(self.ids)
+        self.ids.append(subnet_id)
+        for column in (self.total, self.used, self.available):
+            column.append(0)
+        self.utilization.append(0.0)
+        for name in GROUP_COLUMNS:
+            self.codes[name].append(-1)
+        self.update(row, total, used, available, region, space)
+        return row
+
+    def update(self, row: int, total: int, used: int, available: int,
+               region: str = None, space: str = None):
+        """Overwrite a row in place."""
+        self.total[row] = total
+        self.used[row] = used
+        self.available[row] = available
+        self.utilization[row] = used / total * 100 if total > 0 else 0.0
+        for name, value in zip(GROUP_COLUMNS, (region, space)):
+            self._ungroup(name, row)
+            code = self._code(name, value)
+            self.codes[name][row] = code
+            self.groups[name].setdefault(code, set()).add(row)
+        self.live.add(row)
+
+    def delete(self, row: int):
+        self.update(row, 0, 0, 0)
+        for name in GROUP_COLUMNS:
+            self._ungroup(name, row)
+            self.codes[name][row] = -1
+        self.ids[row] = None
+        self.live.discard(row)
+
+    def _ungroup(self, name: str, row: int):
+        code = self.codes[name][row]
+        if code >= 0:
+            self.groups[name][code].discard(row)
+
+    # Reading
+
+    def aggregate(self, rows=None) -> dict:
+        """Summed capacity of the given rows (default: every live row)."""
+        rows = self.live if rows is None else rows
+        return {
+            "subnets": len(rows),
+            "total": sum(map(self.total.__getitem__, rows)),
+            "used": sum(map(self.used.__getitem__, rows)),
+            "available": sum(map(self.available.__getitem__, rows)),
+        }
+
+    def sorted_utilization(self, rows=None) -> array:
+        rows = self.live if rows is None else rows
+        return array("d", sorted(map(self.utilization.__getitem__, rows)))
+
+    def percentiles(self, rows=None, points=(50, 90, 95, 99), ordered: array = None) -> dict:
+        """Per-subnet utilization percent at each percentile (nearest rank)."""
+        ordered = self.sorted_utilization(rows) if ordered is None else ordered
+        if not ordered:
+            return {}
+        result = {}
+        for point in points:
+            rank = max(0, min(len(ordered) - 1, -(-point * len(ordered) // 100) - 1))
+            result[f"p{point}"] = round(ordered[rank], 1)
+        result["max"] = round(ordered[-1], 1)
+        return result
+
+    def classify(self, rows=None, thresholds=STATUS_THRESHOLDS, ordered: array = None) -> dict:
+        """Number of subnets per utilization band (see STATUS_THRESHOLDS)."""
+        ordered = self.sorted_utilization(rows) if ordered is None else ordered
+        # The column is sorted, so each band boundary is one binary search
+        bounds = [0] + [bisect.bisect_left(ordered, t) for t in thresholds] + [len(ordered)]
+        return {name: bounds[i + 1] - bounds[i] for i, name in enumerate(STATUS_NAMES)}
+
+    def group_by(self, name: str, rows=None) -> dict:
+        """aggregate() for each value of a group column ("region" or "space")."""
+        rows = self.live if rows is None else set(rows)
+        result = {}
+        for code, members in self.groups[name].items():
+            selected = members & rows
+            if selected:
+                result[self.values[name][code]] = self.aggregate(selected)
+        return result
+
+    def subnet_ids(self, rows) -> list:
+        return [self.ids[row] for row in rows if self.ids[row] is not None]
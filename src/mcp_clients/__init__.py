@@ -0,0 +1,18 @@
+# Shared MCP connection management for the DevOps agent
+from .catalog import ToolCatalog, tool_catalog, stdio_server_key, http_server_key
+from .gateway_pool import CognitoTokenProvider, GatewaySessionPool
+from .server_pool import FETCH_SERVER, StdioServerPool, get_server_pool
+from .lazy import LazyMCPClient
+
+__all__ = [
+    "ToolCatalog",
+    "tool_catalog",
+    "stdio_server_key",
+    "http_server_key",
+    "CognitoTokenProvider",
+    "GatewaySessionPool",
+    "FETCH_SERVER",
+    "StdioServerPool",
+    "get_server_pool",
+    "LazyMCPClient",
+]
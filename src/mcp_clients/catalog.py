@@ -0,0 +1,168 @@
+"""
+MCP Tool Catalog
+================
+Caches MCP tool schemas so agents can be built without a `tools/list`
+round-trip on every construction.
+
+Entries are keyed by server identity (the stdio command line or the HTTP
+URL), kept in memory and mirrored to JSON files on disk so a new process
+(e.g. every Lambda or AgentCore cold start) builds its agent without
+connecting to the server. An entry is dropped when its TTL expires, and replaced
+as soon as the server sends a `tools/list_changed` notification (on Strands
+versions whose MCPClient exposes `on_tools_changed`).
+
+Environment:
+    MCP_TOOL_CACHE_DIR  Directory for the on-disk cache (default: ~/.devops_agent/mcp_tools; "off" keeps it in memory)
+    MCP_TOOL_CACHE_TTL  Seconds a cached tool list stays valid (default: 3600)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from mcp.types import Tool as MCPTool
+from strands.tools.mcp import MCPAgentTool
+
+logger = logging.getLogger(__name__)
+
+
+def stdio_server_key(command: str, args: list) -> str:
+    """Identity of a stdio MCP server."""
+    return "stdio:" + " ".join([command, *args])
+
+
+def http_server_key(url: str) -> str:
+    """Identity of a streamable HTTP MCP server."""
+    return f"http:{url}"
+
+
+class ToolCatalog:
+    """
+    In-memory (and optionally on-disk) cache of MCP tool definitions.
+
+    Args:
+        ttl: Seconds a cached tool list stays valid
+        cache_dir: Directory for JSON cache files; None keeps the cache in memory
+    """
+
+    def __init__(self, ttl: int = 3600, cache_dir: str = None):
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self._entries = {}  # key -> (fetched_at, [mcp.types.Tool])
+        self._lock = threading.Lock()
+
+    def get_tools(self, client, key: str) -> list:
+        """
+        Return agent tools for the server behind `client`.
+
+        Serves cached schemas when fresh, otherwise lists the tools on the
+        (already started) client and caches them. The returned tools call
+        through `client`.
+        """
+        self.watch(client, key)
+        mcp_tools = self.cached(key)
+        if mcp_tools is None:
+            mcp_tools = [tool.mcp_tool for tool in client.list_tools_sync()]
+            self.store(key, mcp_tools)
+        return [MCPAgentTool(mcp_tool, client) for mcp_tool in mcp_tools]
+
+    def cached(self, key: str):
+        """Return the cached mcp.types.Tool list for `key`, or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            entry = self._read(key)
+            if entry is not None:
+                with self._lock:
+                    self._entries[key] = entry
+
+        if entry is None or time.time() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+
+    def store(self, key: str, mcp_tools: list):
+        """Cache a tool list for `key`."""
+        entry = (time.time(), list(mcp_tools))
+        with self._lock:
+            self._entries[key] = entry
+        self._write(key, entry)
+
+    def invalidate(self, key: str = None):
+        """Drop one entry, or every entry when key is None."""
+        with self._lock:
+            keys = [key] if key else list(self._entries)
+            for k in keys:
+                self._entries.pop(k, None)
+        for k in keys:
+            path = self._path(k)
+            if path and os.path.exists(path):
+                os.remove(path)
+
+    def watch(self, client, key: str):
+        """Refresh the entry when the server announces a tool list change.
+
+        Call before client.start(): servers on newer MCP protocol versions only
+        publish change notifications to clients that subscribed at startup.
+        """
+        if not hasattr(client, "on_tools_changed") or client.on_tools_changed is not None:
+            return
+
+        def on_tools_changed(previous_names, refreshed_tools, **kwargs):
+            logger.info("tools/list_changed from %s, refreshing cached catalog", key)
+            self.store(key, [tool.mcp_tool for tool in refreshed_tools])
+
+        client.on_tools_changed = on_tools_changed
+
+    # On-disk cache
+
+    def _path(self, key: str):
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"mcp-tools-{digest}.json")
+
+    def _read(self, key: str):
+        path = self._path(key)
+        if not path:
+            return None
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data.get("server") != key:
+                return None
+            return data["fetched_at"], [MCPTool.model_validate(t) for t in data["tools"]]
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError) as e:
+            logger.warning("ignoring unreadable MCP tool cache %s: %s", path, e)
+            return None
+
+    def _write(self, key: str, entry: tuple):
+        path = self._path(key)
+        if not path:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        data = {
+            "server": key,
+            "fetched_at": entry[0],
+            "tools": [t.model_dump(mode="json", by_alias=True, exclude_none=True) for t in entry[1]],
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+
+# Shared catalog used by the agent entry points
+def _cache_dir():
+    configured = os.getenv("MCP_TOOL_CACHE_DIR", os.path.expanduser("~/.devops_agent/mcp_tools"))
+    return None if configured.lower() in ("", "off") else configured
+
+
+tool_catalog = ToolCatalog(
+    ttl=int(os.getenv("MCP_TOOL_CACHE_TTL", "3600")),
+    cache_dir=_cache_dir(),
+)
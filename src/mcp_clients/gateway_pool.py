@@ -0,0 +1,336 @@
+"""
+Gateway Session Pool
+====================
+Long-lived, shared MCP sessions to an AgentCore Gateway.
+
+Opening an MCPClient per request costs a new HTTP session plus the MCP
+`initialize` handshake. GatewaySessionPool keeps a small number of sessions
+open and shares them across threads:
+
+- Access tokens are cached and refreshed before they expire; a session is
+  rotated onto a fresh token without interrupting calls already in flight.
+- A keep-alive thread probes idle sessions and reconnects broken ones.
+- A call that finds its session dead (including the transport errors Strands
+  returns as error results: 401, closed stream) reconnects and retries once.
+
+Usage:
+    tokens = CognitoTokenProvider.from_config(load_cognito_config())
+    pool = GatewaySessionPool(gateway_url, tokens).start()
+    agent = Agent(model=model, tools=pool.list_tools())   # per request, cached schemas
+    ...
+    pool.close()                                           # on shutdown
+"""
+
+import base64
+import logging
+import threading
+import time
+
+import requests
+from strands.tools.mcp import MCPClient
+from strands.types.exceptions import MCPClientInitializationError
+
+from .catalog import http_server_key, tool_catalog
+
+logger = logging.getLogger(__name__)
+
+
+class CognitoTokenProvider:
+    """Thread-safe client_credentials token cache for a Cognito App Client."""
+
+    def __init__(self, token_url: str, client_id: str, client_secret: str, refresh_margin: int = 120):
+        self.token_url = token_url
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_margin = refresh_margin
+        self._token = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, cognito_config: dict, **kwargs) -> "CognitoTokenProvider":
+        """Build from a cognito_config.json dict (Step 7a)."""
+        return cls(
+            cognito_config["token_url"],
+            cognito_config["client_id"],
+            cognito_config["client_secret"],
+            **kwargs,
+        )
+
+    def token(self) -> tuple:
+        """Return (access_token, expires_at), fetching a new token when close to expiry."""
+        with self._lock:
+            if self._token is None or time.time() >= self._expires_at - self.refresh_margin:
+                self._fetch()
+            return self._token, self._expires_at
+
+    def _fetch(self):
+        credentials = f"{self.client_id}:{self.client_secret}"
+        encoded_credentials = base64.b64encode(credentials.encode()).decode()
+        response = requests.post(
+            self.token_url,
+            headers={
+                "Authorization": f"Basic {encoded_credentials}",
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+            data={"grant_type": "client_credentials"},
+            timeout=10,
+        )
+        if response.status_code != 200:
+            raise Exception(f"Token request failed: {response.text}")
+
+        token_data = response.json()
+        self._token = token_data["access_token"]
+        self._expires_at = time.time() + token_data.get("expires_in", 3600)
+
+
+# Transport failures that Strands reports as "Tool execution failed: ..."
+# error results: an expired or rejected token, or a closed HTTP stream
+_SESSION_LOST_MARKERS = (
+    "401", "unauthorized", "expired", "session terminated", "session not found",
+    "closedresource", "endofstream", "brokenresource", "server disconnected",
+    "connection attempts failed", "connection reset", "connection closed",
+)
+
+
+def _session_active(client) -> bool:
+    is_active = getattr(client, "_is_session_active", None)
+    return is_active() if is_active is not None else True
+
+
+def _lost_on_error(client, error: Exception) -> bool:
+    """Whether an exception from a session means the session itself is gone."""
+    return isinstance(error, MCPClientInitializationError) or not _session_active(client)
+
+
+def _session_lost(client, result) -> bool:
+    """Whether a tool result is a transport failure of the session (not a tool error)."""
+    if not _session_active(client):
+        return True
+    if not isinstance(result, dict) or result.get("status") != "error" or result.get("cancelled"):
+        return False
+    text = " ".join(str(part.get("text", "")) for part in result.get("content", []))
+    if not text.startswith("Tool execution failed:"):
+        return False  # the tool ran and reported an error
+    detail = text[len("Tool execution failed:"):].strip().lower()
+    # anyio stream errors have an empty message
+    return not detail or any(marker in detail for marker in _SESSION_LOST_MARKERS)
+
+
+class _Session:
+    """One open MCPClient plus the bookkeeping needed to rotate it safely."""
+
+    def __init__(self, client: MCPClient, expires_at: float):
+        self.client = client
+        self.expires_at = expires_at
+        self.in_flight = 0
+        self.retired = False
+        self.last_used = time.monotonic()
+
+    def stop(self):
+        try:
+            self.client.stop(None, None, None)
+        except Exception as e:
+            logger.debug("error stopping MCP session: %s", e)
+
+
+class GatewaySessionPool:
+    """
+    A fixed-size pool of authenticated MCP sessions to one Gateway.
+
+    The pool stands in for the MCPClient of every tool it returns from
+    list_tools(), so agents built per request share the pooled sessions.
+
+    Args:
+        gateway_url: Gateway MCP endpoint (https://<id>.gateway.../mcp)
+        token_provider: Object with token() -> (access_token, expires_at)
+        size: Number of sessions kept open
+        keepalive_interval: Seconds between keep-alive passes (0 disables)
+        refresh_margin: Rotate a session this many seconds before its token expires
+        catalog: ToolCatalog used by list_tools() (default: the shared catalog)
+    """
+
+    def __init__(self, gateway_url: str, token_provider, size: int = 2,
+                 keepalive_interval: int = 60, refresh_margin: int = 120, catalog=None):
+        self.gateway_url = gateway_url
+        self.token_provider = token_provider
+        self.size = size
+        self.keepalive_interval = keepalive_interval
+        self.refresh_margin = refresh_margin
+        self.catalog = catalog or tool_catalog
+        self._sessions = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._keepalive_thread = None
+
+    def __enter__(self) -> "GatewaySessionPool":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # Lifecycle
+
+    def start(self) -> "GatewaySessionPool":
+        """Open all sessions and start the keep-alive thread."""
+        self._stopped.clear()
+        self._sessions = [self._connect() for _ in range(self.size)]
+        if self.keepalive_interval:
+            self._keepalive_thread = threading.Thread(
+                target=self._keepalive_loop, name="gateway-pool-keepalive", daemon=True
+            )
+            self._keepalive_thread.start()
+        return self
+
+    def close(self):
+        """Stop the keep-alive thread and close every session."""
+        self._stopped.set()
+        if self._keepalive_thread is not None:
+            self._keepalive_thread.join()
+            self._keepalive_thread = None
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.stop()
+
+    def _connect(self) -> _Session:
+        """Open a new session with a current access token."""
+        from mcp.client.streamable_http import streamablehttp_client
+
+        access_token, expires_at = self.token_provider.token()
+
+        def create_transport():
+            return streamablehttp_client(
+                self.gateway_url,
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+
+        client = MCPClient(create_transport)
+        # Before start(): change notifications are only published to clients
+        # that subscribed when the session opened
+        self.catalog.watch(client, http_server_key(self.gateway_url))
+        client.start()
+        return _Session(client, expires_at)
+
+    def _replace(self, old: _Session):
+        """Swap `old` for a fresh session. Calls in flight on `old` finish first."""
+        new = self._connect()
+        with self._lock:
+            if old not in self._sessions:
+                # Another thread replaced it already
+                stale = new
+            else:
+                self._sessions[self._sessions.index(old)] = new
+                old.retired = True
+                stale = old if old.in_flight == 0 else None
+        if stale is not None:
+            stale.stop()
+
+    # Session checkout
+
+    def _acquire(self) -> _Session:
+        """Check out the least busy session (counted in flight until released)."""
+        for attempt in range(2):
+            with self._lock:
+                if not self._sessions:
+                    raise MCPClientInitializationError("GatewaySessionPool is not started")
+                session = min(self._sessions, key=lambda s: s.in_flight)
+                # Rotate a session whose token is about to expire (once: a
+                # token provider may hand out short-lived tokens)
+                if attempt or time.time() < session.expires_at - self.refresh_margin:
+                    # Counted under the same lock _replace() retires sessions with,
+                    # so a checked-out session is never stopped under its caller
+                    session.in_flight += 1
+                    session.last_used = time.monotonic()
+                    return session
+            self._replace(session)
+
+    def _release(self, session: _Session):
+        with self._lock:
+            session.in_flight -= 1
+            stop = session.retired and session.in_flight == 0
+        if stop:
+            session.stop()
+
+    def _with_session(self, operation):
+        """Run operation(client) on a pooled session, reconnecting and retrying once if it is dead."""
+        for attempt in range(2):
+            session = self._acquire()
+            try:
+                result = operation(session.client)
+            except Exception as e:
+                if attempt or not _lost_on_error(session.client, e):
+                    raise
+            else:
+                if attempt or not _session_lost(session.client, result):
+                    return result
+            finally:
+                self._release(session)
+            logger.info("gateway MCP session lost, reconnecting")
+            self._replace(session)
+
+    # MCPClient-compatible surface used by MCPAgentTool
+
+    def list_tools(self) -> list:
+        """Gateway tools (from the tool catalog); the returned tools call through the pool."""
+        return self.catalog.get_tools(self, http_server_key(self.gateway_url))
+
+    def list_tools_sync(self) -> list:
+        """List Gateway tools on a pooled session (always a round-trip)."""
+        return self._with_session(lambda client: client.list_tools_sync())
+
+    def call_tool_sync(self, tool_use_id, name, arguments=None, read_timeout_seconds=None, **kwargs):
+        """Call a Gateway tool on a pooled session."""
+        return self._with_session(lambda client: client.call_tool_sync(
+            tool_use_id, name, arguments, read_timeout_seconds, **kwargs
+        ))
+
+    async def call_tool_async(self, tool_use_id, name, arguments=None, read_timeout_seconds=None, **kwargs):
+        """Async variant of call_tool_sync (used by MCPAgentTool.stream; forwards cancel_signal)."""
+        for attempt in range(2):
+            session = self._acquire()
+            try:
+                result = await session.client.call_tool_async(
+                    tool_use_id=tool_use_id, name=name, arguments=arguments,
+                    read_timeout_seconds=read_timeout_seconds, **kwargs,
+                )
+            except Exception as e:
+                if attempt or not _lost_on_error(session.client, e):
+                    raise
+            else:
+                if attempt or not _session_lost(session.client, result):
+                    return result
+            finally:
+                self._release(session)
+            logger.info("gateway MCP session lost, reconnecting")
+            self._replace(session)
+
+    # Keep-alive
+
+    def _keepalive_loop(self):
+        while not self._stopped.wait(self.keepalive_interval):
+            with self._lock:
+                sessions = list(self._sessions)
+            for session in sessions:
+                if self._stopped.is_set():
+                    return
+                try:
+                    if time.time() >= session.expires_at - self.refresh_margin:
+                        self._replace(session)
+                    elif time.monotonic() - session.last_used >= self.keepalive_interval:
+                        # Cheap round-trip that keeps the HTTP session warm and
+                        # surfaces a dead session before a request needs it
+                        with self._lock:
+                            if session.retired:
+                                continue
+                            session.in_flight += 1
+                        try:
+                            session.client.list_tools_sync()
+                        finally:
+                            self._release(session)
+                except Exception as e:
+                    logger.info("gateway MCP keep-alive failed (%s), reconnecting", e)
+                    try:
+                        self._replace(session)
+                    except Exception as e:
+                        logger.warning("gateway MCP reconnect failed: %s", e)
@@ -0,0 +1,132 @@
+"""
+Lazy MCP Tools
+==============
+MCP tools that only connect to their server when the model calls one.
+
+LazyMCPClient hands the agent tool proxies built from the tool catalog, so
+an agent with MCP tools starts as fast as one with local tools only. The
+first tool call leases a server from the warm pool (get_server_pool) and
+keeps it until close(); sessions that never call an MCP tool never start a
+server at all.
+
+If the catalog has no schemas for the server yet (the first run on a
+machine, or once the cached list is older than MCP_TOOL_CACHE_TTL),
+list_tools() has to connect once to list them; that server is then kept
+for the session's tool calls.
+
+Usage:
+    fetch = LazyMCPClient(FETCH_SERVER)
+    agent = Agent(model=model, tools=[...] + fetch.list_tools())   # no connection
+    ...
+    fetch.close()
+"""
+
+import asyncio
+import logging
+import threading
+
+from mcp import StdioServerParameters
+from strands.tools.mcp import MCPAgentTool
+from strands.types.exceptions import MCPClientInitializationError
+
+from .catalog import stdio_server_key, tool_catalog
+from .server_pool import get_server_pool
+
+logger = logging.getLogger(__name__)
+
+
+class LazyMCPClient:
+    """
+    Stands in for the MCPClient of cached MCP tools, connecting on first call.
+
+    Args:
+        params: StdioServerParameters of the server behind the tools
+        catalog: ToolCatalog holding the tool schemas (default: the shared catalog)
+        pool: StdioServerPool to lease from (default: get_server_pool(params))
+    """
+
+    def __init__(self, params: StdioServerParameters, catalog=None, pool=None):
+        self.params = params
+        self.catalog = catalog or tool_catalog
+        self.key = stdio_server_key(params.command, list(params.args))
+        self._pool = pool
+        self._client = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "LazyMCPClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def connected(self) -> bool:
+        """True once a server has been leased for this client."""
+        return self._client is not None
+
+    def list_tools(self) -> list:
+        """Agent tools from the catalog; connects only if no schemas are cached."""
+        mcp_tools = self.catalog.cached(self.key)
+        if mcp_tools is None:
+            logger.info("no cached tool schemas for %s, connecting to list them", self.key)
+            mcp_tools = [tool.mcp_tool for tool in self._connect().list_tools_sync()]
+            self.catalog.store(self.key, mcp_tools)
+        return [MCPAgentTool(mcp_tool, self) for mcp_tool in mcp_tools]
+
+    def close(self):
+        """Return the leased server (if any) to the pool."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            self._pool.release(client)
+
+    # Connection
+
+    def _connect(self):
+        with self._lock:
+            if self._client is None:
+                if self._pool is None:
+                    self._pool = get_server_pool(self.params)
+                self._client = self._pool.acquire()
+                self.catalog.watch(self._client, self.key)
+            return self._client
+
+    def _reconnect(self, dead):
+        """Drop a server that went away and lease another one."""
+        with self._lock:
+            if self._client is dead:
+                self._client = None
+                self._pool.release(dead, healthy=False)
+        logger.info("MCP server %s lost, reconnecting", self.key)
+        return self._connect()
+
+    # MCPClient-compatible surface used by MCPAgentTool
+
+    def list_tools_sync(self) -> list:
+        """List tools on the server (always connects)."""
+        return self._connect().list_tools_sync()
+
+    def call_tool_sync(self, tool_use_id, name, arguments=None, read_timeout_seconds=None, **kwargs):
+        """Call a tool, connecting to the server on first use."""
+        client = self._connect()
+        try:
+            return client.call_tool_sync(tool_use_id, name, arguments, read_timeout_seconds)
+        except MCPClientInitializationError:
+            client = self._reconnect(client)
+        return client.call_tool_sync(tool_use_id, name, arguments, read_timeout_seconds)
+
+    async def call_tool_async(self, tool_use_id, name, arguments=None, read_timeout_seconds=None, **kwargs):
+        """Async variant of call_tool_sync (used by MCPAgentTool.stream)."""
+        # Leasing may wait for a server to spawn; keep it off the event loop
+        client = await asyncio.to_thread(self._connect)
+        try:
+            return await client.call_tool_async(
+                tool_use_id=tool_use_id, name=name, arguments=arguments,
+                read_timeout_seconds=read_timeout_seconds,
+            )
+        except MCPClientInitializationError:
+            client = await asyncio.to_thread(self._reconnect, client)
+        return await client.call_tool_async(
+            tool_use_id=tool_use_id, name=name, arguments=arguments,
+            read_timeout_seconds=read_timeout_seconds,
+        )
@@ -0,0 +1,282 @@
+"""
+MCP Server Pool
+===============
+Keeps warm, already-initialized stdio MCP servers ready to hand out.
+
+Starting `uvx mcp-server-fetch` costs seconds of interpreter start-up and
+package resolution. StdioServerPool spawns servers ahead of time on
+background threads, so creating an agent only takes a server off the idle
+list. A supervisor thread keeps `size` servers warm, probes idle ones and
+restarts any that crashed, and spawn latency is recorded for stats().
+
+Usage:
+    pool = get_server_pool(FETCH_SERVER)        # starts warming immediately
+    with pool.lease() as fetch_mcp:
+        tools = tool_catalog.get_tools(fetch_mcp, pool.key)
+
+Environment:
+    MCP_SERVER_POOL_SIZE  Warm servers kept per command line (default: 1)
+"""
+
+import atexit
+import logging
+import os
+import statistics
+import threading
+import time
+from collections import deque
+
+from mcp import StdioServerParameters, stdio_client
+from strands.tools.mcp import MCPClient
+from strands.types.exceptions import MCPClientInitializationError
+
+from .catalog import stdio_server_key, tool_catalog
+
+logger = logging.getLogger(__name__)
+
+# The Fetch MCP server used by the DevOps agent
+FETCH_SERVER = StdioServerParameters(command="uvx", args=["mcp-server-fetch"])
+
+
+class _Lease:
+    """A leased server. Behaves like the MCPClient it wraps, and returns it on exit."""
+
+    def __init__(self, pool: "StdioServerPool", timeout: float = None):
+        self._pool = pool
+        self._timeout = timeout
+        self.client = None
+
+    def __enter__(self) -> "_Lease":
+        self.client = self._pool.acquire(self._timeout)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        healthy = not isinstance(exc_val, MCPClientInitializationError)
+        self._pool.release(self.client, healthy=healthy)
+        self.client = None
+
+    def __getattr__(self, name):
+        if self.client is None:
+            raise MCPClientInitializationError("server lease is not active; use it in a with block")
+        return getattr(self.client, name)
+
+
+class StdioServerPool:
+    """
+    A supervised pool of started MCPClients for one stdio server command.
+
+    Args:
+        params: StdioServerParameters of the server to run
+        size: Number of idle, initialized servers to keep ready
+        health_interval: Seconds between supervisor passes
+        startup_timeout: Seconds a server may take to initialize
+        catalog: ToolCatalog primed by freshly spawned servers
+    """
+
+    def __init__(self, params: StdioServerParameters, size: int = 1, health_interval: int = 30,
+                 startup_timeout: int = 30, catalog=None):
+        self.params = params
+        self.size = size
+        self.health_interval = health_interval
+        self.startup_timeout = startup_timeout
+        self.catalog = catalog or tool_catalog
+        self.key = stdio_server_key(params.command, list(params.args))
+
+        self._idle = deque()
+        self._leased = set()
+        self._spawning = 0
+        self._cond = threading.Condition()
+        self._stopped = threading.Event()
+        self._supervisor = None
+
+        self._spawn_latencies = deque(maxlen=100)
+        self._spawned = 0
+        self._restarts = 0
+        self._failures = 0
+
+    # Lifecycle
+
+    def start(self) -> "StdioServerPool":
+        """Begin warming servers in the background; returns immediately."""
+        self._stopped.clear()
+        self._fill()
+        self._supervisor = threading.Thread(
+            target=self._supervise, name="mcp-server-pool", daemon=True
+        )
+        self._supervisor.start()
+        return self
+
+    def close(self):
+        """Stop the supervisor and every server, idle or leased."""
+        self._stopped.set()
+        with self._cond:
+            clients = list(self._idle) + list(self._leased)
+            self._idle.clear()
+            self._leased.clear()
+            self._cond.notify_all()
+        for client in clients:
+            self._stop_client(client)
+        if self._supervisor is not None:
+            self._supervisor.join()
+            self._supervisor = None
+
+    # Leasing
+
+    def acquire(self, timeout: float = None) -> MCPClient:
+        """Take a warm server, waiting for one to finish spawning if necessary."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        attempts = 0
+        with self._cond:
+            while not self._idle:
+                if self._stopped.is_set():
+                    raise MCPClientInitializationError("MCP server pool is closed")
+                if self._spawning == 0:
+                    # Nothing warm and nothing starting: earlier spawns failed
+                    if attempts >= 3:
+                        raise MCPClientInitializationError(f"MCP server {self.key} failed to start")
+                    attempts += 1
+                    self._spawn_async()
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise MCPClientInitializationError(
+                        f"no warm MCP server available within {timeout}s"
+                    )
+                self._cond.wait(remaining)
+            client = self._idle.popleft()
+            self._leased.add(client)
+        # Replace what was just handed out so the next agent is warm too
+        self._fill()
+        return client
+
+    def release(self, client: MCPClient, healthy: bool = True):
+        """Return a leased server; unhealthy or surplus servers are stopped."""
+        with self._cond:
+            self._leased.discard(client)
+            keep = healthy and not self._stopped.is_set() and len(self._idle) < self.size
+            if keep:
+                self._idle.append(client)
+                self._cond.notify()
+        if not keep:
+            self._stop_client(client)
+            self._fill()
+
+    def lease(self, timeout: float = None) -> _Lease:
+        """Context manager that leases a server for the duration of the block."""
+        return _Lease(self, timeout)
+
+    def stats(self) -> dict:
+        """Pool counters and spawn latency (milliseconds)."""
+        with self._cond:
+            last = self._spawn_latencies[-1] if self._spawn_latencies else None
+            latencies = sorted(self._spawn_latencies)
+            stats = {
+                "server": self.key,
+                "idle": len(self._idle),
+                "leased": len(self._leased),
+                "spawning": self._spawning,
+                "spawned": self._spawned,
+                "restarts": self._restarts,
+                "spawn_failures": self._failures,
+            }
+        if latencies:
+            stats["spawn_latency_ms"] = {
+                "last": round(last * 1000),
+                "mean": round(statistics.fmean(latencies) * 1000),
+                "p95": round(latencies[int(0.95 * (len(latencies) - 1))] * 1000),
+            }
+        return stats
+
+    # Spawning and supervision
+
+    def _fill(self):
+        """Spawn servers until idle + spawning reaches the target size."""
+        with self._cond:
+            if self._stopped.is_set():
+                return
+            missing = self.size - len(self._idle) - self._spawning
+            for _ in range(missing):
+                self._spawn_async()
+
+    def _spawn_async(self):
+        """Start one server on a background thread. Caller holds self._cond."""
+        self._spawning += 1
+        threading.Thread(target=self._spawn, name="mcp-server-spawn", daemon=True).start()
+
+    def _spawn(self):
+        client = MCPClient(lambda: stdio_client(self.params), startup_timeout=self.startup_timeout)
+        self.catalog.watch(client, self.key)
+        started = time.monotonic()
+        try:
+            client.start()
+            if self.catalog.cached(self.key) is None:
+                # Prime the catalog so agents are built without a tools/list call
+                self.catalog.store(self.key, [t.mcp_tool for t in client.list_tools_sync()])
+        except Exception as e:
+            logger.warning("failed to start MCP server %s: %s", self.key, e)
+            with self._cond:
+                self._spawning -= 1
+                self._failures += 1
+                self._cond.notify_all()
+            return
+
+        with self._cond:
+            self._spawning -= 1
+            self._spawned += 1
+            self._spawn_latencies.append(time.monotonic() - started)
+            if self._stopped.is_set():
+                client_to_stop = client
+            else:
+                client_to_stop = None
+                self._idle.append(client)
+                self._cond.notify()
+        if client_to_stop is not None:
+            self._stop_client(client_to_stop)
+
+    def _supervise(self):
+        while not self._stopped.wait(self.health_interval):
+            with self._cond:
+                idle = list(self._idle)
+            for client in idle:
+                try:
+                    client.list_tools_sync()
+                except Exception as e:
+                    with self._cond:
+                        if client not in self._idle:
+                            continue
+                        self._idle.remove(client)
+                        self._restarts += 1
+                    logger.info("MCP server %s crashed (%s), restarting", self.key, e)
+                    self._stop_client(client)
+            # Also retries spawns that failed since the last pass
+            self._fill()
+
+    @staticmethod
+    def _stop_client(client: MCPClient):
+        try:
+            client.stop(None, None, None)
+        except Exception as e:
+            logger.debug("error stopping MCP server: %s", e)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_server_pool(params: StdioServerParameters = FETCH_SERVER, size: int = None) -> StdioServerPool:
+    """Return the process-wide pool for a server command, starting it on first use."""
+    key = stdio_server_key(params.command, list(params.args))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            size = size or int(os.getenv("MCP_SERVER_POOL_SIZE", "1"))
+            pool = _pools[key] = StdioServerPool(params, size=size).start()
+    return pool
+
+
+@atexit.register
+def _close_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
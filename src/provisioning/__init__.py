@@ -0,0 +1,21 @@
+# Declarative provisioning for the Cognito / AgentCore Gateway lab resources
+from .graph import Step, ProvisioningError, run_graph
+from .tags import LAB_TAGS, tenant_tags
+from .throttle import RateLimiter, make_client
+from .cognito import provision_cognito
+from .bulk import load_manifest, provision_tenants
+from .teardown import teardown
+
+__all__ = [
+    "Step",
+    "ProvisioningError",
+    "run_graph",
+    "LAB_TAGS",
+    "tenant_tags",
+    "RateLimiter",
+    "make_client",
+    "provision_cognito",
+    "load_manifest",
+    "provision_tenants",
+    "teardown",
+]
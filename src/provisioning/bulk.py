@@ -0,0 +1,217 @@
+"""
+Multi-Tenant Bulk Provisioning
+==============================
+Non-interactive provisioning of one App Client and one Gateway per tenant.
+
+All tenants share a single User Pool, domain and resource server; each tenant
+gets its own client_credentials App Client and a Gateway that only accepts
+that client's tokens. Tenants are provisioned concurrently, every API call
+goes through a shared RateLimiter, and progress is written to a checkpoint
+file after each step so a failed run resumes where it stopped.
+
+Manifest format (JSON):
+
+    {
+      "region": "us-west-2",
+      "pool_name": "DevOpsAgentPool",
+      "domain_prefix": "devops-agent-tenants",
+      "role_arn": "arn:aws:iam::123456789012:role/AgentCoreGatewayRole",
+      "quotas": {"bedrock-agentcore-control:CreateGateway": 1},
+      "tenants": [{"name": "payments"}, {"name": "search"}]
+    }
+
+Run: python -m src.provisioning.bulk tenants.json --checkpoint tenants_state.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .cognito import ensure_app_client, ensure_domain, ensure_resource_server, ensure_user_pool
+from .gateway import ensure_gateway
+from .graph import Step, run_graph
+from .tags import tenant_tags
+from .throttle import RateLimiter, make_client
+
+TENANT_NAME_PATTERN = re.compile(r"^[0-9a-zA-Z](-?[0-9a-zA-Z]){0,38}$")
+
+
+class Checkpoint:
+    """Thread-safe JSON progress file, rewritten atomically on every update."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        try:
+            with open(path, "r") as f:
+                self.state = json.load(f)
+        except FileNotFoundError:
+            self.state = {}
+        self.state.setdefault("shared", {})
+        self.state.setdefault("tenants", {})
+
+    def tenant(self, name: str) -> dict:
+        with self.lock:
+            return dict(self.state["tenants"].get(name, {}))
+
+    def update_shared(self, **fields):
+        with self.lock:
+            self.state["shared"].update(fields)
+            self._write()
+
+    def update_tenant(self, name: str, **fields):
+        with self.lock:
+            self.state["tenants"].setdefault(name, {}).update(fields)
+            self._write()
+
+    def _write(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def load_manifest(filename: str) -> dict:
+    """Load and validate a tenant manifest."""
+    with open(filename, "r") as f:
+        manifest = json.load(f)
+
+    for key in ("region", "pool_name", "domain_prefix", "role_arn", "tenants"):
+        if key not in manifest:
+            raise ValueError(f"Manifest is missing '{key}'")
+
+    names = [tenant["name"] for tenant in manifest["tenants"]]
+    invalid = [name for name in names if not TENANT_NAME_PATTERN.match(name)]
+    if invalid:
+        raise ValueError(f"Tenant names must be alphanumeric with single hyphens: {invalid}")
+    if len(set(names)) != len(names):
+        raise ValueError("Tenant names must be unique")
+    return manifest
+
+
+def provision_shared(manifest: dict, cognito, checkpoint: Checkpoint) -> dict:
+    """Reconcile the User Pool, domain and resource server shared by all tenants."""
+    shared = checkpoint.state["shared"]
+    steps = [
+        Step("user_pool", lambda deps: ensure_user_pool(
+            cognito, manifest["pool_name"], shared.get("pool_id")
+        )),
+        Step("domain", lambda deps: ensure_domain(
+            cognito, deps["user_pool"], manifest["domain_prefix"]
+        ), ("user_pool",)),
+        Step("resource_server", lambda deps: ensure_resource_server(
+            cognito, deps["user_pool"]["pool_id"],
+            manifest.get("resource_server_id", "agentcore-gateway")
+        ), ("user_pool",)),
+    ]
+    results = run_graph(steps)
+
+    region = manifest["region"]
+    domain = results["domain"]["domain"]
+    checkpoint.update_shared(
+        region=region,
+        pool_id=results["user_pool"]["pool_id"],
+        domain=domain,
+        resource_server_id=results["resource_server"]["identifier"],
+        token_url=f"https://{domain}.auth.{region}.amazoncognito.com/oauth2/token",
+    )
+    return checkpoint.state["shared"]
+
+
+def provision_tenant(name, manifest, shared, cognito, control, checkpoint):
+    """Reconcile one tenant's App Client, then its Gateway."""
+    state = checkpoint.tenant(name)
+    if state.get("status") == "done":
+        print(f"  ✓ {name}: already provisioned (checkpoint)")
+        return
+
+    client = ensure_app_client(
+        cognito, shared["pool_id"], f"tenant-{name}",
+        shared["resource_server_id"], state.get("client_id")
+    )
+    checkpoint.update_tenant(
+        name, status="client_ready",
+        client_id=client["client_id"], client_secret=client["client_secret"],
+    )
+
+    gateway = ensure_gateway(
+        control, f"agentlab-{name}", shared["region"], shared["pool_id"],
+        client["client_id"], manifest["role_arn"],
+        tags=tenant_tags(name), gateway_id=state.get("gateway_id"),
+    )
+    checkpoint.update_tenant(
+        name, status="done", error=None,
+        gateway_id=gateway["gateway_id"], gateway_url=gateway["gateway_url"],
+    )
+
+
+def provision_tenants(manifest: dict, checkpoint_file: str, max_workers: int = 8) -> dict:
+    """
+    Provision every tenant in the manifest, resuming from the checkpoint.
+
+    Args:
+        manifest: Validated manifest (see load_manifest)
+        checkpoint_file: JSON file that records progress per tenant
+        max_workers: Number of tenants provisioned at the same time
+
+    Returns:
+        Dict with "done" (tenant names) and "failed" (tenant name -> error)
+    """
+    checkpoint = Checkpoint(checkpoint_file)
+    limiter = RateLimiter(manifest.get("quotas"))
+    region = manifest["region"]
+    cognito = make_client("cognito-idp", region, limiter)
+    control = make_client("bedrock-agentcore-control", region, limiter)
+
+    print(f"Provisioning shared Cognito resources in {region}...")
+    shared = provision_shared(manifest, cognito, checkpoint)
+
+    tenants = [tenant["name"] for tenant in manifest["tenants"]]
+    print(f"\nProvisioning {len(tenants)} tenants ({max_workers} at a time)...")
+
+    failed = {}
+
+    def run(name):
+        try:
+            provision_tenant(name, manifest, shared, cognito, control, checkpoint)
+        except Exception as e:
+            print(f"  ✗ {name}: {e}")
+            checkpoint.update_tenant(name, error=str(e))
+            failed[name] = str(e)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(run, tenants))
+
+    return {
+        "done": [name for name in tenants if name not in failed],
+        "failed": failed,
+    }
+
+
+def main(argv=None) -> bool:
+    parser = argparse.ArgumentParser(description="Bulk-provision tenant App Clients and Gateways")
+    parser.add_argument("manifest", help="Tenant manifest (JSON)")
+    parser.add_argument("--checkpoint", default="tenants_state.json",
+                        help="Progress file used to resume (default: tenants_state.json)")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="Tenants provisioned concurrently (default: 8)")
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest(args.manifest)
+    summary = provision_tenants(manifest, args.checkpoint, args.workers)
+
+    print(f"\n✓ {len(summary['done'])} tenants provisioned")
+    if summary["failed"]:
+        print(f"✗ {len(summary['failed'])} tenants failed - rerun to resume:")
+        for name, error in summary["failed"].items():
+            print(f"  {name}: {error}")
+    print(f"Progress saved to {args.checkpoint}")
+    return not summary["failed"]
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
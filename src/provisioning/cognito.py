@@ -0,0 +1,206 @@
+"""
+Cognito Provisioning
+====================
+Idempotent provisioning of the Cognito resources used for Gateway OAuth.
+
+Every resource is reconciled (describe before create), so re-running against
+an existing setup only issues read calls and returns the same configuration.
+
+Dependency graph:
+
+    user_pool ──┬──▶ domain
+                └──▶ resource_server ──▶ app_client
+"""
+
+from .graph import Step, run_graph
+from .tags import LAB_TAGS
+from .throttle import RateLimiter, make_client
+
+RESOURCE_SERVER_SCOPES = [
+    {"ScopeName": "invoke", "ScopeDescription": "Invoke tools via Gateway"},
+    {"ScopeName": "read", "ScopeDescription": "Read tool information"},
+]
+
+
+def _find_user_pool(cognito, pool_name, pool_id=None):
+    """Return the UserPool description by id, falling back to a name lookup."""
+    if pool_id:
+        try:
+            return cognito.describe_user_pool(UserPoolId=pool_id)["UserPool"]
+        except cognito.exceptions.ResourceNotFoundException:
+            pass
+
+    for page in cognito.get_paginator("list_user_pools").paginate(MaxResults=60):
+        for pool in page["UserPools"]:
+            if pool["Name"] == pool_name:
+                return cognito.describe_user_pool(UserPoolId=pool["Id"])["UserPool"]
+    return None
+
+
+def ensure_user_pool(cognito, pool_name, pool_id=None, tags=None) -> dict:
+    """Reconcile the User Pool. Returns {"pool_id", "domain", "created"}."""
+    wanted_tags = {**LAB_TAGS, **(tags or {})}
+    pool = _find_user_pool(cognito, pool_name, pool_id)
+    if pool:
+        print(f"  ✓ User Pool exists: {pool['Id']}")
+        current = pool.get("UserPoolTags", {})
+        if any(current.get(key) != value for key, value in wanted_tags.items()):
+            # Pools from older runs were created untagged; teardown only finds tagged ones
+            cognito.tag_resource(ResourceArn=pool["Arn"], Tags=wanted_tags)
+            print(f"  ✓ User Pool tagged: {pool['Id']}")
+        return {"pool_id": pool["Id"], "domain": pool.get("Domain"), "created": False}
+
+    response = cognito.create_user_pool(
+        PoolName=pool_name,
+        AutoVerifiedAttributes=["email"],
+        MfaConfiguration="OFF",
+        AdminCreateUserConfig={"AllowAdminCreateUserOnly": True},
+        UserPoolTags=wanted_tags,
+    )
+    pool_id = response["UserPool"]["Id"]
+    print(f"  ✓ User Pool created: {pool_id}")
+    return {"pool_id": pool_id, "domain": None, "created": True}
+
+
+def ensure_domain(cognito, pool: dict, domain_prefix: str) -> dict:
+    """Reconcile the OAuth domain. An existing pool domain always wins."""
+    if pool["domain"]:
+        print(f"  ✓ Domain exists: {pool['domain']}")
+        return {"domain": pool["domain"], "created": False}
+
+    cognito.create_user_pool_domain(Domain=domain_prefix, UserPoolId=pool["pool_id"])
+    print(f"  ✓ Domain created: {domain_prefix}")
+    return {"domain": domain_prefix, "created": True}
+
+
+def ensure_resource_server(cognito, pool_id, identifier="agentcore-gateway") -> dict:
+    """Reconcile the Resource Server and its invoke/read scopes."""
+    try:
+        cognito.describe_resource_server(UserPoolId=pool_id, Identifier=identifier)
+        print(f"  ✓ Resource Server exists: {identifier}")
+        return {"identifier": identifier, "created": False}
+    except cognito.exceptions.ResourceNotFoundException:
+        pass
+
+    cognito.create_resource_server(
+        UserPoolId=pool_id,
+        Identifier=identifier,
+        Name="AgentCore Gateway API",
+        Scopes=RESOURCE_SERVER_SCOPES,
+    )
+    print(f"  ✓ Resource Server created: {identifier}")
+    return {"identifier": identifier, "created": True}
+
+
+def _find_app_client(cognito, pool_id, client_name, client_id=None):
+    """Return the UserPoolClient description by id, falling back to a name lookup."""
+    if client_id:
+        try:
+            return cognito.describe_user_pool_client(
+                UserPoolId=pool_id, ClientId=client_id
+            )["UserPoolClient"]
+        except cognito.exceptions.ResourceNotFoundException:
+            pass
+
+    paginator = cognito.get_paginator("list_user_pool_clients")
+    for page in paginator.paginate(UserPoolId=pool_id, MaxResults=60):
+        for client in page["UserPoolClients"]:
+            if client["ClientName"] == client_name:
+                return cognito.describe_user_pool_client(
+                    UserPoolId=pool_id, ClientId=client["ClientId"]
+                )["UserPoolClient"]
+    return None
+
+
+def ensure_app_client(cognito, pool_id, client_name, resource_server_id, client_id=None) -> dict:
+    """Reconcile the client_credentials App Client. Returns its id and secret."""
+    client = _find_app_client(cognito, pool_id, client_name, client_id)
+    if client:
+        print(f"  ✓ App Client exists: {client['ClientId'][:20]}...")
+        return {
+            "client_id": client["ClientId"],
+            "client_secret": client["ClientSecret"],
+            "created": False,
+        }
+
+    response = cognito.create_user_pool_client(
+        UserPoolId=pool_id,
+        ClientName=client_name,
+        GenerateSecret=True,
+        AllowedOAuthFlows=["client_credentials"],
+        AllowedOAuthScopes=[
+            f"{resource_server_id}/invoke",
+            f"{resource_server_id}/read",
+        ],
+        AllowedOAuthFlowsUserPoolClient=True,
+    )
+    client = response["UserPoolClient"]
+    print(f"  ✓ App Client created: {client['ClientId'][:20]}...")
+    return {
+        "client_id": client["ClientId"],
+        "client_secret": client["ClientSecret"],
+        "created": True,
+    }
+
+
+def provision_cognito(
+    region: str,
+    pool_name: str,
+    client_name: str,
+    domain_prefix: str,
+    resource_server_id: str = "agentcore-gateway",
+    existing: dict = None,
+    tags: dict = None,
+    max_workers: int = 4,
+    limiter: RateLimiter = None,
+) -> dict:
+    """
+    Create or reuse the Cognito resources needed for Gateway OAuth.
+
+    Args:
+        region: AWS region for the User Pool
+        pool_name: User Pool name (used to find an existing pool)
+        client_name: App Client name (used to find an existing client)
+        domain_prefix: Domain prefix, only used if the pool has no domain yet
+        resource_server_id: Resource Server identifier / scope prefix
+        existing: A previously saved config; its ids are tried first
+        tags: Extra User Pool tags (added to LAB_TAGS), also applied to reused pools
+        max_workers: Maximum number of concurrent API calls
+        limiter: Optional RateLimiter shared with other provisioning work
+
+    Returns:
+        Config dict in the cognito_config.json format, plus a "created" list
+        naming the resources that did not exist before this run
+    """
+    cognito = make_client("cognito-idp", region, limiter)
+    existing = existing if existing and existing.get("region") == region else {}
+
+    steps = [
+        Step("user_pool", lambda deps: ensure_user_pool(
+            cognito, pool_name, existing.get("pool_id"), tags
+        )),
+        Step("domain", lambda deps: ensure_domain(
+            cognito, deps["user_pool"], domain_prefix
+        ), ("user_pool",)),
+        Step("resource_server", lambda deps: ensure_resource_server(
+            cognito, deps["user_pool"]["pool_id"], resource_server_id
+        ), ("user_pool",)),
+        Step("app_client", lambda deps: ensure_app_client(
+            cognito, deps["user_pool"]["pool_id"], client_name,
+            deps["resource_server"]["identifier"], existing.get("client_id")
+        ), ("user_pool", "resource_server")),
+    ]
+    results = run_graph(steps, max_workers=max_workers)
+
+    domain = results["domain"]["domain"]
+    return {
+        "region": region,
+        "pool_id": results["user_pool"]["pool_id"],
+        "pool_name": pool_name,
+        "domain": domain,
+        "resource_server_id": resource_server_id,
+        "client_id": results["app_client"]["client_id"],
+        "client_secret": results["app_client"]["client_secret"],
+        "token_url": f"https://{domain}.auth.{region}.amazoncognito.com/oauth2/token",
+        "created": [name for name, result in results.items() if result["created"]],
+    }
@@ -0,0 +1,93 @@
+"""
+Gateway Provisioning
+====================
+Idempotent provisioning of AgentCore Gateways secured with a Cognito JWT
+authorizer. Gateways are matched by name, so re-running is a no-op.
+"""
+
+import time
+
+from .tags import LAB_TAGS
+
+
+def discovery_url(region: str, pool_id: str) -> str:
+    """OpenID Connect discovery URL of a Cognito User Pool."""
+    return f"https://cognito-idp.{region}.amazonaws.com/{pool_id}/.well-known/openid-configuration"
+
+
+def _find_gateway(control, name, gateway_id=None):
+    """Return the gateway description by id, falling back to a name lookup."""
+    if gateway_id:
+        try:
+            return control.get_gateway(gatewayIdentifier=gateway_id)
+        except control.exceptions.ResourceNotFoundException:
+            pass
+
+    for page in control.get_paginator("list_gateways").paginate():
+        for gateway in page["items"]:
+            if gateway["name"] == name:
+                return control.get_gateway(gatewayIdentifier=gateway["gatewayId"])
+    return None
+
+
+def wait_for_gateway(control, gateway_id, timeout=300, interval=5) -> dict:
+    """Poll until the gateway is READY. Raises RuntimeError on failure or timeout."""
+    deadline = time.monotonic() + timeout
+    while True:
+        gateway = control.get_gateway(gatewayIdentifier=gateway_id)
+        status = gateway.get("status", "UNKNOWN")
+        if status == "READY":
+            return gateway
+        if status in ("FAILED", "UPDATE_UNSUCCESSFUL"):
+            raise RuntimeError(f"Gateway {gateway_id} is {status}: {gateway.get('statusReasons')}")
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"Gateway {gateway_id} not READY after {timeout}s (status: {status})")
+        time.sleep(interval)
+
+
+def ensure_gateway(control, name, region, pool_id, client_id, role_arn,
+                   tags=None, gateway_id=None) -> dict:
+    """
+    Reconcile a Gateway that only accepts tokens issued to `client_id`.
+
+    Returns:
+        Dict with gateway_id, gateway_url, region and "created"
+    """
+    wanted_tags = {**LAB_TAGS, **(tags or {})}
+    gateway = _find_gateway(control, name, gateway_id)
+    created = gateway is None
+    if created:
+        gateway = control.create_gateway(
+            name=name,
+            roleArn=role_arn,
+            protocolType="MCP",
+            authorizerType="CUSTOM_JWT",
+            authorizerConfiguration={
+                "customJWTAuthorizer": {
+                    "discoveryUrl": discovery_url(region, pool_id),
+                    # Cognito client_credentials access tokens carry client_id, not aud
+                    "allowedClients": [client_id],
+                }
+            },
+            tags=wanted_tags,
+        )
+        print(f"  ✓ Gateway created: {gateway['gatewayId']} ({name})")
+    else:
+        print(f"  ✓ Gateway exists: {gateway['gatewayId']} ({name})")
+        current = control.list_tags_for_resource(resourceArn=gateway["gatewayArn"]).get("tags", {})
+        if any(current.get(key) != value for key, value in wanted_tags.items()):
+            # Gateways from older runs were created untagged; teardown only finds tagged ones
+            control.tag_resource(resourceArn=gateway["gatewayArn"], tags=wanted_tags)
+            print(f"  ✓ Gateway tagged: {gateway['gatewayId']}")
+
+    if gateway.get("status") != "READY":
+        gateway = wait_for_gateway(control, gateway["gatewayId"])
+
+    gateway_id = gateway["gatewayId"]
+    return {
+        "gateway_id": gateway_id,
+        "gateway_url": gateway.get("gatewayUrl")
+        or f"https://{gateway_id}.gateway.bedrock-agentcore.{region}.amazonaws.com/mcp",
+        "region": region,
+        "created": created,
+    }
@@ -0,0 +1,78 @@
+"""
+Provisioning Graph
+==================
+Runs provisioning steps as a dependency graph.
+
+Each step reconciles a single resource. Steps whose dependencies are
+satisfied run concurrently on a thread pool (boto3 clients are thread-safe),
+and every step receives the results of the steps it depends on.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable
+
+
+class ProvisioningError(Exception):
+    """Raised when a provisioning step fails."""
+
+
+@dataclass(frozen=True)
+class Step:
+    """A provisioning step.
+
+    Args:
+        name: Unique step name, also the key of its result
+        run: Callable taking a dict of dependency results (name -> result)
+        depends_on: Names of the steps that must finish first
+    """
+    name: str
+    run: Callable[[dict], object]
+    depends_on: tuple = ()
+
+
+def run_graph(steps: list, max_workers: int = 4) -> dict:
+    """
+    Run steps in dependency order, in parallel where the graph allows it.
+
+    Args:
+        steps: List of Step objects
+        max_workers: Maximum number of steps running at the same time
+
+    Returns:
+        Dict mapping step name to the value its run callable returned
+    """
+    pending = {}
+    for step in steps:
+        if step.name in pending:
+            raise ValueError(f"Duplicate step name: {step.name}")
+        pending[step.name] = step
+    for step in steps:
+        unknown = [dep for dep in step.depends_on if dep not in pending]
+        if unknown:
+            raise ValueError(f"Step '{step.name}' depends on unknown steps: {unknown}")
+
+    results = {}
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            ready = [s for s in pending.values() if all(d in results for d in s.depends_on)]
+            for step in ready:
+                del pending[step.name]
+                deps = {d: results[d] for d in step.depends_on}
+                running[executor.submit(step.run, deps)] = step
+
+            if not running:
+                raise ValueError(f"Dependency cycle between steps: {sorted(pending)}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                try:
+                    results[step.name] = future.result()
+                except Exception as e:
+                    # Steps already in flight finish when the executor shuts
+                    # down; nothing new is started.
+                    raise ProvisioningError(f"Step '{step.name}' failed: {e}") from e
+
+    return results
@@ -0,0 +1,15 @@
+"""
+Resource Tags
+=============
+Tags that mark resources as owned by the lab (and optionally a tenant), so
+teardown can discover them without relying on local config files.
+"""
+
+LAB_TAG_KEY = "agentlab:project"
+LAB_TAGS = {LAB_TAG_KEY: "devops-agent-lab"}
+TENANT_TAG_KEY = "agentlab:tenant"
+
+
+def tenant_tags(tenant: str) -> dict:
+    """Lab tags plus the tenant marker."""
+    return {**LAB_TAGS, TENANT_TAG_KEY: tenant}
@@ -0,0 +1,228 @@
+"""
+Teardown
+========
+Discovers every Gateway, Gateway target and Cognito resource tagged as
+belonging to the lab (optionally a single tenant) and deletes them in
+dependency order with as much parallelism as the graph allows:
+
+    targets ──▶ gateway ──┐
+                          ├──▶ user pool   (lab-wide teardown only)
+    domain ───────────────┘
+
+    tenant app clients (tenant teardown only - the shared pool is kept)
+
+Throttled calls are paced by the RateLimiter and retried with backoff by
+botocore's adaptive retry mode. Failures do not stop unrelated deletions;
+resources that depend on a failed one are skipped and reported.
+
+Run: python -m src.provisioning.teardown --region us-west-2 [--tenant payments] [--dry-run]
+"""
+
+import argparse
+import sys
+import time
+
+from .graph import Step, run_graph
+from .tags import LAB_TAGS, TENANT_TAG_KEY
+from .throttle import RateLimiter, make_client
+
+
+def _matches(tags: dict, tenant: str = None) -> bool:
+    """True if the tags mark a lab resource (of the given tenant)."""
+    if any(tags.get(key) != value for key, value in LAB_TAGS.items()):
+        return False
+    return tenant is None or tags.get(TENANT_TAG_KEY) == tenant
+
+
+def discover(cognito, control, tenant: str = None) -> dict:
+    """
+    Find lab resources.
+
+    Returns:
+        Dict with "gateways" ({gateway_id: [target_id, ...]}), "pools"
+        ([{"pool_id", "domain"}]) and "clients" ([{"pool_id", "client_id"}])
+    """
+    gateways = {}
+    for page in control.get_paginator("list_gateways").paginate():
+        for summary in page["items"]:
+            if summary.get("status") == "DELETING":
+                continue
+            gateway_id = summary["gatewayId"]
+            try:
+                arn = control.get_gateway(gatewayIdentifier=gateway_id)["gatewayArn"]
+                tags = control.list_tags_for_resource(resourceArn=arn).get("tags", {})
+            except control.exceptions.ResourceNotFoundException:
+                continue
+            if _matches(tags, tenant):
+                paginator = control.get_paginator("list_gateway_targets")
+                gateways[gateway_id] = [
+                    target["targetId"]
+                    for target_page in paginator.paginate(gatewayIdentifier=gateway_id)
+                    for target in target_page["items"]
+                ]
+
+    pools, clients = [], []
+    for page in cognito.get_paginator("list_user_pools").paginate(MaxResults=60):
+        for summary in page["UserPools"]:
+            try:
+                pool = cognito.describe_user_pool(UserPoolId=summary["Id"])["UserPool"]
+            except cognito.exceptions.ResourceNotFoundException:
+                continue
+            if not _matches(pool.get("UserPoolTags", {})):
+                continue
+            if tenant is None:
+                pools.append({"pool_id": pool["Id"], "domain": pool.get("Domain")})
+                continue
+            paginator = cognito.get_paginator("list_user_pool_clients")
+            for client_page in paginator.paginate(UserPoolId=pool["Id"], MaxResults=60):
+                for client in client_page["UserPoolClients"]:
+                    if client["ClientName"] == f"tenant-{tenant}":
+                        clients.append({"pool_id": pool["Id"], "client_id": client["ClientId"]})
+
+    return {"gateways": gateways, "pools": pools, "clients": clients}
+
+
+def _count(resources: dict) -> int:
+    return (
+        len(resources["gateways"])
+        + sum(len(targets) for targets in resources["gateways"].values())
+        + len(resources["pools"])
+        + len(resources["clients"])
+    )
+
+
+def _wait_for_targets_gone(control, gateway_id, timeout=300, interval=5):
+    """Target deletion is asynchronous; a gateway can't be deleted until it finishes."""
+    deadline = time.monotonic() + timeout
+    while control.list_gateway_targets(gatewayIdentifier=gateway_id)["items"]:
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"Targets of gateway {gateway_id} still present after {timeout}s")
+        time.sleep(interval)
+
+
+def _guarded(action):
+    """Wrap a delete so it records its outcome instead of aborting the graph."""
+    def run(deps):
+        failed = [name for name, result in deps.items() if result.get("error")]
+        if failed:
+            return {"error": f"skipped, dependency failed: {', '.join(failed)}"}
+        try:
+            action()
+            return {"error": None}
+        except Exception as e:
+            return {"error": str(e)}
+    return run
+
+
+def build_steps(cognito, control, resources: dict) -> list:
+    """Turn discovered resources into delete steps wired by dependency."""
+    steps = []
+    gateway_steps = []
+
+    for gateway_id, target_ids in resources["gateways"].items():
+        target_steps = []
+        for target_id in target_ids:
+            name = f"target:{gateway_id}/{target_id}"
+            steps.append(Step(name, _guarded(lambda g=gateway_id, t=target_id: (
+                control.delete_gateway_target(gatewayIdentifier=g, targetId=t)
+            ))))
+            target_steps.append(name)
+
+        def delete_gateway(g=gateway_id, has_targets=bool(target_ids)):
+            if has_targets:
+                _wait_for_targets_gone(control, g)
+            control.delete_gateway(gatewayIdentifier=g)
+
+        name = f"gateway:{gateway_id}"
+        steps.append(Step(name, _guarded(delete_gateway), tuple(target_steps)))
+        gateway_steps.append(name)
+
+    for client in resources["clients"]:
+        steps.append(Step(f"client:{client['client_id']}", _guarded(
+            lambda c=client: cognito.delete_user_pool_client(
+                UserPoolId=c["pool_id"], ClientId=c["client_id"]
+            )
+        )))
+
+    for pool in resources["pools"]:
+        pool_deps = list(gateway_steps)
+        if pool["domain"]:
+            name = f"domain:{pool['domain']}"
+            steps.append(Step(name, _guarded(lambda p=pool: cognito.delete_user_pool_domain(
+                Domain=p["domain"], UserPoolId=p["pool_id"]
+            ))))
+            pool_deps.append(name)
+        # Deleting the pool also deletes its app clients and resource servers
+        steps.append(Step(f"pool:{pool['pool_id']}", _guarded(
+            lambda p=pool: cognito.delete_user_pool(UserPoolId=p["pool_id"])
+        ), tuple(pool_deps)))
+
+    return steps
+
+
+def teardown(region: str, tenant: str = None, max_workers: int = 16,
+             quotas: dict = None, dry_run: bool = False) -> dict:
+    """
+    Delete all lab (or tenant) resources in a region.
+
+    Args:
+        region: AWS region to clean up
+        tenant: Only delete this tenant's Gateway and App Client
+        max_workers: Maximum number of concurrent delete calls
+        quotas: RateLimiter overrides (requests per second)
+        dry_run: Only discover and report, delete nothing
+
+    Returns:
+        Dict with "deleted" (step names), "failed" (step name -> error)
+        and "remaining" (resources still found after the run)
+    """
+    limiter = RateLimiter(quotas)
+    cognito = make_client("cognito-idp", region, limiter)
+    control = make_client("bedrock-agentcore-control", region, limiter)
+
+    resources = discover(cognito, control, tenant)
+    if dry_run:
+        return {"deleted": [], "failed": {}, "remaining": resources}
+
+    results = run_graph(build_steps(cognito, control, resources), max_workers=max_workers)
+    return {
+        "deleted": sorted(name for name, result in results.items() if not result["error"]),
+        "failed": {name: result["error"] for name, result in results.items() if result["error"]},
+        "remaining": discover(cognito, control, tenant),
+    }
+
+
+def main(argv=None) -> bool:
+    parser = argparse.ArgumentParser(description="Delete lab Gateways, targets and Cognito resources")
+    parser.add_argument("--region", default="us-west-2")
+    parser.add_argument("--tenant", help="Only delete this tenant's resources")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--dry-run", action="store_true", help="Only list what would be deleted")
+    args = parser.parse_args(argv)
+
+    scope = f"tenant '{args.tenant}'" if args.tenant else "lab"
+    print(f"Tearing down {scope} resources in {args.region}...")
+    report = teardown(args.region, args.tenant, args.workers, dry_run=args.dry_run)
+
+    for name in report["deleted"]:
+        print(f"  ✓ Deleted {name}")
+    for name, error in report["failed"].items():
+        print(f"  ✗ {name}: {error}")
+
+    remaining = report["remaining"]
+    if _count(remaining):
+        print(f"\n{_count(remaining)} resources remain:")
+        for gateway_id, target_ids in remaining["gateways"].items():
+            print(f"  gateway {gateway_id} ({len(target_ids)} targets)")
+        for pool in remaining["pools"]:
+            print(f"  user pool {pool['pool_id']} (domain: {pool['domain']})")
+        for client in remaining["clients"]:
+            print(f"  app client {client['client_id']} in {client['pool_id']}")
+        return args.dry_run
+
+    print("\n✓ Nothing left to clean up")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
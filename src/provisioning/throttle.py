@@ -0,0 +1,96 @@
+"""
+API Rate Limiting
+=================
+Keeps provisioning inside the Cognito and AgentCore control-plane quotas.
+
+A RateLimiter holds one token bucket per API operation and is attached to
+boto3 clients through botocore's "before-call" event, so every call is
+paced - including the ones made by paginators. Throttled calls that still
+slip through are retried with backoff by botocore's adaptive retry mode.
+"""
+
+import threading
+import time
+
+import boto3
+from botocore.config import Config
+
+# Retries throttling errors with exponential backoff and adapts the send rate
+RETRY_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 10})
+
+# Requests per second, keyed by "<service>:<Operation>" or "<service>".
+# Conservative defaults - raise them if your account has higher quotas.
+DEFAULT_QUOTAS = {
+    "cognito-identity-provider": 10,
+    "cognito-identity-provider:CreateUserPool": 2,
+    "cognito-identity-provider:CreateUserPoolClient": 5,
+    "cognito-identity-provider:DeleteUserPool": 2,
+    "bedrock-agentcore-control": 5,
+    "bedrock-agentcore-control:CreateGateway": 1,
+    "bedrock-agentcore-control:DeleteGateway": 1,
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` calls per second."""
+
+    def __init__(self, rate: float, burst: float = None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+
+class RateLimiter:
+    """Per-operation token buckets shared by every client it is attached to."""
+
+    def __init__(self, quotas: dict = None):
+        self.quotas = {**DEFAULT_QUOTAS, **(quotas or {})}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def _bucket(self, service: str, operation: str):
+        key = f"{service}:{operation}"
+        with self.lock:
+            if key not in self.buckets:
+                rate = self.quotas.get(key, self.quotas.get(service))
+                self.buckets[key] = TokenBucket(rate) if rate else None
+            return self.buckets[key]
+
+    def acquire(self, service: str, operation: str):
+        """Wait for permission to call service:operation."""
+        bucket = self._bucket(service, operation)
+        if bucket:
+            bucket.acquire()
+
+    def attach(self, client):
+        """Pace every API call made through a boto3 client."""
+        service = client.meta.service_model.service_id.hyphenize()
+
+        def before_call(model, **kwargs):
+            self.acquire(service, model.name)
+
+        client.meta.events.register(f"before-call.{service}", before_call)
+        return client
+
+
+def make_client(service: str, region: str, limiter: RateLimiter = None):
+    """Create a boto3 client with throttling retries and optional rate limiting."""
+    client = boto3.client(service, region_name=region, config=RETRY_CONFIG)
+    if limiter:
+        limiter.attach(client)
+    return client
@@ -0,0 +1,4 @@
+# Precomputed per-region deployment readiness for the runtime
+from .scheduler import ReadinessScheduler, load_regions, make_readiness_tool
+
+__all__ = ["ReadinessScheduler", "load_regions", "make_readiness_tool"]
@@ -0,0 +1,217 @@
+"""
+Readiness Scheduler
+===================
+Keeps a per-region deployment readiness snapshot up to date in the background.
+
+Every request to the runtime used to look up AWS status, weather and IPAM
+capacity for the same few regions. ReadinessScheduler runs those lookups
+("probes") for a configured region list on a fixed cadence, concurrently,
+and publishes the results as one snapshot:
+
+    {"us-east-1": {"region": "us-east-1",
+                   "aws_status": {...}, "weather": {...}, "ip_capacity": {...},
+                   "updated_at": 1760000000.0}, ...}
+
+Readers get an entry only while it is younger than `max_age`; older entries
+are refreshed on demand. Until the background thread's first pass has
+finished, readers wait for it up to `warmup_timeout` and then get a
+"warming_up" entry instead of probing themselves. A probe that fails keeps
+its previous value, marked with the error.
+
+Probes are plain callables taking a region code, so this package does not
+depend on where the tools live.
+
+Environment:
+    READINESS_REGIONS           Comma-separated region codes to precompute
+    READINESS_REFRESH_INTERVAL  Seconds between background refreshes (default: 300)
+    READINESS_MAX_AGE           Seconds a snapshot entry may be served (default: 900)
+    READINESS_WARMUP_TIMEOUT    Seconds a reader waits for the first refresh (default: 10)
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from strands.tools import tool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGIONS = ["us-east-1", "us-west-2", "eu-west-1", "ap-southeast-1"]
+
+
+def load_regions() -> list:
+    """Region codes from READINESS_REGIONS, or the default list."""
+    configured = os.getenv("READINESS_REGIONS")
+    if not configured:
+        return list(DEFAULT_REGIONS)
+    return [region.strip() for region in configured.split(",") if region.strip()]
+
+
+class ReadinessScheduler:
+    """
+    Refreshes a readiness snapshot for a list of regions on a schedule.
+
+    Args:
+        regions: Region codes to keep precomputed
+        probes: Mapping of field name to callable(region) -> dict
+        interval: Seconds between background refreshes
+        max_age: Seconds an entry may be served before it is refreshed on demand
+        max_workers: Maximum number of probes running at the same time
+        warmup_timeout: Seconds a reader waits for the first background refresh
+    """
+
+    def __init__(self, regions: list, probes: dict, interval: int = 300,
+                 max_age: int = 900, max_workers: int = 8, warmup_timeout: float = 10):
+        self.regions = list(regions)
+        self.probes = probes
+        self.interval = interval
+        self.max_age = max_age
+        self.max_workers = max_workers
+        self.warmup_timeout = warmup_timeout
+        self.snapshot = {}
+        self._lock = threading.Lock()  # serializes snapshot writers only
+        self._stopped = threading.Event()
+        self._warm = threading.Event()  # set once the first background refresh is done
+        self._thread = None
+
+    @classmethod
+    def from_env(cls, probes: dict, **kwargs) -> "ReadinessScheduler":
+        """Build with the region list, cadence and staleness bound from the environment."""
+        return cls(
+            load_regions(),
+            probes,
+            interval=int(os.getenv("READINESS_REFRESH_INTERVAL", "300")),
+            max_age=int(os.getenv("READINESS_MAX_AGE", "900")),
+            warmup_timeout=float(os.getenv("READINESS_WARMUP_TIMEOUT", "10")),
+            **kwargs,
+        )
+
+    # Lifecycle
+
+    def start(self) -> "ReadinessScheduler":
+        """Start refreshing in the background (the first pass runs immediately)."""
+        self._stopped.clear()
+        self._warm.clear()
+        self._thread = threading.Thread(target=self._run, name="readiness-scheduler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    # Reading
+
+    @property
+    def warming_up(self) -> bool:
+        """True while the background thread's first refresh is still running."""
+        return self._thread is not None and not self._warm.is_set()
+
+    def _wait_warm(self):
+        if self.warming_up:
+            self._warm.wait(self.warmup_timeout)
+
+    def get(self, region: str, refresh: bool = True) -> dict:
+        """
+        Return the readiness entry for a region.
+
+        Entries older than max_age (or missing) are recomputed synchronously
+        when `refresh` is True; otherwise None is returned for them. Regions
+        outside the configured list get a "not_monitored" entry and are never
+        probed, so callers cannot grow the snapshot. While the first background
+        refresh runs, waits for it up to warmup_timeout, then returns a
+        "warming_up" entry rather than probing alongside it.
+        """
+        if region not in self.regions:
+            return {"region": region, "status": "not_monitored", "monitored": self.regions}
+        self._wait_warm()
+        entry = self.snapshot.get(region)
+        if entry is not None and time.time() - entry["updated_at"] <= self.max_age:
+            return dict(entry, age_seconds=round(time.time() - entry["updated_at"]))
+        if self.warming_up:
+            return {"region": region, "status": "warming_up",
+                    "message": "The first readiness refresh is still running; retry shortly"}
+        if not refresh:
+            return None
+        self.refresh([region])
+        return dict(self.snapshot[region], age_seconds=0)
+
+    def all(self) -> dict:
+        """Every entry still within max_age, keyed by region (waits for warm-up like get)."""
+        self._wait_warm()
+        now = time.time()
+        return {
+            region: dict(entry, age_seconds=round(now - entry["updated_at"]))
+            for region, entry in self.snapshot.items()
+            if now - entry["updated_at"] <= self.max_age
+        }
+
+    # Refreshing
+
+    def refresh(self, regions: list = None):
+        """Run every probe for the given regions (default: all) and publish the results."""
+        regions = self.regions if regions is None else regions
+        jobs = [(region, name) for region in regions for name in self.probes]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(lambda job: self._probe(*job), jobs))
+
+        now = time.time()
+        with self._lock:
+            snapshot = dict(self.snapshot)
+            for region in regions:
+                snapshot[region] = {"region": region, "updated_at": now}
+            for (region, name), value in zip(jobs, results):
+                snapshot[region][name] = value
+            # Swap the whole dict so readers never see a partial update
+            self.snapshot = snapshot
+
+    def _probe(self, region: str, name: str) -> dict:
+        try:
+            return self.probes[name](region)
+        except Exception as e:
+            logger.warning("readiness probe %s failed for %s: %s", name, region, e)
+            previous = self.snapshot.get(region, {}).get(name)
+            if previous is not None:
+                return dict(previous, error=str(e), stale=True)
+            return {"error": str(e)}
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning("readiness refresh failed: %s", e)
+            self._warm.set()
+            if self._stopped.wait(self.interval):
+                return
+
+
+def make_readiness_tool(scheduler: ReadinessScheduler):
+    """Build a check_region_readiness tool that answers from the scheduler's snapshot."""
+
+    @tool
+    def check_region_readiness(region: str = "all") -> dict:
+        """
+        Get precomputed deployment readiness for an AWS region: AWS service
+        status, weather risk and IP capacity, with the age of the data.
+        Answers instantly for monitored regions; prefer it over calling the
+        individual status, weather and capacity tools.
+
+        Args:
+            region: AWS region code (e.g., "us-east-1") or "all" for every monitored region
+
+        Returns:
+            Readiness data per region, including when it was last refreshed
+        """
+        if region.lower() == "all":
+            result = {"regions": scheduler.all(), "monitored": scheduler.regions}
+            if scheduler.warming_up:
+                result["status"] = "warming_up"
+            return result
+        return scheduler.get(region.lower())
+
+    return check_region_readiness
@@ -1,4 +1,29 @@
-from .weather_tool import get_weather_forecast
+from .weather_tool import get_weather_forecast, get_weather_risk
 from .aws_status_tool import check_aws_status
+from .fetch_tool import fetch_url
+from .external_status_tool import check_external_dependencies
+from .deployment_window_tool import plan_deployment_window, register_capacity_source
+from .incident_store import get_incident_history
+from .regions import REGIONS, Region, get_region
+from .breaker import CircuitBreaker, CircuitOpenError, get_breaker, breaker_status
+from .hedge import Hedger, get_hedger
 
-__all__ = ["get_weather_forecast", "check_aws_status"]
+__all__ = [
+    "get_weather_forecast",
+    "get_weather_risk",
+    "check_aws_status",
+    "fetch_url",
+    "check_external_dependencies",
+    "plan_deployment_window",
+    "register_capacity_source",
+    "get_incident_history",
+    "REGIONS",
+    "Region",
+    "get_region",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "get_breaker",
+    "breaker_status",
+    "Hedger",
+    "get_hedger",
+]
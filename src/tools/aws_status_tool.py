@@ -3,11 +3,166 @@ Custom Tool: AWS Service Status Checker
 =======================================
 Checks AWS Health Dashboard for service status.
 Uses the public AWS status RSS feed.
+
+Polls go through the status.aws.amazon.com circuit breaker (breaker.py):
+while the feed is failing or slow, answers come from the items already
+read, marked stale.
 """
 
+import threading
+import xml.etree.ElementTree as ET
+from collections import deque
+from email.utils import parsedate_to_datetime
+
 import requests
 from strands.tools import tool
 
+from .breaker import get_breaker
+from .regions import get_region
+
+FEED_URL = "https://status.aws.amazon.com/rss/all.rss"
+
+
+def _parse_item(element: ET.Element) -> dict:
+    published = element.findtext("pubDate")
+    try:
+        published = parsedate_to_datetime(published) if published else None
+    except (TypeError, ValueError):
+        published = None
+    return {
+        "guid": element.findtext("guid") or element.findtext("link") or "",
+        "title": element.findtext("title") or "",
+        "description": element.findtext("description") or "",
+        "published": published,
+    }
+
+
+class FeedProcessor:
+    """
+    Incremental reader of the AWS status RSS feed.
+
+    The feed lists items newest first. poll() streams the raw response bytes
+    through a pull parser and builds items only until it reaches one it has
+    already seen (by GUID, or older than the newest known pubDate); past
+    that point it only notes GUIDs, so it knows which items are still in
+    the feed. An unchanged feed is answered with 304 Not Modified and not
+    read at all.
+
+    `items` keeps recent items, including ones the feed has since dropped
+    (resolved incidents age out); current_items() is what the feed holds now.
+
+    Args:
+        url: RSS feed URL
+        max_items: Number of recent items kept in `items`
+    """
+
+    def __init__(self, url: str = FEED_URL, max_items: int = 500):
+        self.url = url
+        self.items = deque(maxlen=max_items)  # newest first
+        self.newest_guid = None
+        self.newest_published = None
+        self._known = set()
+        self._present = frozenset()  # GUIDs in the feed as last read
+        self._etag = None
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener):
+        """Call listener(new_items) after every poll that found new items."""
+        self._listeners.append(listener)
+
+    def poll(self) -> list:
+        """
+        Fetch the feed and return the items not seen before, newest first.
+
+        Returns:
+            New items as dicts with "guid", "title", "description" and
+            "published" (timezone-aware datetime, or None)
+        """
+        with self._lock:
+            headers = {"User-Agent": "DevOpsAgent/1.0"}
+            if self._etag and self.items:
+                headers["If-None-Match"] = self._etag
+
+            new = []
+            with requests.get(self.url, timeout=10, headers=headers, stream=True) as response:
+                if response.status_code == 304:
+                    return []
+                response.raise_for_status()
+
+                parser = ET.XMLPullParser(events=("end",))
+                present = set()
+                caught_up = False
+                try:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        parser.feed(chunk)
+                        caught_up = self._read_items(parser, new, present, caught_up)
+                    parser.close()   # raises on a truncated document
+                except ET.ParseError as e:
+                    # An HTML error page or a cut-off body: fail like any other bad
+                    # response so the breaker counts it and the last good items stay
+                    raise requests.RequestException(f"Malformed AWS status feed: {e}") from e
+                self._present = frozenset(present)
+                self._etag = response.headers.get("ETag")
+
+            if new:
+                self.newest_guid = new[0]["guid"]
+                if new[0]["published"] is not None:
+                    self.newest_published = new[0]["published"]
+                for item in reversed(new):
+                    if len(self.items) == self.items.maxlen:
+                        self._known.discard(self.items[-1]["guid"])
+                    self.items.appendleft(item)
+                    self._known.add(item["guid"])
+                for listener in self._listeners:
+                    listener(new)
+            return new
+
+    def _read_items(self, parser: ET.XMLPullParser, new: list, present: set, caught_up: bool) -> bool:
+        """
+        Collect finished <item>s: new ones into `new` until a known item is
+        reached, the GUID of every one into `present`. Returns whether a
+        known item has been reached (`caught_up` for the next chunk).
+        """
+        for _, element in parser.read_events():
+            if element.tag != "item":
+                continue
+            if caught_up:
+                # Only the GUID: the rest of the item is already known
+                present.add(element.findtext("guid") or element.findtext("link") or "")
+            else:
+                item = _parse_item(element)
+                present.add(item["guid"])
+                if item["guid"] in self._known or (
+                    self.newest_published is not None and item["published"] is not None
+                    and item["published"] < self.newest_published
+                ):
+                    caught_up = True
+                else:
+                    new.append(item)
+            element.clear()
+        return caught_up
+
+    def current_items(self) -> list:
+        """Known items still in the feed as last read, newest first."""
+        with self._lock:
+            return [item for item in self.items if item["guid"] in self._present]
+
+
+# Shared feed reader: every caller sees the same recent items
+feed_processor = FeedProcessor()
+
+
+def _poll() -> tuple:
+    """(new items, stale) through the feed's circuit breaker; stale polls return no new items."""
+    new, stale = get_breaker("status.aws.amazon.com").call(feed_processor.url, feed_processor.poll)
+    return ([] if stale else new), stale
+
+
+def poll_feed() -> list:
+    """New AWS status feed items since the last poll (see FeedProcessor.poll)."""
+    return _poll()[0]
+
 
 @tool
 def check_aws_status(region: str = "us-east-1") -> dict:
@@ -21,34 +176,44 @@ def check_aws_status(region: str = "us-east-1") -> dict:
     Returns:
         Current AWS service status and any ongoing incidents
     """
+    if get_region(region) is None:
+        return {
+            "region": region,
+            "status": "unknown",
+            "message": f"{region} is not a known AWS region code (e.g., us-east-1, eu-west-1)."
+        }
+    region = region.strip().lower()
+
     try:
         # Use the AWS status RSS feed which is more reliable
-        response = requests.get(
-            f"https://status.aws.amazon.com/rss/all.rss",
-            timeout=10,
-            headers={"User-Agent": "DevOpsAgent/1.0"}
-        )
-        response.raise_for_status()
+        # Only items published since the last check are parsed in full
+        _, stale = _poll()
 
-        # Parse RSS for region-specific issues
-        content = response.text.lower()
-        region_mentioned = region.lower() in content
+        # Parse RSS for region-specific issues; items the feed has dropped
+        # since (resolved and aged out) no longer count
+        region_mentioned = any(
+            region in (item["guid"] + item["title"] + item["description"]).lower()
+            for item in feed_processor.current_items()
+        )
 
         # Check for recent items mentioning the region
         if region_mentioned:
-            return {
+            result = {
                 "region": region,
                 "status": "check_needed",
                 "message": f"AWS status feed mentions {region}. Check https://health.aws.amazon.com for details.",
                 "recommendation": "Review AWS Health Dashboard before deploying"
             }
         else:
-            return {
+            result = {
                 "region": region,
                 "status": "healthy",
                 "message": f"No recent issues found for {region} in AWS status feed.",
                 "recommendation": "Safe to proceed with deployment"
             }
+        if stale:
+            result.update(stale)
+        return result
 
     except requests.RequestException as e:
         return {
@@ -0,0 +1,233 @@
+"""
+Circuit Breakers
+================
+Per-upstream circuit breakers with a last-known-good fallback.
+
+A slow or failing upstream (wttr.in, the AWS status feed, a status page,
+IPAM) used to make every tool call wait out its full timeout. Each upstream
+now gets a CircuitBreaker that watches its recent calls:
+
+    closed     calls go through; the outcome of the last `window` calls is kept
+    open       tripped when, over at least `min_calls` recent calls, the share
+               of failures or of calls slower than `slow_call_seconds` reaches
+               `failure_rate`; calls are rejected without touching the network
+    half-open  after `open_seconds` one probe call goes through: success
+               closes the breaker, failure opens it again
+
+Every successful result is kept per key (e.g. per location) as the last
+known good value. When a call fails or is rejected, that value is returned
+instead, with `stale` fields telling the agent how old it is; only when
+there is none (or it is older than `max_stale_seconds`) does the error
+reach the caller. A rejection raises CircuitOpenError, a
+requests.RequestException, so tools report it like any network error.
+
+Usage:
+    breaker = get_breaker("wttr.in")
+    data, stale = breaker.call(location, fetch_forecast, location)
+    result = {...}
+    if stale:
+        result.update(stale)   # {"stale": True, "stale_age_seconds": ..., "stale_reason": ...}
+
+Environment:
+    BREAKER_FAILURE_RATE       Share of failed or slow calls that trips a breaker (default: 0.5)
+    BREAKER_SLOW_CALL_SECONDS  Calls slower than this count as slow (default: 5)
+    BREAKER_OPEN_SECONDS       Seconds a tripped breaker rejects calls before probing (default: 30)
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(requests.RequestException):
+    """The upstream's breaker is open and no last-known-good result is available."""
+
+
+def _client_error(error: Exception) -> bool:
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    return status is not None and 400 <= status < 500 and status != 429
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker and last-known-good cache for one upstream.
+
+    Args:
+        name: Upstream name (e.g. "wttr.in")
+        window: Number of recent calls the rates are computed over
+        min_calls: Calls needed in the window before the breaker can trip
+        failure_rate: Share of failed or slow calls that trips the breaker
+        slow_call_seconds: Calls slower than this count as slow
+        open_seconds: Seconds the breaker stays open before a probe call
+        failures: Exception types that count as upstream failures
+        cache_size: Keys whose last good result is kept
+        max_stale_seconds: Oldest last-known-good result that is still served
+    """
+
+    def __init__(self, name: str, window: int = 20, min_calls: int = 5, failure_rate: float = 0.5,
+                 slow_call_seconds: float = 5.0, open_seconds: float = 30.0,
+                 failures: tuple = (requests.RequestException, ValueError), cache_size: int = 64,
+                 max_stale_seconds: float = 24 * 3600):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.failures = failures
+        self.cache_size = cache_size
+        self.max_stale_seconds = max_stale_seconds
+        self.state = CLOSED
+        self.opened_at = None
+        self._outcomes = deque(maxlen=window)  # (failed, slow) per call
+        self._probing = False
+        self._last_good = OrderedDict()  # key -> (value, stored_at)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, name: str, **kwargs) -> "CircuitBreaker":
+        """Build with the trip thresholds from the environment."""
+        settings = {
+            "failure_rate": float(os.getenv("BREAKER_FAILURE_RATE", "0.5")),
+            "slow_call_seconds": float(os.getenv("BREAKER_SLOW_CALL_SECONDS", "5")),
+            "open_seconds": float(os.getenv("BREAKER_OPEN_SECONDS", "30")),
+        }
+        settings.update(kwargs)
+        return cls(name, **settings)
+
+    # State
+
+    def _admit(self) -> bool:
+        """Whether a call may go to the upstream now (claims the probe when half-open)."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.open_seconds:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def _record(self, failed: bool, elapsed: float):
+        slow = elapsed >= self.slow_call_seconds
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probing = False
+                if failed or slow:
+                    self._trip()
+                else:
+                    self.state = CLOSED
+                    self._outcomes.clear()
+                return
+            self._outcomes.append((failed, slow))
+            if self.state == CLOSED and len(self._outcomes) >= self.min_calls:
+                failed_share = sum(f for f, _ in self._outcomes) / len(self._outcomes)
+                slow_share = sum(s for _, s in self._outcomes) / len(self._outcomes)
+                if max(failed_share, slow_share) >= self.failure_rate:
+                    self._trip()
+
+    def _trip(self):
+        if self.state != OPEN:
+            logger.warning("circuit breaker for %s opened", self.name)
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+
+    # Calls
+
+    def call(self, key, fn, *args, **kwargs) -> tuple:
+        """
+        Call fn(*args, **kwargs) through the breaker.
+
+        Returns:
+            (value, stale): stale is None for a fresh result, or a dict of
+            "stale", "stale_age_seconds" and "stale_reason" when value is the
+            last good result for `key` served in place of a failed or
+            rejected call
+        """
+        if not self._admit():
+            return self._fallback(key, CircuitOpenError(
+                f"{self.name} is failing or slow; not calling it for up to {self.open_seconds:.0f}s"
+            ))
+
+        start = time.monotonic()
+        try:
+            value = fn(*args, **kwargs)
+        except self.failures as e:
+            if _client_error(e):
+                # The request was wrong (404, 400, ...), the upstream is fine
+                self._record(False, time.monotonic() - start)
+                raise
+            self._record(True, time.monotonic() - start)
+            return self._fallback(key, e)
+        except BaseException:
+            # Not the upstream's fault: release a half-open probe without judging
+            with self._lock:
+                self._probing = False
+            raise
+        self._record(False, time.monotonic() - start)
+
+        with self._lock:
+            self._last_good[key] = (value, time.time())
+            self._last_good.move_to_end(key)
+            while len(self._last_good) > self.cache_size:
+                self._last_good.popitem(last=False)
+        return value, None
+
+    def _fallback(self, key, error: Exception) -> tuple:
+        with self._lock:
+            entry = self._last_good.get(key)
+        if entry is None or time.time() - entry[1] > self.max_stale_seconds:
+            raise error
+        value, stored_at = entry
+        return value, {
+            "stale": True,
+            "stale_age_seconds": round(time.time() - stored_at),
+            "stale_reason": str(error),
+        }
+
+    def status(self) -> dict:
+        with self._lock:
+            calls = len(self._outcomes)
+            return {
+                "state": self.state,
+                "recent_calls": calls,
+                "failure_share": round(sum(f for f, _ in self._outcomes) / calls, 2) if calls else 0.0,
+                "slow_share": round(sum(s for _, s in self._outcomes) / calls, 2) if calls else 0.0,
+            }
+
+
+# Breakers kept at once; the least recently used is dropped beyond this
+# (fetch_url creates one per host it is pointed at)
+MAX_BREAKERS = 256
+
+_breakers = OrderedDict()
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """The shared breaker for an upstream, created on first use (kwargs apply then)."""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker.from_env(name, **kwargs)
+            while len(_breakers) > MAX_BREAKERS:
+                _breakers.popitem(last=False)
+        else:
+            _breakers.move_to_end(name)
+        return breaker
+
+
+def breaker_status() -> dict:
+    """State of every breaker, by upstream name."""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.status() for breaker in breakers}
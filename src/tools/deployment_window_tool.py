@@ -0,0 +1,220 @@
+"""
+Custom Tool: Deployment Window Planner
+======================================
+Answers "when in the next 48 hours should I deploy to these regions?" in
+one tool call instead of a weather/status/capacity call per region and hour.
+
+All inputs are fetched once, concurrently: the hourly forecast for every
+region, the AWS status feed and (when a capacity source is registered) IPAM
+headroom. Forecast slots are expanded onto a common hourly UTC grid; each
+candidate start hour is then scored for every region with a sliding-window
+maximum, per-region penalties for recent incidents and tight IP capacity
+are added, and the best windows are ranked.
+"""
+
+import math
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import requests
+from strands.tools import tool
+
+from .aws_status_tool import poll_feed
+from .incident_store import incident_store
+from .regions import get_region
+from .weather_tool import RISK_LEVELS, hourly_columns, load_forecast, score_slots, utc_offset
+
+# Score for hours the forecast does not cover (treated as medium risk)
+UNKNOWN_SCORE = 1
+INCIDENT_LOOKBACK_DAYS = 7
+
+# Optional callable(region) -> check_subnet_capacity()-style dict
+_capacity_source = None
+
+
+def register_capacity_source(source):
+    """Let the planner factor in IP headroom (e.g. check_subnet_capacity)."""
+    global _capacity_source
+    _capacity_source = source
+
+
+def hourly_scores(data: dict, start: datetime, hours: int) -> array:
+    """Weather risk per UTC hour from `start` (naive UTC) for `hours` hours."""
+    columns = hourly_columns(data)
+    scores = score_slots(columns)
+    offset = utc_offset(data)
+
+    grid = array("b", [UNKNOWN_SCORE]) * hours
+    for slot_start, score in zip(columns["start"], scores):
+        first = math.floor((slot_start - offset - start).total_seconds() / 3600)
+        for hour in range(max(first, 0), min(first + columns["hours"], hours)):
+            grid[hour] = score
+    return grid
+
+
+def sliding_max(values: array, width: int) -> list:
+    """max(values[i:i + width]) for every window that fits."""
+    return [max(values[i:i + width]) for i in range(len(values) - width + 1)]
+
+
+def _incident_penalty(count: int) -> float:
+    return 0.0 if count == 0 else 0.5 if count <= 2 else 1.0
+
+
+def _capacity_penalty(capacity: dict) -> float:
+    recommendation = str(capacity.get("recommendation", "")).upper()
+    if recommendation.startswith("NO-GO"):
+        return math.inf
+    if recommendation.startswith("GO"):
+        return 0.0
+    if capacity.get("status") == "warning":
+        return 1.0  # enough IPs, but the subnets are over 80% utilized
+    return 0.5  # capacity could not be verified
+
+
+def _load_inputs(regions: list, min_required_ips: int) -> tuple:
+    """Fetch forecasts, the status feed and capacity for all regions at once."""
+    def capacity(code):
+        if _capacity_source is None:
+            return None
+        return _capacity_source(code, min_required_ips)
+
+    with ThreadPoolExecutor(max_workers=2 * len(regions) + 1) as pool:
+        # Regions missing from the catalog have no location to forecast
+        forecasts = {r.code: pool.submit(load_forecast, r.coordinates) for r in regions if r.coordinates}
+        capacities = {r.code: pool.submit(capacity, r.code) for r in regions}
+        feed = pool.submit(poll_feed)
+
+    results = {}
+    for code in capacities:
+        try:
+            if code not in forecasts:
+                raise ValueError("datacenter location not known")
+            forecast, stale = forecasts[code].result()
+            results[code] = {"forecast": forecast, "error": None, "stale": stale}
+        except (requests.RequestException, ValueError) as e:
+            results[code] = {"forecast": None, "error": f"weather unavailable: {e}", "stale": None}
+        try:
+            results[code]["capacity"] = capacities[code].result()
+        except Exception as e:
+            results[code]["capacity"] = {"status": "error", "message": str(e)}
+    try:
+        items = feed.result()
+    except (requests.RequestException, ValueError):
+        items = None
+    return results, items
+
+
+@tool
+def plan_deployment_window(regions: str, window_hours: int = 3, horizon_hours: int = 48,
+                           min_required_ips: int = 10) -> dict:
+    """
+    Find the best times to deploy to one or more AWS regions.
+    Combines the hourly weather forecast at each region's datacenters,
+    recent AWS incidents per region and IP capacity, and ranks candidate
+    windows. Use this instead of checking each region and hour separately.
+
+    Args:
+        regions: Comma-separated AWS region codes (e.g., "us-east-1,eu-west-1")
+        window_hours: Length of the deployment window in hours (default: 3)
+        horizon_hours: How far ahead to search, in hours (default: 48, max: 60)
+        min_required_ips: Free IPs each region needs for the deployment (default: 10)
+
+    Returns:
+        Ranked windows (UTC) for deploying to all regions at once, the best
+        window per region, and the per-region factors behind the scores
+    """
+    codes = [code.strip() for code in regions.split(",") if code.strip()]
+    unknown = [code for code in codes if get_region(code) is None]
+    if not codes or unknown:
+        return {"status": "error", "message": f"Unknown region codes: {', '.join(unknown) or regions}"}
+    region_list = [get_region(code) for code in dict.fromkeys(codes)]
+    window_hours = max(1, window_hours)
+    horizon_hours = max(1, min(horizon_hours, 60))
+
+    inputs, feed_items = _load_inputs(region_list, min_required_ips)
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    start = now + timedelta(hours=1)  # first full hour from now
+    since = now - timedelta(days=INCIDENT_LOOKBACK_DAYS)
+
+    # regions x candidate start hours
+    grid_hours = horizon_hours + window_hours - 1
+    window_risk = {}
+    penalties = {}
+    factors = {}
+    for region in region_list:
+        entry = inputs[region.code]
+        if entry["forecast"] is not None:
+            hourly = hourly_scores(entry["forecast"], start.replace(tzinfo=None), grid_hours)
+        else:
+            hourly = array("b", [UNKNOWN_SCORE]) * grid_hours
+        window_risk[region.code] = sliding_max(hourly, window_hours)
+
+        incidents = None
+        if feed_items is not None:
+            # New feed items were ingested into the incident store by the poll
+            incidents = incident_store.count(region.code, since=since.timestamp(), openings=True)
+        capacity = entry["capacity"]
+        penalties[region.code] = (
+            (_incident_penalty(incidents) if incidents is not None else 0.5)
+            + (_capacity_penalty(capacity) if capacity is not None else 0.0)
+        )
+        factors[region.code] = {
+            "metro": region.metro,
+            f"incidents_last_{INCIDENT_LOOKBACK_DAYS}d": incidents,
+            "ip_capacity": (capacity or {}).get("recommendation", "not checked"),
+            "weather_error": entry["error"],
+        }
+        if entry["stale"]:
+            factors[region.code]["weather_stale_seconds"] = entry["stale"]["stale_age_seconds"]
+
+    # Cost of each (region, start): weather risk of the worst hour + region penalty
+    costs = {
+        code: [risk + penalties[code] for risk in window_risk[code]]
+        for code in window_risk
+    }
+    # Deploying everywhere at once: a start is as good as its worst region
+    joint = [
+        (max(column), sum(column), hour)
+        for hour, column in enumerate(zip(*costs.values()))
+    ]
+    joint.sort()
+
+    def window(hour: int) -> dict:
+        begin = start + timedelta(hours=hour)
+        return {
+            "start_utc": begin.strftime("%Y-%m-%d %H:%M"),
+            "end_utc": (begin + timedelta(hours=window_hours)).strftime("%Y-%m-%d %H:%M"),
+        }
+
+    blocked = sorted(code for code, penalty in penalties.items() if penalty == math.inf)
+    ranked = [
+        dict(window(hour), score=round(worst, 2),
+             weather={code: RISK_LEVELS[window_risk[code][hour]] for code in window_risk})
+        for worst, _, hour in joint[:5] if worst != math.inf
+    ]
+    best_per_region = {}
+    for code, row in costs.items():
+        hour = min(range(len(row)), key=row.__getitem__)
+        best_per_region[code] = dict(
+            window(hour), score=round(row[hour], 2) if row[hour] != math.inf else None,
+            weather=RISK_LEVELS[window_risk[code][hour]],
+        )
+
+    if blocked:
+        recommendation = f"NO-GO for {', '.join(blocked)}: not enough free IPs"
+    elif ranked and ranked[0]["score"] < 2:
+        recommendation = f"Deploy {ranked[0]['start_utc']} - {ranked[0]['end_utc']} UTC"
+    else:
+        recommendation = "CAUTION - no low-risk window in the horizon"
+
+    return {
+        "recommendation": recommendation,
+        "ranked_windows": ranked,
+        "best_per_region": best_per_region,
+        "region_factors": factors,
+        "window_hours": window_hours,
+        "horizon_hours": horizon_hours,
+        "status_feed": "ok" if feed_items is not None else "unavailable",
+    }
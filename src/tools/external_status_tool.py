@@ -0,0 +1,249 @@
+"""
+Custom Tool: External Dependency Status
+=======================================
+Reports the health of third-party services a deployment depends on
+(GitHub, CI providers, package registries, ...).
+
+Most vendors publish an Atlassian Statuspage at /api/v2/summary.json.
+StatusAggregator polls every configured page concurrently on a schedule,
+using conditional GETs so unchanged pages cost a 304, and keeps a normalized
+snapshot in memory. check_external_dependencies answers from that snapshot
+with a dictionary lookup instead of fetching pages during the conversation.
+Each page has a circuit breaker (breaker.py), so a page that keeps failing
+or timing out is skipped, keeping its last reading flagged stale, instead
+of holding up every poll.
+
+Environment:
+    STATUS_PAGES          Comma-separated name=url pairs replacing the default list
+    STATUS_POLL_INTERVAL  Seconds between polls (default: 60)
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from strands.tools import tool
+
+from .breaker import get_breaker
+
+logger = logging.getLogger(__name__)
+
+# Statuspage summary endpoints, keyed by the name the agent uses
+DEFAULT_STATUS_PAGES = {
+    "github": "https://www.githubstatus.com/api/v2/summary.json",
+    "circleci": "https://status.circleci.com/api/v2/summary.json",
+    "bitbucket": "https://bitbucket.status.atlassian.com/api/v2/summary.json",
+    "npm": "https://status.npmjs.org/api/v2/summary.json",
+    "pypi": "https://status.python.org/api/v2/summary.json",
+    "docker": "https://www.dockerstatus.com/api/v2/summary.json",
+}
+
+# Statuspage indicators, from best to worst
+INDICATOR_SEVERITY = {"none": 0, "maintenance": 1, "minor": 2, "major": 3, "critical": 4}
+
+
+def load_status_pages() -> dict:
+    """Status pages from STATUS_PAGES ("github=https://...,npm=https://..."), or the defaults."""
+    configured = os.getenv("STATUS_PAGES")
+    if not configured:
+        return dict(DEFAULT_STATUS_PAGES)
+    pages = {}
+    for pair in configured.split(","):
+        name, _, url = pair.partition("=")
+        if name.strip() and url.strip():
+            pages[name.strip().lower()] = url.strip()
+    return pages
+
+
+def normalize_summary(name: str, data: dict) -> dict:
+    """Reduce a Statuspage summary.json document to the fields the agent needs."""
+    status = data.get("status", {})
+    incidents = data.get("incidents", [])
+    maintenances = [
+        m for m in data.get("scheduled_maintenances", []) if m.get("status") == "in_progress"
+    ]
+    indicator = status.get("indicator", "none")
+    if indicator == "none" and maintenances:
+        indicator = "maintenance"
+    return {
+        "name": name,
+        "indicator": indicator,
+        "description": status.get("description", "Unknown"),
+        "degraded_components": [
+            component["name"]
+            for component in data.get("components", [])
+            if component.get("status", "operational") != "operational" and not component.get("group")
+        ],
+        "active_incidents": [
+            {"name": i.get("name"), "impact": i.get("impact"), "status": i.get("status")}
+            for i in incidents if i.get("status") not in ("resolved", "postmortem")
+        ],
+        "maintenance_in_progress": [m.get("name") for m in maintenances],
+        "updated_at": data.get("page", {}).get("updated_at"),
+    }
+
+
+def _recommendation(indicator: str) -> str:
+    severity = INDICATOR_SEVERITY.get(indicator, 2)
+    if severity >= 3:
+        return "NO-GO"
+    if severity >= 1:
+        return "CAUTION"
+    return "GO"
+
+
+class StatusAggregator:
+    """
+    Polls Statuspage endpoints concurrently and keeps a normalized snapshot.
+
+    The snapshot is rebuilt after each poll and swapped in whole, so readers
+    never see a half-updated view and never take a lock.
+
+    Args:
+        pages: Mapping of service name to summary.json URL
+        interval: Seconds between polls
+        max_workers: Maximum number of pages fetched at the same time
+    """
+
+    def __init__(self, pages: dict, interval: int = 60, max_workers: int = 8):
+        self.pages = pages
+        self.interval = interval
+        self.max_workers = max_workers
+        self.snapshot = {"services": {}, "overall": None, "polled_at": None}
+
+        self._validators = {}  # name -> (etag, last_modified)
+        self._session = requests.Session()
+        self._session.headers["User-Agent"] = "DevOpsAgent/1.0"
+        self._session.mount("https://", HTTPAdapter(pool_connections=len(pages) or 1,
+                                                    pool_maxsize=max_workers))
+        self._started = False
+        self._start_lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def start(self) -> "StatusAggregator":
+        """Poll once (so the first answer is complete), then keep polling in the background."""
+        with self._start_lock:
+            if self._started:
+                return self
+            self._started = True
+        self.poll()
+        threading.Thread(target=self._run, name="status-poller", daemon=True).start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+
+    def poll(self):
+        """Fetch every page concurrently and publish a new snapshot."""
+        previous = self.snapshot["services"]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = pool.map(
+                lambda item: self._poll_page(item[0], item[1], previous.get(item[0])),
+                self.pages.items(),
+            )
+            services = {entry["name"]: entry for entry in results}
+
+        reachable = [s for s in services.values() if not s.get("error")]
+        worst = max(
+            (s["indicator"] for s in reachable),
+            key=lambda indicator: INDICATOR_SEVERITY.get(indicator, 2),
+            default="none",
+        )
+        self.snapshot = {
+            "services": services,
+            "overall": {
+                "indicator": worst,
+                "recommendation": _recommendation(worst),
+                "affected": sorted(s["name"] for s in reachable if s["indicator"] != "none"),
+                "unreachable": sorted(s["name"] for s in services.values() if s.get("error")),
+            },
+            "polled_at": time.time(),
+        }
+
+    def _poll_page(self, name: str, url: str, previous: dict = None) -> dict:
+        headers = {}
+        etag, last_modified = self._validators.get(name, (None, None))
+        if previous is not None and not previous.get("error"):
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            # Readings are kept in the snapshot, so the breaker keeps no results
+            response, _ = get_breaker(f"statuspage:{name}", cache_size=0).call(
+                url, self._get, url, headers
+            )
+            if response.status_code == 304:
+                return dict(previous, checked_at=time.time())
+            entry = normalize_summary(name, response.json())
+            self._validators[name] = (
+                response.headers.get("ETag"), response.headers.get("Last-Modified")
+            )
+        except (requests.RequestException, ValueError) as e:
+            logger.info("status page %s unavailable: %s", name, e)
+            entry = {"name": name, "indicator": "unknown", "description": "Status page unreachable",
+                     "error": str(e)}
+            if previous is not None and (not previous.get("error") or previous.get("stale")):
+                # Keep the last good reading, flagged as stale, until the page answers again
+                entry = dict(previous, error=str(e), stale=True)
+
+        entry["checked_at"] = time.time()
+        return entry
+
+    def _get(self, url: str, headers: dict) -> requests.Response:
+        response = self._session.get(url, headers=headers, timeout=10)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning("status poll failed: %s", e)
+
+
+# Shared aggregator, started by the first check_external_dependencies call
+status_aggregator = StatusAggregator(
+    load_status_pages(),
+    interval=int(os.getenv("STATUS_POLL_INTERVAL", "60")),
+)
+
+
+@tool
+def check_external_dependencies(service: str = "all") -> dict:
+    """
+    Check the status of external services a deployment depends on
+    (GitHub, CircleCI, Bitbucket, npm, PyPI, Docker Hub).
+
+    Args:
+        service: Service name (e.g., "github", "npm") or "all" for every monitored service
+
+    Returns:
+        Status indicator, active incidents and degraded components, plus an
+        overall GO / CAUTION / NO-GO recommendation when service is "all"
+    """
+    snapshot = status_aggregator.start().snapshot
+    age = round(time.time() - snapshot["polled_at"]) if snapshot["polled_at"] else None
+
+    if service.lower() == "all":
+        return {
+            "overall": snapshot["overall"],
+            "services": snapshot["services"],
+            "snapshot_age_seconds": age,
+        }
+
+    entry = snapshot["services"].get(service.lower())
+    if entry is None:
+        return {
+            "service": service,
+            "status": "unknown",
+            "message": f"{service} is not monitored. Monitored services: {', '.join(sorted(snapshot['services']))}",
+        }
+    return dict(entry, recommendation=_recommendation(entry["indicator"]), snapshot_age_seconds=age)
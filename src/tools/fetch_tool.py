@@ -0,0 +1,228 @@
+"""
+Custom Tool: Web Fetch
+======================
+Fetches a URL in-process, as a lighter alternative to the Fetch MCP server.
+
+The agent mostly fetches small status-page JSON documents, so spawning
+`uvx mcp-server-fetch` and proxying over stdio costs far more than the
+request itself. This tool keeps pooled HTTP connections, caches responses
+per URL (revalidated with ETag / Last-Modified once the TTL expires), caps
+the number of bytes read, and turns HTML pages into plain text. Each host
+gets a circuit breaker (breaker.py): while a host is failing or slow, the
+last good response for a URL is returned at once, marked stale. Downloads
+from hosts listed in HEDGE_UPSTREAMS are hedged (hedge.py).
+
+Environment:
+    FETCH_CACHE_TTL    Seconds a cached response is served without revalidation (default: 60)
+    FETCH_MAX_BYTES    Maximum response body read per request (default: 1048576)
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from strands.tools import tool
+
+from .breaker import get_breaker
+from .hedge import get_hedger
+
+CACHE_TTL = int(os.getenv("FETCH_CACHE_TTL", "60"))
+MAX_BYTES = int(os.getenv("FETCH_MAX_BYTES", str(1024 * 1024)))
+MAX_CACHE_ENTRIES = 128
+
+# One session for all fetches: keeps TCP/TLS connections to each host open
+_session = requests.Session()
+_session.headers["User-Agent"] = "DevOpsAgent/1.0"
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+# url -> {"fetched_at", "etag", "last_modified", "status_code", "content_type",
+#         "encoding", "body", "truncated"}, least recently used first
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the visible text of an HTML document."""
+
+    SKIP = {"script", "style", "noscript", "template", "svg", "head"}
+    BLOCK = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6",
+             "section", "article", "header", "footer", "table", "ul", "ol", "pre"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP:
+            self._skip_depth += 1
+        elif tag in self.BLOCK:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in self.BLOCK:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def html_to_text(html: str) -> str:
+    """Strip tags, scripts and styles from HTML and collapse whitespace."""
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    lines = (" ".join(line.split()) for line in "".join(extractor.parts).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _read_limited(response: requests.Response) -> tuple:
+    """Read at most MAX_BYTES of the body. Returns (bytes, truncated)."""
+    chunks, size = [], 0
+    for chunk in response.iter_content(chunk_size=16384):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= MAX_BYTES:
+            response.close()
+            return b"".join(chunks)[:MAX_BYTES], True
+    return b"".join(chunks), False
+
+
+def _download(url: str, entry: dict = None) -> tuple:
+    """GET a URL, conditionally when there is a cached entry. Returns (entry, cached)."""
+    headers = {}
+    if entry is not None:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    with _session.get(url, headers=headers, timeout=10, stream=True) as response:
+        if response.status_code == 304 and entry is not None:
+            entry = dict(entry, fetched_at=time.time())
+            cached = True
+        else:
+            response.raise_for_status()
+            body, truncated = _read_limited(response)
+            entry = {
+                "fetched_at": time.time(),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "status_code": response.status_code,
+                "content_type": response.headers.get("Content-Type", ""),
+                "encoding": response.encoding or "utf-8",
+                "body": body,
+                "truncated": truncated,
+            }
+            cached = False
+    return entry, cached
+
+
+def _last_good(url: str, error: Exception):
+    """The cached entry for a URL to serve in place of a failed fetch, or None."""
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is not None and 400 <= status < 500 and status != 429:
+        return None  # the URL itself is wrong, not the host
+    with _cache_lock:
+        return _cache.get(url)
+
+
+def _fetch(url: str) -> tuple:
+    """
+    Return (entry, cached) for a URL, using the cache and conditional requests.
+
+    `cached` is True when no body was downloaded (fresh entry or 304).
+    """
+    with _cache_lock:
+        entry = _cache.get(url)
+        if entry is not None:
+            _cache.move_to_end(url)
+    if entry is not None and time.time() - entry["fetched_at"] < CACHE_TTL:
+        return entry, True
+
+    # Only the download is hedged (see hedge.py): cache hits would skew its latencies
+    entry, cached = get_hedger(urlsplit(url).netloc or url).call(_download, url, entry)
+
+    with _cache_lock:
+        _cache[url] = entry
+        _cache.move_to_end(url)
+        while len(_cache) > MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return entry, cached
+
+
+def _render(url: str, entry: dict, cached: bool, max_length: int, start_index: int, raw: bool,
+            stale: dict = None) -> dict:
+    """fetch_url's result for a cache entry."""
+    text = entry["body"].decode(entry["encoding"], errors="replace")
+    content_type = entry["content_type"].lower()
+    if "json" in content_type:
+        try:
+            text = json.dumps(json.loads(text), separators=(",", ":"))
+        except ValueError:
+            pass
+    elif "html" in content_type and not raw:
+        text = html_to_text(text)
+
+    content = text[start_index:start_index + max_length]
+    result = {
+        "url": url,
+        "status_code": entry["status_code"],
+        "content_type": entry["content_type"],
+        "content": content,
+        "truncated": entry["truncated"] or start_index + max_length < len(text),
+        "next_start_index": start_index + len(content),
+        "cached": cached
+    }
+    if stale:
+        result.update(stale)
+    return result
+
+
+@tool
+def fetch_url(url: str, max_length: int = 5000, start_index: int = 0, raw: bool = False) -> dict:
+    """
+    Fetch a URL and return its contents as text.
+    Useful for checking status pages of external services (GitHub, CI/CD, etc.).
+    JSON responses are returned as compact JSON, HTML pages as readable text.
+
+    Args:
+        url: The URL to fetch (e.g., "https://www.githubstatus.com/api/v2/status.json")
+        max_length: Maximum number of characters to return
+        start_index: Return content starting at this character (to read long pages in parts)
+        raw: Return HTML as-is instead of converting it to text
+
+    Returns:
+        The page content plus status code, content type and whether it was truncated
+    """
+    try:
+        # The response cache is the last-known-good store, so the breaker keeps none
+        (entry, cached), _ = get_breaker(urlsplit(url).netloc or url, cache_size=0).call(url, _fetch, url)
+    except requests.RequestException as e:
+        entry = _last_good(url, e)
+        if entry is not None:
+            return _render(url, entry, True, max_length, start_index, raw, {
+                "stale": True,
+                "stale_age_seconds": round(time.time() - entry["fetched_at"]),
+                "stale_reason": str(e),
+            })
+        return {
+            "url": url,
+            "status": "error",
+            "message": f"Could not fetch {url}",
+            "error": str(e)
+        }
+
+    return _render(url, entry, cached, max_length, start_index, raw)
+
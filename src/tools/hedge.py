@@ -0,0 +1,178 @@
+"""
+Hedged Requests
+===============
+Cuts the latency tail of slow upstreams (wttr.in in particular) by sending
+a second, identical request when the first is late.
+
+A Hedger learns an upstream's latency online from its recent successful
+requests. Once it has `min_samples`, a call whose request has not answered
+within the `percentile` latency (p95 by default) gets a duplicate request;
+whichever answers first wins, and the other finishes in the background.
+
+Hedges are paid for from a budget: every call earns `budget` tokens (0.1 =
+at most one extra request per ten calls, over time) and a hedge spends one,
+so a slow upstream never sees more than (1 + budget) times its normal load.
+
+Hedging is opt-in per upstream and only used for idempotent GETs.
+
+Usage:
+    data = get_hedger("wttr.in").call(fetch_forecast, location)
+
+Environment:
+    HEDGE_UPSTREAMS   Comma-separated upstreams to hedge ("wttr.in", a host name, or "all"; default: none)
+    HEDGE_BUDGET      Extra requests allowed per call (default: 0.1)
+    HEDGE_PERCENTILE  Latency percentile after which a request is hedged (default: 95)
+"""
+
+import math
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# Requests of every hedger run here, so a late loser does not hold up its caller
+_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="hedge")
+
+
+class Hedger:
+    """
+    Hedged calls to one upstream.
+
+    Args:
+        name: Upstream name (e.g. "wttr.in")
+        enabled: Hedge calls (when False, call() simply calls the function)
+        percentile: Latency percentile after which a duplicate request is sent
+        window: Recent latencies the percentile is learned from
+        min_samples: Latencies needed before hedging starts
+        budget: Hedge tokens earned per call (the share of extra requests allowed)
+        max_tokens: Most hedge tokens saved up, i.e. the largest burst of hedges
+    """
+
+    def __init__(self, name: str, enabled: bool = False, percentile: float = 95, window: int = 200,
+                 min_samples: int = 20, budget: float = 0.1, max_tokens: float = 5):
+        self.name = name
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.budget = budget
+        self.max_tokens = max_tokens
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies = deque(maxlen=window)
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, name: str, **kwargs) -> "Hedger":
+        """Build with hedging enabled when HEDGE_UPSTREAMS names this upstream (or is "all")."""
+        upstreams = {u.strip().lower() for u in os.getenv("HEDGE_UPSTREAMS", "").split(",") if u.strip()}
+        settings = {
+            "enabled": "all" in upstreams or name.lower() in upstreams,
+            "budget": float(os.getenv("HEDGE_BUDGET", "0.1")),
+            "percentile": float(os.getenv("HEDGE_PERCENTILE", "95")),
+        }
+        settings.update(kwargs)
+        return cls(name, **settings)
+
+    def hedge_after(self):
+        """Seconds after which a request is hedged, or None while too few latencies are known."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        return ordered[max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)]
+
+    def _submit(self, fn, args, kwargs):
+        started = time.monotonic()
+        future = _pool.submit(fn, *args, **kwargs)
+
+        def record(done):
+            # Learn from every successful request, including hedges and losers
+            if not done.cancelled() and done.exception() is None:
+                with self._lock:
+                    self._latencies.append(time.monotonic() - started)
+
+        future.add_done_callback(record)
+        return future
+
+    def _spend_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedged += 1
+            return True
+
+    def call(self, fn, *args, **kwargs):
+        """
+        fn(*args, **kwargs), hedged with a duplicate call when it is late.
+
+        Returns the first successful result; raises the first error when
+        every request failed.
+        """
+        if not self.enabled:
+            return fn(*args, **kwargs)
+        with self._lock:
+            self.calls += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.budget)
+        delay = self.hedge_after()
+
+        primary = self._submit(fn, args, kwargs)
+        if delay is None:
+            return primary.result()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._spend_token():
+            return primary.result()
+
+        hedge = self._submit(fn, args, kwargs)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+                error = error or future.exception()
+        raise error
+
+    def status(self) -> dict:
+        delay = self.hedge_after()
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "hedge_after_ms": round(delay * 1000) if delay is not None else None,
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+            }
+
+
+# Hedgers kept at once; the least recently used is dropped beyond this
+# (with HEDGE_UPSTREAMS=all, fetch_url creates one per host)
+MAX_HEDGERS = 64
+
+_hedgers = OrderedDict()
+_hedgers_lock = threading.Lock()
+# Stands in for every upstream hedging is not enabled for, so those keep no state
+_passthrough = Hedger("passthrough", enabled=False)
+
+
+def get_hedger(name: str, **kwargs) -> Hedger:
+    """The shared hedger for an upstream, created on first use (kwargs apply then)."""
+    with _hedgers_lock:
+        hedger = _hedgers.get(name)
+        if hedger is not None:
+            _hedgers.move_to_end(name)
+            return hedger
+        hedger = Hedger.from_env(name, **kwargs)
+        if not hedger.enabled:
+            return _passthrough
+        _hedgers[name] = hedger
+        while len(_hedgers) > MAX_HEDGERS:
+            _hedgers.popitem(last=False)
+        return hedger
@@ -0,0 +1,366 @@
+"""
+Custom Tool: AWS Incident History
+=================================
+Keeps every AWS status feed item ever seen, so the agent can ask how
+reliable a region or service has been without more network calls.
+
+The RSS feed only carries recent items. IncidentStore appends new items
+(deduplicated by GUID) to an append-only, column-per-file store on disk and
+keeps per-region, per-service and per-(region, service) indexes of
+timestamps in memory, so counts over a time range are two binary searches.
+
+Every update of an incident is its own feed item ("Performance issues",
+later "Informational message", then "Service is operating normally"). An
+incident is counted once, by the item that opens it: a degraded or
+disruption item for a (region, service) with no incident in progress,
+i.e. the previous item was a resolution, or is more than REOPEN_AFTER old.
+Openings get indexes of their own, kept up to date as items arrive.
+
+    <INCIDENT_STORE_DIR>/guid.col       one value per line
+                        /published.col  float64 epoch seconds, native byte order
+                        /region.col     e.g. "us-east-1", or "global"
+                        /service.col    e.g. "ec2"
+                        /severity.col   resolved / informational / degraded / disruption
+                        /title.col
+
+Environment:
+    INCIDENT_STORE_DIR  Directory of the store (default: ~/.devops_agent/incidents)
+"""
+
+import bisect
+import os
+import re
+import threading
+import time
+from array import array
+from collections import Counter
+
+import requests
+from strands.tools import tool
+
+from .aws_status_tool import feed_processor, poll_feed
+
+TEXT_COLUMNS = ("guid", "region", "service", "severity", "title")
+
+# GUIDs look like https://status.aws.amazon.com/#ec2-us-east-1_1700000000
+_GUID_PATTERN = re.compile(
+    r"#(?P<service>[a-z0-9-]+?)(?:-(?P<region>(?:us|eu|ap|sa|ca|me|af|il|mx|cn)(?:-gov)?-[a-z]+-\d+))?_\d+$"
+)
+
+# Feed titles start with the kind of event
+_SEVERITY_PREFIXES = (
+    ("service is operating normally", "resolved"),
+    ("informational message", "informational"),
+    ("performance issues", "degraded"),
+    ("service disruption", "disruption"),
+)
+
+# Items that open an incident (when none is in progress)
+OPENING_SEVERITIES = frozenset({"degraded", "disruption"})
+
+# An incident without an update for this long is over, even if its
+# resolution never reached the store
+REOPEN_AFTER = 24 * 3600
+
+# Refresh the store from the feed at most this often when the tool is used
+INGEST_INTERVAL = 300
+
+
+def parse_feed_item(item: dict) -> dict:
+    """Derive region, service and severity from a feed item's GUID and title."""
+    match = _GUID_PATTERN.search(item["guid"])
+    service = match.group("service") if match else "unknown"
+    region = (match.group("region") if match else None) or "global"
+
+    title = item["title"].lower()
+    severity = next((s for prefix, s in _SEVERITY_PREFIXES if title.startswith(prefix)), "informational")
+    published = item["published"].timestamp() if item.get("published") else time.time()
+    return {
+        "guid": item["guid"],
+        "published": published,
+        "region": region,
+        "service": service,
+        "severity": severity,
+        "title": " ".join(item["title"].split()),
+    }
+
+
+class IncidentStore:
+    """
+    Append-only columnar store of AWS status feed items.
+
+    Args:
+        path: Directory holding the column files; None keeps everything in memory
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.columns = {name: [] for name in TEXT_COLUMNS}
+        self.columns["published"] = array("d")
+        self._guids = set()
+        self._index = {}  # key -> (sorted timestamps array, row ids array)
+        self._openings = {}  # the same, for the rows that open an incident
+        self._ongoing = array("b")  # per row: an incident is in progress after it
+        self._opens = array("b")  # per row: it opens an incident
+        self._lock = threading.Lock()
+        self.last_ingest = 0.0
+        if path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.columns["published"])
+
+    # Writing
+
+    def append(self, rows: list) -> int:
+        """Append parsed rows whose GUID is new. Returns how many were added."""
+        with self._lock:
+            new = []
+            for row in rows:
+                if row["guid"] not in self._guids:
+                    self._guids.add(row["guid"])
+                    new.append(row)
+            if not new:
+                return 0
+            if self.path:
+                self._write(new)
+            # The feed lists newest first; in time order each add is an append
+            for row in sorted(new, key=lambda row: row["published"]):
+                self._add(row)
+            return len(new)
+
+    def ingest(self, items: list) -> int:
+        """Append raw feed items (from poll_feed)."""
+        added = self.append([parse_feed_item(item) for item in items])
+        self.last_ingest = time.time()
+        return added
+
+    # Reading
+
+    def count(self, region: str = None, service: str = None, since: float = None, until: float = None,
+              openings: bool = False) -> int:
+        """
+        Number of items matching region/service published in [since, until).
+        With `openings`, only items that opened an incident (i.e. incidents).
+        """
+        with self._lock:
+            timestamps, _ = self._lookup(region, service, openings)
+            selected = self._range(timestamps, since, until)
+            return selected.stop - selected.start
+
+    def breakdown(self, column: str, region: str = None, service: str = None, since: float = None,
+                  until: float = None, openings: bool = False) -> Counter:
+        """Counter of a text column's values over the matching items."""
+        with self._lock:
+            timestamps, rows = self._lookup(region, service, openings)
+            values = self.columns[column]
+            return Counter(values[row] for row in rows[self._range(timestamps, since, until)])
+
+    def query(self, region: str = None, service: str = None, since: float = None,
+              until: float = None, limit: int = None, openings: bool = False) -> list:
+        """Matching items as dicts, newest first (only the newest `limit` are built)."""
+        with self._lock:
+            timestamps, rows = self._lookup(region, service, openings)
+            selected = self._range(timestamps, since, until)
+            start = selected.start if limit is None else max(selected.start, selected.stop - limit)
+            return [
+                {name: self.columns[name][row] for name in (*TEXT_COLUMNS, "published")}
+                for row in reversed(rows[start:selected.stop])
+            ]
+
+    def _lookup(self, region: str, service: str, openings: bool) -> tuple:
+        index = self._openings if openings else self._index
+        return index.get(self._key(region, service), (array("d"), array("l")))
+
+    @staticmethod
+    def _range(timestamps: array, since: float = None, until: float = None) -> slice:
+        start = 0 if since is None else bisect.bisect_left(timestamps, since)
+        end = len(timestamps) if until is None else bisect.bisect_left(timestamps, until)
+        return slice(start, end)
+
+    @staticmethod
+    def _key(region: str = None, service: str = None) -> tuple:
+        return (region.lower() if region else None, service.lower() if service else None)
+
+    # Indexing
+
+    @staticmethod
+    def _keys(region: str, service: str) -> set:
+        return {(None, None), (region, None), (None, service), (region, service)}
+
+    def _add(self, row: dict):
+        row_id = len(self.columns["published"])
+        for name in TEXT_COLUMNS:
+            self.columns[name].append(row[name])
+        self.columns["published"].append(row["published"])
+        self._ongoing.append(0)
+        self._opens.append(0)
+
+        for key in self._keys(row["region"], row["service"]):
+            timestamps, rows = self._index.setdefault(key, (array("d"), array("l")))
+            # Items mostly arrive in time order, so this is usually an append
+            position = bisect.bisect_right(timestamps, row["published"])
+            timestamps.insert(position, row["published"])
+            rows.insert(position, row_id)
+            if key == (row["region"], row["service"]):
+                self._track_incidents(rows, position)
+
+    def _track_incidents(self, rows: array, position: int):
+        """
+        Work out which rows of one (region, service) open an incident, from
+        `position` (a new row) on. A row that arrived out of order can change
+        the state of the rows after it, up to the first one that keeps its state.
+        """
+        published = self.columns["published"]
+        severity = self.columns["severity"]
+        for p in range(position, len(rows)):
+            row = rows[p]
+            previous = rows[p - 1] if p else None
+            in_progress = (previous is not None and self._ongoing[previous]
+                           and published[row] - published[previous] <= REOPEN_AFTER)
+            if severity[row] in OPENING_SEVERITIES:
+                ongoing, opens = True, not in_progress
+            elif severity[row] == "resolved":
+                ongoing, opens = False, False
+            else:
+                ongoing, opens = in_progress, False
+            if p > position and ongoing == self._ongoing[row] and opens == self._opens[row]:
+                return
+            self._ongoing[row] = ongoing
+            if opens != self._opens[row]:
+                self._opens[row] = opens
+                self._index_opening(row, opens)
+
+    def _index_opening(self, row: int, opens: bool):
+        timestamp = self.columns["published"][row]
+        for key in self._keys(self.columns["region"][row], self.columns["service"][row]):
+            timestamps, rows = self._openings.setdefault(key, (array("d"), array("l")))
+            if opens:
+                position = bisect.bisect_right(timestamps, timestamp)
+                timestamps.insert(position, timestamp)
+                rows.insert(position, row)
+            else:
+                position = bisect.bisect_left(timestamps, timestamp)
+                while rows[position] != row:
+                    position += 1
+                del timestamps[position]
+                del rows[position]
+
+    # Persistence
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.col")
+
+    def _write(self, rows: list):
+        os.makedirs(self.path, exist_ok=True)
+        for name in TEXT_COLUMNS:
+            with open(self._file(name), "a", encoding="utf-8") as f:
+                f.write("".join(row[name].replace("\n", " ") + "\n" for row in rows))
+        # Timestamps last: a row only counts once every column holds it
+        with open(self._file("published"), "ab") as f:
+            array("d", (row["published"] for row in rows)).tofile(f)
+
+    def _load(self):
+        try:
+            with open(self._file("published"), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        published = array("d")
+        published.frombytes(data[:len(data) - len(data) % published.itemsize])
+
+        text = {}
+        missing = set()
+        for name in TEXT_COLUMNS:
+            try:
+                with open(self._file(name), "r", encoding="utf-8") as f:
+                    text[name] = f.read().splitlines()
+            except FileNotFoundError:
+                text[name] = []
+                missing.add(name)
+        # A crash mid-append (or a deleted column file) can leave columns of
+        # different lengths: keep the rows every column holds, so later
+        # appends stay aligned
+        rows = min(len(published), *(len(values) for values in text.values()))
+        for name, values in text.items():
+            if len(values) > rows or name in missing:
+                with open(self._file(name), "w", encoding="utf-8") as f:
+                    f.write("".join(value + "\n" for value in values[:rows]))
+        if len(data) != rows * published.itemsize:
+            with open(self._file("published"), "r+b") as f:
+                f.truncate(rows * published.itemsize)
+
+        for i in range(rows):
+            row = {name: text[name][i] for name in TEXT_COLUMNS}
+            row["published"] = published[i]
+            if row["guid"] not in self._guids:
+                self._guids.add(row["guid"])
+                self._add(row)
+
+
+# Shared store used by the tool
+incident_store = IncidentStore(
+    os.getenv("INCIDENT_STORE_DIR", os.path.expanduser("~/.devops_agent/incidents"))
+)
+
+
+# Every poll of the shared feed (check_aws_status, the window planner, ...)
+# lands its new items in the store
+feed_processor.subscribe(incident_store.ingest)
+
+
+def refresh_incident_store() -> int:
+    """Poll the AWS status feed; new items are ingested into the store. Returns their count."""
+    count = len(poll_feed())
+    incident_store.last_ingest = time.time()
+    return count
+
+
+@tool
+def get_incident_history(region: str = "", service: str = "", days: int = 90) -> dict:
+    """
+    Get historical AWS incident counts for a region and/or service.
+    Useful as a reliability prior: how often has this region or service had issues?
+
+    Args:
+        region: AWS region code (e.g., "us-east-1"); empty for all regions
+        service: AWS service name as used by the status page (e.g., "ec2", "lambda"); empty for all
+        days: How many days back to look (default: 90)
+
+    Returns:
+        Incident count (each incident once, however many updates it had),
+        breakdown by opening severity and service, and the most recent incidents
+    """
+    refresh_error = None
+    if time.time() - incident_store.last_ingest > INGEST_INTERVAL:
+        try:
+            refresh_incident_store()
+        except (requests.RequestException, ValueError) as e:
+            refresh_error = str(e)
+
+    since = time.time() - days * 86400
+    selection = {"region": region or None, "service": service or None, "since": since}
+    result = {
+        "region": region or "all",
+        "service": service or "all",
+        "days": days,
+        # Incidents are counted once, by the item that opened them; "updates"
+        # counts every feed item, resolutions and informational messages included
+        "incidents": incident_store.count(**selection, openings=True),
+        "updates": incident_store.count(**selection),
+        "by_severity": dict(incident_store.breakdown("severity", **selection, openings=True)),
+        "by_service": dict(incident_store.breakdown("service", **selection, openings=True).most_common(5)),
+        "recent": [
+            {
+                "title": item["title"],
+                "service": item["service"],
+                "region": item["region"],
+                "published": time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime(item["published"])),
+            }
+            for item in incident_store.query(**selection, limit=3, openings=True)
+        ],
+        "history_size": len(incident_store),
+    }
+    if refresh_error:
+        result["warning"] = f"Could not refresh from the AWS feed: {refresh_error}"
+    return result
@@ -0,0 +1,493 @@
+"""
+Custom Tool: Infoblox CSP IPAM
+==============================
+Subnet capacity and free-block checks against the Infoblox CSP DDI API
+(src/ipam), with mock data when IPAM_API_KEY is not set.
+
+check_subnet_capacity and sample_capacity answer from the local subnet
+index once it has loaded, and from filtered, concurrently paged API queries
+until then. Those queries go through the "ipam" circuit breaker
+(breaker.py): while IPAM is failing or slow, the last good totals are
+served, marked stale. find_free_block downloads the allocations of a
+region's emptiest subnets and searches their free-space bitmaps.
+
+Not re-exported from src/tools/__init__.py: import src.tools.ipam_tool
+directly, so agents that do not use IPAM do not load it.
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from strands.tools import tool
+
+try:
+    from ..ipam import (
+        FreeSpaceMap, SubnetIndex, aggregate_utilization, get_client, get_subnet_index, region_filter
+    )
+except ImportError:
+    # Loaded as the top-level "tools" package (python src/agent.py puts src/ on the path)
+    from ipam import (
+        FreeSpaceMap, SubnetIndex, aggregate_utilization, get_client, get_subnet_index, region_filter
+    )
+from .breaker import get_breaker
+
+# Most subnets whose allocations find_free_block downloads per call
+MAX_SUBNETS_INSPECTED = 64
+
+
+def get_mock_subnet_data(region: str) -> dict:
+    """Return mock subnet data for testing."""
+    mock_data = {
+        "us-west-2": {"total": 256, "used": 45, "available": 211},
+        "us-east-1": {"total": 512, "used": 489, "available": 23},  # Almost full!
+        "eu-west-1": {"total": 128, "used": 120, "available": 8},   # Critical!
+        "ap-southeast-1": {"total": 256, "used": 100, "available": 156},
+    }
+    return mock_data.get(region, {"total": 256, "used": 128, "available": 128})
+
+
+def get_mock_allocations(region: str) -> tuple:
+    """Return a mock subnet CIDR and its allocated addresses."""
+    mock = get_mock_subnet_data(region)
+    network = f"10.0.0.0/{32 - (mock['total'].bit_length() - 1)}"
+    # Addresses handed out from the bottom, with some released again (holes);
+    # the network and broadcast addresses count as used
+    holes = min(mock["used"] // 10, mock["available"] - 1)
+    handed_out = list(range(1, mock["used"] - 2 + holes + 1))
+    for offset in random.Random(region).sample(handed_out, holes):
+        handed_out.remove(offset)
+    return network, [f"10.0.{offset // 256}.{offset % 256}" for offset in handed_out]
+
+
+def capacity_verdict(available: int, utilization: float, min_required_ips: int) -> tuple:
+    """Return (recommendation, status) for free IPs, utilization percent and IPs needed."""
+    if available >= min_required_ips and utilization < 80:
+        return "GO", "healthy"
+    elif available >= min_required_ips:
+        return "CAUTION", "warning"
+    return "NO-GO", "critical"
+
+
+@tool
+def check_subnet_capacity(region: str, min_required_ips: int = 10) -> dict:
+    """
+    Check if a subnet has enough available IP addresses for deployment.
+
+    Args:
+        region: The region/subnet identifier to check (e.g., "us-west-2", "prod-vpc-1")
+        min_required_ips: Minimum number of free IPs needed for deployment (default: 10)
+
+    Returns:
+        Dictionary with subnet capacity info and deployment recommendation
+    """
+    client = get_client()
+
+    # Use mock data if no API key (for lab/testing)
+    if client is None:
+        mock = get_mock_subnet_data(region)
+        available = mock["available"]
+        utilization = (mock["used"] / mock["total"] * 100) if mock["total"] > 0 else 0
+        recommendation, status = capacity_verdict(available, utilization, min_required_ips)
+
+        return {
+            "region": region,
+            "status": status,
+            "total_ips": mock["total"],
+            "used_ips": mock["used"],
+            "available_ips": available,
+            "utilization_percent": round(utilization, 1),
+            "min_required": min_required_ips,
+            "recommendation": recommendation,
+            "message": f"{available} IPs available ({utilization:.1f}% utilized)",
+            "source": "mock_data"  # Indicates this is simulated
+        }
+
+    try:
+        index = get_subnet_index()
+        stale = None
+        if index is not None and index.ready:
+            # Answer from the local subnet index (kept in sync in the background)
+            totals = index.summary(index.region(region))
+            source = "ipam_index"
+        else:
+            # Search for subnets by region tag or name. Pages are fetched
+            # concurrently and summed as they arrive; only utilization is pulled.
+            # While IPAM is failing or slow, the last good totals are served stale
+            totals, stale = get_breaker("ipam").call(region, lambda: aggregate_utilization(
+                client.iter_pages("/ipam/subnet", filter=region_filter(region), fields=["utilization"])
+            ))
+            source = "ipam_api"
+
+        if not totals["subnets"]:
+            return {
+                "region": region,
+                "status": "not_found",
+                "message": f"No subnet found for region: {region}",
+                "recommendation": "CAUTION - Subnet not in IPAM"
+            }
+
+        # Aggregate capacity across matching subnets
+        total_ips = totals["total"]
+        used_ips = totals["used"]
+        available_ips = totals["available"]
+
+        utilization_percent = (used_ips / total_ips * 100) if total_ips > 0 else 0
+
+        # Determine recommendation
+        recommendation, status = capacity_verdict(available_ips, utilization_percent, min_required_ips)
+
+        result = {
+            "region": region,
+            "status": status,
+            "total_ips": total_ips,
+            "used_ips": used_ips,
+            "available_ips": available_ips,
+            "utilization_percent": round(utilization_percent, 1),
+            "min_required": min_required_ips,
+            "recommendation": recommendation,
+            "message": f"{available_ips} IPs available ({utilization_percent:.1f}% utilized)",
+            "subnets_matched": totals["subnets"],
+            "source": source
+        }
+        if "utilization_percentiles" in totals:
+            # Spread across subnets: a healthy total can hide full subnets
+            result["subnet_utilization"] = totals["utilization_percentiles"]
+            result["subnets_by_status"] = totals["subnets_by_status"]
+        if stale:
+            result.update(stale)
+        return result
+
+    except requests.exceptions.RequestException as e:
+        return {
+            "region": region,
+            "status": "error",
+            "message": f"IPAM API error: {str(e)}",
+            "recommendation": "CAUTION - Could not verify IP capacity"
+        }
+
+
+@tool
+def find_subnets(address: str = "", tag: str = "", min_required_ips: int = 10) -> dict:
+    """
+    Find IPAM subnets by IP address or tag and report their combined capacity.
+    Answered from the local subnet index, so it is cheap to call repeatedly.
+
+    Args:
+        address: IP address or CIDR (e.g., "10.20.1.17", "10.20.0.0/16"); returns
+            the subnets containing an address, or the subnets inside a CIDR
+        tag: Tag as "key=value" or "key" (e.g., "env=prod")
+        min_required_ips: Minimum number of free IPs needed for deployment (default: 10)
+
+    Returns:
+        Matching subnets (up to 20) with their combined capacity
+    """
+    if not address and not tag:
+        return {"status": "error", "message": "Give an address/CIDR or a tag"}
+    index = get_subnet_index()
+    if index is None:
+        return {"status": "error", "message": "Subnet index needs IPAM_API_KEY"}
+    if not index.ready:
+        return {"status": "loading", "message": "Subnet index is still loading - try check_subnet_capacity"}
+
+    rows = None
+    try:
+        if address:
+            rows = index.within(address) if "/" in address else index.containing(address)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}
+    if tag:
+        key, _, value = tag.partition("=")
+        tagged = index.tag(key.strip(), value.strip() or None)
+        rows = tagged if rows is None else rows & tagged
+
+    totals = index.summary(rows)
+    subnets = sorted(index.subnets(rows), key=lambda s: s["network"])
+    return {
+        "status": "ok" if totals["subnets"] else "not_found",
+        "subnets_matched": totals["subnets"],
+        "total_ips": totals["total"],
+        "used_ips": totals["used"],
+        "available_ips": totals["available"],
+        "enough_ips": totals["available"] >= min_required_ips,
+        "utilization_percentiles": totals["utilization_percentiles"],
+        "subnets_by_status": totals["subnets_by_status"],
+        "by_region": index.group_by("region", rows),
+        "subnets": [
+            {k: subnet[k] for k in ("network", "region", "comment", "tags", "total", "available", "utilization_percent")}
+            for subnet in subnets[:20]
+        ],
+        "index_age_seconds": round(time.time() - index.synced_at),
+    }
+
+
+def parse_requirements(requirements: str, default_min_ips: int = 10) -> dict:
+    """
+    Parse "us-east-1:50, eu-west-1:20, ap-southeast-1" into {region: IPs needed}.
+
+    Regions listed more than once draw on the same subnets, so their needs add up.
+    """
+    needs = {}
+    for item in requirements.split(","):
+        region, _, count = item.strip().partition(":")
+        if not region.strip():
+            continue
+        needs[region.strip()] = needs.get(region.strip(), 0) + (int(count) if count.strip() else default_min_ips)
+    return needs
+
+
+def sample_capacity(regions: list, with_source: bool = False):
+    """
+    Capacity per region ({"subnets", "total", "used", "available"}) from one
+    consistent view of IPAM. With `with_source`, returns (summaries, source).
+
+    While IPAM is failing or slow, the last good summaries are returned with
+    source "ipam_api_stale"; without `with_source` nothing is returned then,
+    so stale readings are never recorded as new samples.
+    """
+    client = get_client()
+    if client is None:
+        summaries = {region: dict(get_mock_subnet_data(region), subnets=1) for region in regions}
+        source = "mock_data"
+    else:
+        index = get_subnet_index()
+        source = "ipam_index"
+        if index is None or not index.ready:
+            def load():
+                # One filtered bulk query for every region instead of one per region
+                loaded = SubnetIndex(client)
+                loaded.load(filter=" or ".join(f"({region_filter(region)})" for region in regions))
+                return loaded.region_summaries(regions)
+
+            summaries, stale = get_breaker("ipam").call(tuple(regions), load)
+            source = "ipam_api_stale" if stale else "ipam_api"
+            if stale and not with_source:
+                summaries = {}
+        else:
+            summaries = index.region_summaries(regions)
+    return (summaries, source) if with_source else summaries
+
+
+@tool
+def plan_subnet_capacity(requirements: str, default_min_ips: int = 10) -> dict:
+    """
+    Check IP capacity for many regions at once, each with its own IP requirement.
+    Use this for rollout plans instead of calling check_subnet_capacity per region.
+
+    Args:
+        requirements: Comma-separated "region:min_required_ips" pairs
+            (e.g., "us-east-1:50, eu-west-1:20, ap-southeast-1"); a region
+            without a count needs default_min_ips
+        default_min_ips: IPs needed by regions listed without a count (default: 10)
+
+    Returns:
+        A verdict matrix (one row per region), counts per verdict, totals and
+        an overall recommendation
+    """
+    try:
+        needs = parse_requirements(requirements, default_min_ips)
+    except ValueError as e:
+        return {"status": "error", "message": f"Could not parse requirements: {str(e)}"}
+    if not needs:
+        return {"status": "error", "message": "No regions given"}
+
+    try:
+        summaries, source = sample_capacity(list(needs), with_source=True)
+    except requests.exceptions.RequestException as e:
+        return {
+            "status": "error",
+            "message": f"IPAM API error: {str(e)}",
+            "recommendation": "CAUTION - Could not verify IP capacity"
+        }
+
+    rows = []
+    verdicts = {"GO": 0, "CAUTION": 0, "NO-GO": 0, "NOT-FOUND": 0}
+    for region, needed in needs.items():
+        totals = summaries[region]
+        if not totals["subnets"]:
+            verdict, utilization = "NOT-FOUND", None
+        else:
+            utilization = (totals["used"] / totals["total"] * 100) if totals["total"] > 0 else 0
+            verdict, _ = capacity_verdict(totals["available"], utilization, needed)
+            utilization = round(utilization, 1)
+        verdicts[verdict] += 1
+        rows.append([region, needed, totals["available"], utilization, totals["subnets"], verdict])
+
+    if verdicts["NO-GO"]:
+        recommendation = "NO-GO"
+    elif verdicts["CAUTION"] or verdicts["NOT-FOUND"]:
+        recommendation = "CAUTION"
+    else:
+        recommendation = "GO"
+    blocked = [row[0] for row in rows if row[-1] in ("NO-GO", "NOT-FOUND")]
+
+    return {
+        "recommendation": recommendation,
+        "columns": ["region", "required_ips", "available_ips", "utilization_percent", "subnets", "verdict"],
+        "matrix": rows,
+        "verdicts": {name: count for name, count in verdicts.items() if count},
+        "total_required_ips": sum(needs.values()),
+        "total_available_ips": sum(summaries[region]["available"] for region in needs),
+        "blocked_regions": blocked,
+        "source": source,
+    }
+
+
+def _free_space(client, subnet: dict, prefix_length: int):
+    """
+    Download a subnet's allocations and look for a free block in its bitmap.
+    None for a subnet too large for a bitmap (nothing is downloaded then).
+    """
+    try:
+        free_map = FreeSpaceMap(subnet["network"], client.iter_addresses(subnet["id"]))
+    except ValueError:
+        return None
+    return _describe_free_space(free_map, prefix_length)
+
+
+def _describe_free_space(free_map: FreeSpaceMap, prefix_length: int) -> dict:
+    largest = free_map.free_blocks(limit=1)
+    region = free_map.fit_region(prefix_length)
+    return {
+        "subnet": str(free_map.network),
+        "free_ips": free_map.free_count(),
+        "largest_free_block": str(largest[0]) if largest else None,
+        "free_blocks_of_requested_size": free_map.count_blocks(prefix_length),
+        "best_fit": str(free_map.best_fit(prefix_length)) if region else None,
+        # The free run the block would be carved from; smaller is a tighter fit
+        "fit_region": str(region) if region else None,
+    }
+
+
+def _fit_size(candidate: dict) -> int:
+    """Addresses in a candidate's fit region (sort key: tightest fit first)."""
+    return 2 ** (32 - int(candidate["fit_region"].split("/")[1]))
+
+
+def _block_too_large(region: str, prefix_length: int, networks: list):
+    """An error result when a /prefix_length is larger than every subnet in `networks`."""
+    largest = min((int(network.split("/")[1]) for network in networks), default=None)
+    if largest is None or prefix_length >= largest:
+        return None
+    return {
+        "region": region,
+        "status": "error",
+        "message": (f"A /{prefix_length} is larger than every subnet in {region} "
+                    f"(largest: /{largest}); ask for a /{largest} or smaller block"),
+        "recommendation": "NO-GO",
+    }
+
+
+@tool
+def find_free_block(region: str, prefix_length: int = 26) -> dict:
+    """
+    Find a contiguous, aligned free block (e.g. a /26) in a region's subnets.
+    Use this when a deployment needs a CIDR range rather than scattered IPs:
+    free addresses may be fragmented even when check_subnet_capacity says GO.
+
+    Args:
+        region: The region/subnet identifier to check (e.g., "us-west-2")
+        prefix_length: Prefix length of the block needed (e.g., 26 for 64 addresses)
+
+    Returns:
+        The best-fit free block, and per subnet the free IPs, the largest free
+        block and how many blocks of the requested size fit
+    """
+    if not 1 <= prefix_length <= 32:
+        return {
+            "region": region,
+            "status": "error",
+            "message": f"prefix_length must be between 1 and 32 (IPv4), got {prefix_length}",
+        }
+    block_size = 2 ** (32 - prefix_length)
+    client = get_client()
+    skipped = []
+
+    if client is None:
+        network, allocated = get_mock_allocations(region)
+        error = _block_too_large(region, prefix_length, [network])
+        if error:
+            return error
+        candidates = [_describe_free_space(FreeSpaceMap(network, allocated), prefix_length)]
+        source = "mock_data"
+    else:
+        index = get_subnet_index()
+        try:
+            if index is not None and index.ready:
+                subnets = index.subnets(index.region(region))
+            else:
+                subnets = [
+                    {
+                        "id": subnet["id"],
+                        "network": f"{subnet['address']}/{subnet['cidr']}",
+                        "available": aggregate_utilization([[subnet]])["available"],
+                    }
+                    for subnet in client.iter_subnets(
+                        filter=region_filter(region), fields=["id", "address", "cidr", "utilization"]
+                    )
+                ]
+            error = _block_too_large(region, prefix_length, [s["network"] for s in subnets])
+            if error:
+                return error
+            # Only subnets that could hold the block; emptiest first, as they
+            # are the likeliest to have it in one piece
+            subnets = sorted(
+                (s for s in subnets
+                 if int(s["network"].split("/")[1]) <= prefix_length and s["available"] >= block_size),
+                key=lambda s: s["available"],
+                reverse=True,
+            )[:MAX_SUBNETS_INSPECTED]
+            # Download allocations a batch at a time; stop early only on an
+            # exact fit, since a later subnet may hold a tighter one
+            candidates = []
+            batch = 2 * client.max_workers
+            with ThreadPoolExecutor(max_workers=client.max_workers) as pool:
+                for start in range(0, len(subnets), batch):
+                    chunk = subnets[start:start + batch]
+                    found = pool.map(lambda s: _free_space(client, s, prefix_length), chunk)
+                    for subnet, free_space in zip(chunk, found):
+                        if free_space is None:
+                            skipped.append(subnet["network"])
+                        else:
+                            candidates.append(free_space)
+                    if any(c["fit_region"] == c["best_fit"] for c in candidates if c["best_fit"]):
+                        break
+        except (requests.exceptions.RequestException, ValueError) as e:
+            return {
+                "region": region,
+                "status": "error",
+                "message": f"IPAM API error: {str(e)}",
+                "recommendation": "CAUTION - Could not verify free blocks"
+            }
+        source = "ipam_api"
+
+    # Best fit across subnets: the smallest free run that holds the block,
+    # so larger runs stay whole for later requests
+    fits = sorted((c for c in candidates if c["best_fit"]), key=_fit_size)
+    result = {
+        "region": region,
+        "prefix_length": prefix_length,
+        "block_size": block_size,
+        "subnets_inspected": len(candidates),
+        "candidates": (fits + [c for c in candidates if not c["best_fit"]])[:10],
+        "source": source,
+    }
+    if skipped:
+        # Larger than a /12: too big for a free-space bitmap
+        result["subnets_skipped"] = skipped[:10]
+    if fits:
+        result.update(
+            status="available",
+            block=fits[0]["best_fit"],
+            recommendation="GO",
+            message=f"Free /{prefix_length} at {fits[0]['best_fit']}",
+        )
+    else:
+        result.update(
+            status="fragmented" if any(c["free_ips"] >= block_size for c in candidates) else "exhausted",
+            block=None,
+            recommendation="NO-GO",
+            message=f"No contiguous /{prefix_length} free in {region}",
+        )
+    return result
@@ -0,0 +1,101 @@
+"""
+AWS Region Catalog
+==================
+Built-in geography of AWS regions, so tools can take a region code and
+know where its datacenters are without asking the model (or a weather API)
+to guess.
+
+Loaded once at import into a dict of immutable Region tuples; lookups are a
+single dictionary access. Region codes that are well-formed but not in the
+catalog yet (regions launched since) still resolve, to a Region with a
+generic name and no location.
+"""
+
+import re
+from typing import NamedTuple
+
+
+class Region(NamedTuple):
+    code: str
+    name: str
+    metro: str
+    latitude: float
+    longitude: float
+    partition: str
+    az_count: int
+
+    @property
+    def coordinates(self):
+        """"lat,lon" as accepted by wttr.in, or None when the location is not known."""
+        if self.latitude is None:
+            return None
+        return f"{self.latitude},{self.longitude}"
+
+
+# code, name, metro, latitude, longitude, partition, AZs
+_REGION_ROWS = (
+    ("us-east-1", "US East (N. Virginia)", "Ashburn", 39.04, -77.49, "aws", 6),
+    ("us-east-2", "US East (Ohio)", "Columbus", 39.96, -83.00, "aws", 3),
+    ("us-west-1", "US West (N. California)", "San Jose", 37.34, -121.89, "aws", 3),
+    ("us-west-2", "US West (Oregon)", "Boardman", 45.84, -119.70, "aws", 4),
+    ("ca-central-1", "Canada (Central)", "Montreal", 45.50, -73.57, "aws", 3),
+    ("ca-west-1", "Canada West (Calgary)", "Calgary", 51.05, -114.07, "aws", 3),
+    ("mx-central-1", "Mexico (Central)", "Queretaro", 20.59, -100.39, "aws", 3),
+    ("sa-east-1", "South America (Sao Paulo)", "Sao Paulo", -23.55, -46.63, "aws", 3),
+    ("eu-west-1", "Europe (Ireland)", "Dublin", 53.35, -6.26, "aws", 3),
+    ("eu-west-2", "Europe (London)", "London", 51.51, -0.13, "aws", 3),
+    ("eu-west-3", "Europe (Paris)", "Paris", 48.86, 2.35, "aws", 3),
+    ("eu-central-1", "Europe (Frankfurt)", "Frankfurt", 50.11, 8.68, "aws", 3),
+    ("eu-central-2", "Europe (Zurich)", "Zurich", 47.37, 8.54, "aws", 3),
+    ("eu-north-1", "Europe (Stockholm)", "Stockholm", 59.33, 18.07, "aws", 3),
+    ("eu-south-1", "Europe (Milan)", "Milan", 45.46, 9.19, "aws", 3),
+    ("eu-south-2", "Europe (Spain)", "Zaragoza", 41.65, -0.88, "aws", 3),
+    ("il-central-1", "Israel (Tel Aviv)", "Tel Aviv", 32.09, 34.78, "aws", 3),
+    ("me-south-1", "Middle East (Bahrain)", "Manama", 26.23, 50.59, "aws", 3),
+    ("me-central-1", "Middle East (UAE)", "Dubai", 25.20, 55.27, "aws", 3),
+    ("af-south-1", "Africa (Cape Town)", "Cape Town", -33.92, 18.42, "aws", 3),
+    ("ap-east-1", "Asia Pacific (Hong Kong)", "Hong Kong", 22.32, 114.17, "aws", 3),
+    ("ap-south-1", "Asia Pacific (Mumbai)", "Mumbai", 19.08, 72.88, "aws", 3),
+    ("ap-south-2", "Asia Pacific (Hyderabad)", "Hyderabad", 17.39, 78.49, "aws", 3),
+    ("ap-southeast-1", "Asia Pacific (Singapore)", "Singapore", 1.35, 103.82, "aws", 3),
+    ("ap-southeast-2", "Asia Pacific (Sydney)", "Sydney", -33.87, 151.21, "aws", 3),
+    ("ap-southeast-3", "Asia Pacific (Jakarta)", "Jakarta", -6.21, 106.85, "aws", 3),
+    ("ap-southeast-4", "Asia Pacific (Melbourne)", "Melbourne", -37.81, 144.96, "aws", 3),
+    ("ap-southeast-5", "Asia Pacific (Malaysia)", "Kuala Lumpur", 3.14, 101.69, "aws", 3),
+    ("ap-southeast-7", "Asia Pacific (Thailand)", "Bangkok", 13.76, 100.50, "aws", 3),
+    ("ap-northeast-1", "Asia Pacific (Tokyo)", "Tokyo", 35.68, 139.69, "aws", 4),
+    ("ap-northeast-2", "Asia Pacific (Seoul)", "Seoul", 37.57, 126.98, "aws", 4),
+    ("ap-northeast-3", "Asia Pacific (Osaka)", "Osaka", 34.69, 135.50, "aws", 3),
+    ("cn-north-1", "China (Beijing)", "Beijing", 39.90, 116.40, "aws-cn", 3),
+    ("cn-northwest-1", "China (Ningxia)", "Zhongwei", 37.51, 105.19, "aws-cn", 3),
+    ("us-gov-east-1", "AWS GovCloud (US-East)", "Columbus", 39.96, -83.00, "aws-us-gov", 3),
+    ("us-gov-west-1", "AWS GovCloud (US-West)", "Portland", 45.52, -122.68, "aws-us-gov", 3),
+)
+
+REGIONS = {row[0]: Region(*row) for row in _REGION_ROWS}
+
+# Any AWS region code: "ap-east-2", "us-gov-west-1", "eu-central-3", ...
+REGION_CODE = re.compile(r"^[a-z]{2}(-[a-z]+)+-\d$")
+
+
+def _partition(code: str) -> str:
+    if code.startswith("cn-"):
+        return "aws-cn"
+    if code.startswith("us-gov-"):
+        return "aws-us-gov"
+    return "aws"
+
+
+def get_region(code: str):
+    """
+    Return the Region for a region code (case-insensitive), or None if it is
+    not a region code.
+
+    Codes missing from the catalog get a Region named "AWS region <code>"
+    whose metro, coordinates and AZ count are None.
+    """
+    code = code.strip().lower()
+    region = REGIONS.get(code)
+    if region is None and REGION_CODE.match(code):
+        region = Region(code, f"AWS region {code}", None, None, None, _partition(code), None)
+    return region
@@ -2,39 +2,257 @@
 Custom Tool: Weather Forecast
 =============================
 Uses the free wttr.in API - no API key required!
+
+wttr.in's j1 payload carries three days of forecasts in 3-hour slots.
+get_weather_risk scores every slot that overlaps a deployment window in one
+pass over column arrays and returns a compact summary plus the worst slot.
+
+Requests go through the wttr.in circuit breaker (breaker.py): while wttr.in
+is failing or slow, the last good forecast for a location is returned at
+once, marked stale. wttr.in has a long latency tail; with HEDGE_UPSTREAMS
+including "wttr.in", late requests are hedged (hedge.py).
 """
 
+from array import array
+from datetime import datetime, timedelta
+
 import requests
 from strands.tools import tool
 
+from .breaker import get_breaker
+from .hedge import get_hedger
+from .regions import get_region
+
+# wttr.in (WorldWeatherOnline) weather codes
+# Thunderstorms and blizzards: stop deployments
+STORM_CODES = frozenset({200, 227, 230, 386, 389, 392, 395})
+# Heavy rain or snow, freezing rain, ice pellets
+HEAVY_CODES = frozenset({281, 284, 305, 308, 311, 314, 332, 335, 338, 350, 356, 359, 371, 374, 377})
+
+RISK_LEVELS = ("low", "medium", "high", "severe")
+
+
+def _resolve(city: str) -> tuple:
+    """
+    Return (region or None, wttr.in location) for a city name or region code.
+    The location is None for a region whose datacenters are not in the catalog.
+    """
+    # Region codes map to datacenter coordinates; anything else goes to wttr.in as-is
+    region = get_region(city)
+    return region, (region.coordinates if region else city)
+
+
+def _no_location(region) -> str:
+    return f"No datacenter location known for {region.code}; ask with the nearest city instead"
+
+
+def fetch_forecast(location: str) -> dict:
+    """Raw wttr.in j1 payload for a location."""
+    # wttr.in is a free weather API - no key needed
+    response = requests.get(
+        f"https://wttr.in/{location}?format=j1",
+        timeout=10,
+        headers={"User-Agent": "DevOpsAgent/1.0"}
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def load_forecast(location: str) -> tuple:
+    """(payload, stale) for a location, through the wttr.in circuit breaker (and hedger, when enabled)."""
+    return get_breaker("wttr.in").call(location, get_hedger("wttr.in").call, fetch_forecast, location)
+
+
+def _local_now(data: dict) -> datetime:
+    """Observation time at the location (forecast slots are in local time)."""
+    observed = data.get("current_condition", [{}])[0].get("localObsDateTime")
+    if observed:
+        try:
+            return datetime.strptime(observed, "%Y-%m-%d %I:%M %p")
+        except ValueError:
+            pass
+    return datetime.strptime(data["weather"][0]["date"], "%Y-%m-%d")
+
+
+def utc_offset(data: dict) -> timedelta:
+    """Local time minus UTC at the location, from the observation timestamps."""
+    current = data.get("current_condition", [{}])[0]
+    try:
+        utc_time = datetime.strptime(current["observation_time"], "%I:%M %p").time()
+    except (KeyError, ValueError):
+        return timedelta(0)
+    local = _local_now(data)
+    offset = local - datetime.combine(local.date(), utc_time)
+    # Observation dates differ across midnight: bring into -12h..+14h
+    if offset > timedelta(hours=14):
+        offset -= timedelta(days=1)
+    elif offset < timedelta(hours=-12):
+        offset += timedelta(days=1)
+    # Offsets are whole quarter hours
+    return timedelta(minutes=15 * round(offset.total_seconds() / 900))
+
+
+def hourly_columns(data: dict) -> dict:
+    """
+    Flatten a j1 payload's hourly forecasts into parallel columns.
+
+    Returns:
+        Dict with "hours" (slot length), lists "start" and "condition", and
+        array columns "wind", "gust", "precip", "thunder" and "code"
+    """
+    columns = {
+        "start": [],
+        "condition": [],
+        "wind": array("i"),
+        "gust": array("i"),
+        "precip": array("f"),
+        "thunder": array("i"),
+        "code": array("i"),
+    }
+    hours = 3
+    for day in data.get("weather", []):
+        date = datetime.strptime(day["date"], "%Y-%m-%d")
+        hourly = day.get("hourly", [])
+        hours = 24 // len(hourly) if hourly else hours
+        for slot in hourly:
+            columns["start"].append(date + timedelta(hours=int(slot["time"]) // 100))
+            columns["condition"].append(slot.get("weatherDesc", [{}])[0].get("value"))
+            columns["wind"].append(int(slot.get("windspeedKmph") or 0))
+            columns["gust"].append(int(slot.get("WindGustKmph") or 0))
+            columns["precip"].append(float(slot.get("precipMM") or 0))
+            columns["thunder"].append(int(slot.get("chanceofthunder") or 0))
+            columns["code"].append(int(slot.get("weatherCode") or 0))
+    columns["hours"] = hours
+    return columns
+
+
+def score_slots(columns: dict) -> list:
+    """
+    Risk score per slot: 0 low, 1 medium, 2 high, 3 severe.
+
+    Each factor is scored column-wise and a slot takes its worst factor.
+    """
+    wind = [
+        3 if w >= 90 else 2 if w >= 60 else 1 if w >= 40 else 0
+        for w in map(max, columns["wind"], columns["gust"])
+    ]
+    precip = [2 if p >= 7.5 else 1 if p >= 2.5 else 0 for p in columns["precip"]]
+    thunder = [2 if t >= 50 else 1 if t >= 20 else 0 for t in columns["thunder"]]
+    code = [3 if c in STORM_CODES else 2 if c in HEAVY_CODES else 0 for c in columns["code"]]
+    return list(map(max, wind, precip, thunder, code))
+
+
+def _slot_reasons(columns: dict, i: int) -> list:
+    reasons = []
+    gust = max(columns["wind"][i], columns["gust"][i])
+    if columns["code"][i] in STORM_CODES or columns["code"][i] in HEAVY_CODES:
+        reasons.append(f"severe conditions: {columns['condition'][i]}")
+    if gust >= 40:
+        reasons.append(f"wind gusts {gust} km/h")
+    if columns["precip"][i] >= 2.5:
+        reasons.append(f"{columns['precip'][i]:.1f} mm precipitation")
+    if columns["thunder"][i] >= 20:
+        reasons.append(f"{columns['thunder'][i]}% chance of thunder")
+    return reasons
+
+
+def _select(columns: dict, indexes: list) -> dict:
+    """Columns restricted to the given slot indexes."""
+    selected = {"hours": columns["hours"]}
+    for name, column in columns.items():
+        if isinstance(column, array):
+            selected[name] = array(column.typecode, (column[i] for i in indexes))
+        elif isinstance(column, list):
+            selected[name] = [column[i] for i in indexes]
+    return selected
+
+
+def score_forecast_window(data: dict, window_hours: int = 3, start_in_hours: int = 0) -> dict:
+    """
+    Score every forecast slot overlapping a window starting `start_in_hours` from now.
+
+    Returns:
+        Compact summary: overall risk, per-factor maxima, and the worst slot
+    """
+    columns = hourly_columns(data)
+    start = _local_now(data) + timedelta(hours=start_in_hours)
+    end = start + timedelta(hours=window_hours)
+    slot_length = timedelta(hours=columns["hours"])
+
+    window = _select(columns, [
+        i for i, slot_start in enumerate(columns["start"])
+        if slot_start < end and slot_start + slot_length > start
+    ])
+    if not window["start"]:
+        return {"risk": "unknown", "reasons": ["window is outside the 3-day forecast"]}
+
+    scores = score_slots(window)
+    worst = max(range(len(scores)), key=scores.__getitem__)
+
+    return {
+        "risk": RISK_LEVELS[scores[worst]],
+        "window_start": start.strftime("%Y-%m-%d %H:%M"),
+        "window_end": end.strftime("%Y-%m-%d %H:%M"),
+        "slots_scored": len(scores),
+        "risky_slots": sum(1 for score in scores if score >= 2),
+        "max_wind_kmph": max(window["wind"]),
+        "max_gust_kmph": max(window["gust"]),
+        "total_precip_mm": round(sum(window["precip"]), 1),
+        "max_thunder_chance": max(window["thunder"]),
+        "worst_slot": {
+            "start": window["start"][worst].strftime("%Y-%m-%d %H:%M"),
+            "risk": RISK_LEVELS[scores[worst]],
+            "condition": window["condition"][worst],
+            "reasons": _slot_reasons(window, worst),
+        },
+    }
+
+
+def forecast_window_risk(city: str, window_hours: int = 3, start_in_hours: int = 0) -> dict:
+    """Fetch the forecast for a city or region code and score a window (see get_weather_risk)."""
+    region, location = _resolve(city)
+    if location is None:
+        return {"risk": "unknown", "region": region.code, "error": _no_location(region)}
+    try:
+        data, stale = load_forecast(location)
+        result = score_forecast_window(data, window_hours, start_in_hours)
+    except requests.RequestException as e:
+        return {"risk": "unknown", "error": f"Failed to fetch weather: {str(e)}"}
+    except (KeyError, IndexError, ValueError) as e:
+        return {"risk": "unknown", "error": f"Failed to parse weather data: {str(e)}"}
+    result["city"] = region.metro if region else city
+    if region:
+        result["region"] = region.code
+    if stale:
+        result.update(stale)
+    return result
+
 
 @tool
 def get_weather_forecast(city: str) -> dict:
     """
-    Get current weather and forecast for a city.
+    Get current weather and forecast for a city or an AWS region.
     Useful for deployment decisions - severe weather can affect datacenters.
 
     Args:
-        city: City name (e.g., "London", "New York", "us-east-1")
+        city: City name or AWS region code (e.g., "London", "New York", "us-east-1").
+            Region codes are resolved to the region's datacenter location.
 
     Returns:
         Weather data including temperature, conditions, and forecast
     """
+    region, location = _resolve(city)
+    if location is None:
+        return {"region": region.code, "region_name": region.name, "error": _no_location(region)}
+
     try:
-        # wttr.in is a free weather API - no key needed
-        response = requests.get(
-            f"https://wttr.in/{city}?format=j1",
-            timeout=10,
-            headers={"User-Agent": "DevOpsAgent/1.0"}
-        )
-        response.raise_for_status()
-        data = response.json()
+        data, stale = load_forecast(location)
 
         # Extract relevant info
         current = data.get("current_condition", [{}])[0]
 
-        return {
-            "city": city,
+        result = {
+            "city": region.metro if region else city,
             "temperature_c": current.get("temp_C"),
             "temperature_f": current.get("temp_F"),
             "condition": current.get("weatherDesc", [{}])[0].get("value"),
@@ -43,7 +261,32 @@ def get_weather_forecast(city: str) -> dict:
             "visibility_km": current.get("visibility"),
             "uv_index": current.get("uvIndex"),
         }
+        if region:
+            result["region"] = region.code
+            result["region_name"] = region.name
+        if stale:
+            result.update(stale)
+        return result
     except requests.RequestException as e:
         return {"error": f"Failed to fetch weather: {str(e)}"}
     except (KeyError, IndexError) as e:
         return {"error": f"Failed to parse weather data: {str(e)}"}
+
+
+@tool
+def get_weather_risk(city: str, window_hours: int = 3, start_in_hours: int = 0) -> dict:
+    """
+    Assess weather risk for a deployment window using the hourly forecast.
+    Scores wind and gusts, precipitation, thunder probability and storm
+    conditions for every forecast slot in the window.
+
+    Args:
+        city: City name or AWS region code (e.g., "us-east-1", "Dublin")
+        window_hours: Length of the deployment window in hours (default: 3)
+        start_in_hours: Hours from now until the window starts (default: 0, up to ~60)
+
+    Returns:
+        Overall risk (low / medium / high / severe), maxima over the window,
+        and the worst forecast slot with the reasons for its score
+    """
+    return forecast_window_risk(city, window_hours, start_in_hours)
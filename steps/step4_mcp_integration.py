@@ -17,6 +17,7 @@ from mcp import stdio_client, StdioServerParameters
 from strands import Agent
 from strands.tools.mcp import MCPClient
 from src.config import get_model
+from src.mcp_clients import stdio_server_key, tool_catalog
 from src.tools.weather_tool import get_weather_forecast
 from src.tools.aws_status_tool import check_aws_status
 
@@ -34,8 +35,10 @@ def main():
 
     # Use context manager to ensure proper connection lifecycle
     with fetch_mcp:
-        # Get MCP tools
-        mcp_tools = fetch_mcp.list_tools_sync()
+        # Get MCP tools (served from the tool catalog when cached)
+        mcp_tools = tool_catalog.get_tools(
+            fetch_mcp, stdio_server_key("uvx", ["mcp-server-fetch"])
+        )
 
         # Combine custom tools with MCP tools
         all_tools = [get_weather_forecast, check_aws_status] + mcp_tools